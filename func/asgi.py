@@ -0,0 +1,134 @@
+from http import HTTPStatus
+from json import dumps
+from typing import Callable, Dict, Iterable, Tuple
+
+from etria_logger import Gladsheim
+
+from func.main import update_user_data
+from func.src.infrastructures.http.infrastructure import HttpInfrastructure
+from func.src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from func.src.infrastructures.oracle.infrastrucuture import OracleInfrastructure
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.services.enumerate_snapshot import EnumerateSnapshotService
+from func.src.services.outbox_relay import OutboxRelayService
+from func.src.services.warm_up import WarmUpService
+from func.src.transports.audit.publisher import AuditPublisher
+
+update_user_data_methods = {"GET", "POST", "PUT", "HEAD", "OPTIONS", "DELETE"}
+
+
+async def startup():
+    # fails the startup on missing or invalid settings instead of the first request
+    SettingsInfrastructure.get_settings()
+    # /specialize awaits the same warm-up and reports its timings
+    WarmUpService.start()
+    OutboxRelayService.start()
+
+
+async def shutdown():
+    await WarmUpService.stop()
+    await OutboxRelayService.stop()
+    await AuditPublisher.close()
+    await EnumerateSnapshotService.stop_refresh()
+    await HttpInfrastructure.close_client()
+
+
+def _get_headers(scope: dict) -> Dict[str, str]:
+    headers = {
+        name.decode("latin-1").lower(): value.decode("latin-1")
+        for name, value in scope.get("headers", ())
+    }
+    return headers
+
+
+async def _read_body(receive: Callable) -> bytes:
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+async def _send_response(
+    send: Callable,
+    status: int,
+    body: bytes = b"",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                *headers,
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive: Callable, send: Callable):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                await startup()
+            except Exception as ex:
+                Gladsheim.error(error=ex, message="asgi::lifespan::Startup failed")
+                await send({"type": "lifespan.startup.failed", "message": str(ex)})
+                return
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope: dict, receive: Callable, send: Callable):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    path, method = scope["path"], scope["method"]
+    if path in ("/specialize", "/v2/specialize") and method == "POST":
+        report = await WarmUpService.warm_up()
+        await _send_response(
+            send,
+            HTTPStatus.OK,
+            dumps(report).encode(),
+            headers=((b"content-type", b"application/json"),),
+        )
+    elif path == "/healthz" and method == "GET":
+        await _send_response(send, HTTPStatus.OK)
+    elif path == "/stats" and method == "GET":
+        stats = {
+            "mongo": MongoDBInfrastructure.get_pool_stats(),
+            "oracle": OracleInfrastructure.get_pool_stats(),
+        }
+        await _send_response(
+            send,
+            HTTPStatus.OK,
+            dumps(stats).encode(),
+            headers=((b"content-type", b"application/json"),),
+        )
+    elif path == "/" and method in update_user_data_methods:
+        body = await _read_body(receive)
+        status, headers, response_body = await update_user_data(
+            headers=_get_headers(scope), body=body
+        )
+        await _send_response(
+            send,
+            status,
+            response_body,
+            headers=(
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ),
+        )
+    else:
+        await _send_response(send, HTTPStatus.NOT_FOUND)
@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import json
+from collections import Counter
+from time import perf_counter
+from typing import Mapping
+
+from func.asgi import shutdown, startup
+from func.main import update_user_data
+
+
+class RequestBenchmark:
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        body: bytes,
+        requests: int = 1000,
+        concurrency: int = 50,
+    ):
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self.body = body
+        self.requests = requests
+        self.concurrency = concurrency
+        self.latencies = []
+        self.statuses = Counter()
+
+    async def _run_request(self, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            started_at = perf_counter()
+            status, _, _ = await update_user_data(headers=self.headers, body=self.body)
+            self.latencies.append(perf_counter() - started_at)
+            self.statuses[int(status)] += 1
+
+    @staticmethod
+    def _get_percentile(latencies: list, percentile: float) -> float:
+        index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        return latencies[index]
+
+    async def run(self) -> dict:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started_at = perf_counter()
+        await asyncio.gather(
+            *(self._run_request(semaphore) for _ in range(self.requests))
+        )
+        elapsed = perf_counter() - started_at
+        latencies = sorted(self.latencies)
+        report = {
+            "requests": self.requests,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(elapsed, 4),
+            "requests_per_second": round(self.requests / elapsed, 2),
+            "latency_ms": {
+                f"p{percentile}": round(
+                    self._get_percentile(latencies, percentile) * 1000, 3
+                )
+                for percentile in (50, 90, 99)
+            },
+            "statuses": dict(self.statuses),
+        }
+        return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Drive update_user_data in-process, without HTTP overhead."
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--header",
+        action="append",
+        default=[],
+        metavar="NAME:VALUE",
+        help="Request header, may be given more than once.",
+    )
+    parser.add_argument(
+        "--body-file", help="File with the JSON payload sent on every request."
+    )
+    return parser.parse_args()
+
+
+async def _main():
+    args = _parse_args()
+    headers = dict(header.split(":", 1) for header in args.header)
+    headers = {name.strip(): value.strip() for name, value in headers.items()}
+    body = b"{}"
+    if args.body_file:
+        with open(args.body_file, "rb") as body_file:
+            body = body_file.read()
+    benchmark = RequestBenchmark(
+        headers=headers,
+        body=body,
+        requests=args.requests,
+        concurrency=args.concurrency,
+    )
+    await startup()
+    try:
+        report = await benchmark.run()
+    finally:
+        await shutdown()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,61 @@
+import asyncio
+from threading import Lock, Thread
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask, Response, request
+
+from func.main import update_user_data
+
+
+class LongLivedLoopFlask(Flask):
+    # the http client, the audit publisher and the oracle pool are bound to the
+    # loop that created them, so every async view must run on the same loop
+    loop = None
+    loop_lock = Lock()
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls.loop_lock:
+            if cls.loop is None:
+                cls.loop = asyncio.new_event_loop()
+                Thread(target=cls.loop.run_forever, daemon=True).start()
+        return cls.loop
+
+    def async_to_sync(self, func):
+        def run_on_loop(*args, **kwargs):
+            future = asyncio.run_coroutine_threadsafe(
+                func(*args, **kwargs), self.get_loop()
+            )
+            return future.result()
+
+        return run_on_loop
+
+
+app = LongLivedLoopFlask(__name__)
+
+
+@app.route("/specialize", methods=["POST"])
+async def load():
+    return ""
+
+
+@app.route("/v2/specialize", methods=["POST"])
+async def loadv2():
+    return ""
+
+
+@app.route("/healthz", methods=["GET"])
+async def healthz():
+    return "", 200
+
+
+@app.route("/", methods=["GET", "POST", "PUT", "HEAD", "OPTIONS", "DELETE"])
+async def f():
+    headers = {name.lower(): value for name, value in request.headers.items()}
+    status, response_headers, body = await update_user_data(
+        headers=headers, body=request.get_data()
+    )
+    return Response(body, status=status, headers=response_headers)
+
+
+asgi_app = WsgiToAsgi(app)
@@ -1,79 +1,82 @@
 import asyncio
-from http import HTTPStatus
+from json import loads
+from typing import List, Mapping, Tuple
 
-import flask
-from decouple import config
 from etria_logger import Gladsheim
 
 from func.src.domain.thebes_answer.model import ThebesAnswer
-from func.src.domain.enums.code import InternalCode
-from func.src.domain.exceptions.exceptions import (
-    ErrorOnDecodeJwt,
-    UserUniqueIdNotExists,
-    ErrorOnSendAuditLog,
-    ErrorToUpdateUser,
-    InvalidNationality,
-    InvalidCity,
-    InvalidState,
-    InvalidEmail,
-    InvalidActivity,
-    InvalidMaritalStatus,
-    InvalidCountryAcronym,
-    ErrorOnGetUniqueId,
-    HighRiskActivityNotAllowed,
-    OnboardingStepsStatusCodeNotOk,
-    InvalidOnboardingCurrentStep,
-    FinancialCapacityNotValid,
-    ErrorOnGetAccountBrIsBlocked,
-    BrAccountIsBlocked,
-    InconsistentUserData,
-    DeviceInfoRequestFailed,
-    DeviceInfoNotSupplied,
-    LivenessRejected,
-    ErrorInLiveness, InvalidApiKey,
-)
-from func.src.domain.response.model import ResponseModel
+from func.src.domain.exceptions.exceptions import ErrorOnDecodeJwt, InvalidApiKey
+from func.src.domain.response.registry import ResponseRegistry
 from func.src.domain.user_review.validator import UserUpdateData
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.services.concurrency import ConcurrencyService
 from func.src.services.jwt import JwtService
 from func.src.services.liveness import LivenessService
 from func.src.services.user_enumerate_data import UserEnumerateService
+from func.src.services.user_loader import UserDocumentLoader
 from func.src.services.user_review import UserReviewDataService
 from func.src.transports.device_info.transport import DeviceSecurity
 
 
-async def _update_user_update_data_legacy(jwt: str):
-    encoded_device_info = flask.request.headers.get("x-device-info")
-    raw_payload = flask.request.json
+async def _update_user_update_data_legacy(
+    jwt: str, headers: Mapping[str, str], body: bytes
+):
+    encoded_device_info = headers.get("x-device-info")
+    raw_payload = loads(body)
 
-    payload_validated = UserUpdateData(**raw_payload)
-    jwt_data = await JwtService.decode_jwt(jwt=jwt)
-    thebes_answer = ThebesAnswer(jwt_data=jwt_data)
-    device_info = await DeviceSecurity.get_device_info(encoded_device_info)
-    validations = (
-        LivenessService.validate(
-            thebes_answer.unique_id,
-            payload_validated,
-        ),
-        UserEnumerateService(
-            payload_validated=payload_validated, unique_id=thebes_answer.unique_id
-        ).validate_enumerate_params(),
-        UserReviewDataService.check_if_able_to_update(
-            payload_validated, thebes_answer, jwt
-        ),
-    )
-    await asyncio.gather(*validations)
-
-    await UserReviewDataService.update_user_data(
-        unique_id=thebes_answer.unique_id,
-        payload_validated=payload_validated.dict(),
-        device_info=device_info,
+    device_info_task = asyncio.ensure_future(
+        DeviceSecurity.get_device_info(encoded_device_info)
     )
-
-
-async def _append_user_risk_validation(api_key: str):
-    if config("API_KEY") != api_key:
+    jwt_task = asyncio.ensure_future(JwtService.decode_jwt(jwt=jwt))
+    user_loader = None
+    try:
+        # let both requests go out before the payload validation takes the loop
+        await asyncio.sleep(0)
+        payload_validated = UserUpdateData(**raw_payload)
+        jwt_data = await jwt_task
+        thebes_answer = ThebesAnswer(jwt_data=jwt_data)
+        user_loader = UserDocumentLoader(
+            thebes_answer.unique_id,
+            UserEnumerateService.user_document_fields,
+            UserReviewDataService.user_document_fields,
+        )
+        user_loader.load()
+        await ConcurrencyService.gather_fail_fast(
+            device_info_task,
+            LivenessService.validate(
+                thebes_answer.unique_id,
+                payload_validated,
+            ),
+            UserEnumerateService(
+                payload_validated=payload_validated,
+                unique_id=thebes_answer.unique_id,
+                user_loader=user_loader,
+            ).validate_enumerate_params(),
+            UserReviewDataService.check_if_able_to_update(
+                payload_validated, thebes_answer, jwt
+            ),
+        )
+        device_info = device_info_task.result()
+
+        await UserReviewDataService.update_user_data(
+            unique_id=thebes_answer.unique_id,
+            payload_validated=payload_validated.dict(),
+            device_info=device_info,
+            user_loader=user_loader,
+        )
+    finally:
+        # whatever a failed step left running is cancelled and awaited here
+        device_info_task.cancel()
+        jwt_task.cancel()
+        await asyncio.gather(device_info_task, jwt_task, return_exceptions=True)
+        if user_loader is not None:
+            await user_loader.close()
+
+
+async def _append_user_risk_validation(api_key: str, headers: Mapping[str, str]):
+    if SettingsInfrastructure.get_settings().api_key != api_key:
         raise InvalidApiKey()
-    if not (unique_id := flask.request.headers.get("unique_id")):
+    if not (unique_id := headers.get("unique_id")):
         raise ValueError("Missing unique id")
     await UserReviewDataService.update_user_data(
         unique_id=unique_id,
@@ -81,160 +84,18 @@ async def _append_user_risk_validation(api_key: str):
     )
 
 
-async def update_user_data() -> flask.Response:
-    msg_error = "Unexpected error occurred"
+async def update_user_data(
+    headers: Mapping[str, str], body: bytes
+) -> Tuple[int, List[Tuple[str, str]], bytes]:
     try:
-        if jwt := flask.request.headers.get("x-thebes-answer"):
-            await _update_user_update_data_legacy(jwt)
-        elif api_key := flask.request.headers.get("x-api-key"):
-            await _append_user_risk_validation(api_key)
+        if jwt := headers.get("x-thebes-answer"):
+            await _update_user_update_data_legacy(jwt, headers, body)
+        elif api_key := headers.get("x-api-key"):
+            await _append_user_risk_validation(api_key, headers)
         else:
             raise ErrorOnDecodeJwt()
-
-        response = ResponseModel(
-            success=True,
-            message="User data successfully updated",
-            code=InternalCode.SUCCESS,
-        ).build_http_response(status=HTTPStatus.OK)
-        return response
-
-    except InvalidApiKey as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.JWT_INVALID,
-            message="Invalid Api Key",
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
-
-    except ErrorOnDecodeJwt as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.JWT_INVALID,
-            message="Error when trying to decode jwt",
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
-
-    except (ErrorOnGetUniqueId, ErrorOnGetAccountBrIsBlocked) as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.JWT_INVALID,
-            message="Fail to get unique_id",
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
-
-    except UserUniqueIdNotExists as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.DATA_NOT_FOUND,
-            message="There is no user with this unique_id",
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
-
-    except FinancialCapacityNotValid as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.FINANCIAL_CAPACITY_NOT_VALID,
-            message="Insufficient financial capacity",
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
-
-    except (
-        InvalidNationality,
-        InvalidCity,
-        InvalidState,
-        InvalidEmail,
-        InvalidActivity,
-        InvalidMaritalStatus,
-        InvalidCountryAcronym,
-        LivenessRejected,
-    ) as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False, code=InternalCode.INVALID_PARAMS, message="Invalid params"
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
-
-    except HighRiskActivityNotAllowed as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.INVALID_PARAMS,
-            message="High risk occupation not allowed",
-        ).build_http_response(status=HTTPStatus.FORBIDDEN)
-        return response
-
-    except InvalidOnboardingCurrentStep as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.ONBOARDING_STEP_INCORRECT,
-            message="Invalid Onboarding Step",
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
-
-    except BrAccountIsBlocked as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.ACCOUNT_BR_IS_BLOCKED,
-            message="Account br is blocked",
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
-
-    except (
-        ErrorOnSendAuditLog,
-        ErrorToUpdateUser,
-        ErrorInLiveness,
-        OnboardingStepsStatusCodeNotOk,
-    ) as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False, code=InternalCode.INTERNAL_SERVER_ERROR, message=msg_error
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
-
-    except InconsistentUserData as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.INTERNAL_SERVER_ERROR,
-            message="User data is inconsistent",
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
-
-    except DeviceInfoRequestFailed as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.INTERNAL_SERVER_ERROR,
-            message="Error trying to get device info",
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
-
-    except DeviceInfoNotSupplied as ex:
-        Gladsheim.error(error=ex, message=ex.msg)
-        response = ResponseModel(
-            success=False,
-            code=InternalCode.INVALID_PARAMS,
-            message="Device info not supplied",
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
-
-    except ValueError as ex:
-        Gladsheim.error(error=ex, message=str(ex))
-        response = ResponseModel(
-            success=False, code=InternalCode.INVALID_PARAMS, message="Invalid params"
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
+        return ResponseRegistry.get_success_response()
 
     except Exception as ex:
-        Gladsheim.error(error=ex, message=str(ex))
-        response = ResponseModel(
-            success=False, code=InternalCode.INTERNAL_SERVER_ERROR, message=msg_error
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
+        Gladsheim.error(error=ex, message=getattr(ex, "msg", str(ex)))
+        return ResponseRegistry.get_error_response(ex)
@@ -0,0 +1,178 @@
+import asyncio
+import multiprocessing
+import signal
+import socket
+import sys
+import time
+from multiprocessing.connection import wait
+from typing import Callable, List, Optional
+
+import uvloop
+from decouple import config
+from etria_logger import Gladsheim
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from func.src.domain.enums.server import ServerWorkerMode
+from func.src.services.import_profiler import ImportProfiler
+
+
+def _build_config(bind: str, workers: int) -> Config:
+    conf = Config()
+    conf.bind = bind
+    # hypercorn only sets SO_REUSEPORT on the sockets it creates when workers > 1
+    conf.workers = workers
+    return conf
+
+
+def _load_app() -> Callable:
+    profiler = None
+    if config("STARTUP_PROFILE_ENABLED", default=False, cast=bool):
+        profiler = ImportProfiler()
+        profiler.install()
+    started_at = time.perf_counter()
+    try:
+        from func.asgi import app
+    finally:
+        if profiler is not None:
+            profiler.uninstall()
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+    budget_ms = config("IMPORT_TIME_BUDGET_MS", default=1000, cast=float)
+    message = f"Application imported in {elapsed_ms:.1f}ms (budget {budget_ms:.0f}ms)"
+    if elapsed_ms > budget_ms:
+        Gladsheim.warning(message=message)
+    else:
+        Gladsheim.info(message=message)
+    if profiler is not None:
+        limit = config("STARTUP_PROFILE_LIMIT", default=30, cast=int)
+        print(profiler.format_report(limit=limit), file=sys.stderr)
+    return app
+
+
+def run_worker(app: Callable, bind: str, workers: int = 1):
+    # clients, pools and caches are created by the lifespan startup, so every
+    # forked worker builds its own on its own loop
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    asyncio.run(serve(app, _build_config(bind, workers)))
+
+
+class WorkerSupervisor:
+    def __init__(
+        self,
+        app: Callable,
+        bind: str,
+        workers: int,
+        mode: ServerWorkerMode = ServerWorkerMode.PREFORK,
+        restart_delay: float = 1.0,
+    ):
+        self.app = app
+        self.bind = bind
+        self.workers = workers
+        self.mode = mode
+        self.restart_delay = restart_delay
+        self.context = multiprocessing.get_context("fork")
+        self.processes: List[Optional[multiprocessing.Process]] = [None] * workers
+        self.listener: Optional[socket.socket] = None
+        self.stopping = False
+
+    @staticmethod
+    def _create_listener(bind: str) -> socket.socket:
+        host, port = bind.rsplit(":", 1)
+        listener = socket.create_server((host, int(port)), backlog=2048)
+        listener.set_inheritable(True)
+        return listener
+
+    def _get_worker_bind(self) -> str:
+        if self.mode == ServerWorkerMode.PREFORK:
+            return f"fd://{self.listener.fileno()}"
+        return self.bind
+
+    def _start_worker(self, index: int):
+        process = self.context.Process(
+            target=run_worker,
+            args=(self.app, self._get_worker_bind(), self.workers),
+            name=f"worker-{index}",
+            daemon=False,
+        )
+        process.start()
+        self.processes[index] = process
+        Gladsheim.info(message=f"Worker {index} started", pid=process.pid)
+
+    def _restart_dead_workers(self):
+        dead_workers = [
+            (index, process)
+            for index, process in enumerate(self.processes)
+            if process is not None and not process.is_alive()
+        ]
+        if not dead_workers:
+            return
+        # throttles a worker that crashes right after starting
+        time.sleep(self.restart_delay)
+        for index, process in dead_workers:
+            if self.stopping:
+                return
+            Gladsheim.warning(
+                message=f"Worker {index} exited, restarting",
+                pid=process.pid,
+                exitcode=process.exitcode,
+            )
+            process.close()
+            self._start_worker(index)
+
+    def _handle_stop_signal(self, signum, frame):
+        self.stopping = True
+
+    def _stop_workers(self, timeout: float = 30.0):
+        alive_processes = [p for p in self.processes if p is not None and p.is_alive()]
+        for process in alive_processes:
+            process.terminate()
+        deadline = time.monotonic() + timeout
+        for process in alive_processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+
+    def run(self):
+        if self.mode == ServerWorkerMode.PREFORK:
+            self.listener = self._create_listener(self.bind)
+        signal.signal(signal.SIGTERM, self._handle_stop_signal)
+        signal.signal(signal.SIGINT, self._handle_stop_signal)
+        try:
+            for index in range(self.workers):
+                self._start_worker(index)
+            while not self.stopping:
+                wait(
+                    [p.sentinel for p in self.processes if p is not None],
+                    timeout=self.restart_delay,
+                )
+                if not self.stopping:
+                    self._restart_dead_workers()
+        finally:
+            self._stop_workers()
+            if self.listener is not None:
+                self.listener.close()
+
+
+def main():
+    bind = config("SERVER_BIND", default="0.0.0.0:8888")
+    workers = config("SERVER_WORKERS", default=1, cast=int)
+    # imported once in the master, forked workers share the loaded modules
+    app = _load_app()
+    if workers <= 1:
+        run_worker(app, bind)
+        return
+    WorkerSupervisor(
+        app=app,
+        bind=bind,
+        workers=workers,
+        mode=config(
+            "SERVER_WORKER_MODE",
+            default=ServerWorkerMode.PREFORK,
+            cast=ServerWorkerMode,
+        ),
+        restart_delay=config("SERVER_WORKER_RESTART_DELAY", default=1.0, cast=float),
+    ).run()
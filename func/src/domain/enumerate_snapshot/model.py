@@ -0,0 +1,105 @@
+from sys import intern
+from typing import Any, Iterable, Iterator, Optional
+
+
+class EnumerateSnapshot:
+    __slots__ = (
+        "activities",
+        "countries",
+        "states",
+        "marital_statuses",
+        "nationalities",
+        "regions",
+        "cities",
+    )
+
+    def __init__(
+        self,
+        activities: Iterable[tuple],
+        countries: Iterable[tuple],
+        states: Iterable[tuple],
+        marital_statuses: Iterable[tuple],
+        nationalities: Iterable[tuple],
+        cities: Iterable[tuple],
+    ):
+        self.activities = frozenset(self._to_int(code) for (code,) in activities)
+        self.countries = self._to_keys(countries)
+        self.states = self._to_keys(states)
+        self.marital_statuses = frozenset(
+            self._to_int(code) for (code,) in marital_statuses
+        )
+        self.nationalities = frozenset(self._to_int(code) for (code,) in nationalities)
+        self.regions = {}
+        self.cities = frozenset(self._pack_cities(cities))
+
+    @staticmethod
+    def _to_int(value: Any) -> Optional[int]:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _to_key(value: Any) -> Any:
+        return intern(value.strip()) if isinstance(value, str) else value
+
+    def _to_keys(self, rows: Iterable[tuple]) -> frozenset:
+        # a NULL column must not make a None lookup valid
+        return frozenset(self._to_key(value) for (value,) in rows if value is not None)
+
+    @staticmethod
+    def _normalize_key(value: Any) -> Any:
+        # lookups get the same stripping as the stored keys, without interning
+        return value.strip() if isinstance(value, str) else value
+
+    @staticmethod
+    def _pack_city(region: int, id_city: Optional[int]) -> Optional[int]:
+        # ids outside the low 32 bits would collide with another region's keys
+        if id_city is None or not 0 <= id_city < 1 << 32:
+            return None
+        return region << 32 | id_city
+
+    def _pack_cities(self, cities: Iterable[tuple]) -> Iterator[int]:
+        for country, state, id_city in cities:
+            region_key = (self._to_key(country), self._to_key(state))
+            region = self.regions.get(region_key, len(self.regions))
+            city = self._pack_city(region, self._to_int(id_city))
+            if city is None:
+                continue
+            self.regions.setdefault(region_key, region)
+            yield city
+
+    def has_activity(self, activity_code: int) -> bool:
+        return self._to_int(activity_code) in self.activities
+
+    def has_country(self, country_acronym: str) -> bool:
+        return self._normalize_key(country_acronym) in self.countries
+
+    def has_state(self, state: str) -> bool:
+        return self._normalize_key(state) in self.states
+
+    def has_marital_status(self, marital_code: int) -> bool:
+        return self._to_int(marital_code) in self.marital_statuses
+
+    def has_nationality(self, nationality_code: int) -> bool:
+        return self._to_int(nationality_code) in self.nationalities
+
+    def has_city(self, country: str, state: str, id_city: int) -> bool:
+        region = self.regions.get(
+            (self._normalize_key(country), self._normalize_key(state))
+        )
+        if region is None:
+            return False
+        city = self._pack_city(region, self._to_int(id_city))
+        return city is not None and city in self.cities
+
+    def get_sizes(self) -> dict:
+        sizes = {
+            "activities": len(self.activities),
+            "countries": len(self.countries),
+            "states": len(self.states),
+            "marital_statuses": len(self.marital_statuses),
+            "nationalities": len(self.nationalities),
+            "cities": len(self.cities),
+        }
+        return sizes
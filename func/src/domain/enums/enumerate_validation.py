@@ -0,0 +1,16 @@
+from strenum import StrEnum
+
+
+class EnumerateField(StrEnum):
+    ACTIVITY = "activity"
+    STATE = "state"
+    NATIONALITY = "nationality"
+    COUNTRY_TAX_RESIDENCE = "country_tax_residence"
+    MARITAL_STATUS = "marital_status"
+    ADDRESS_CITY = "address_city"
+    BIRTH_PLACE_CITY = "birth_place_city"
+
+
+class EnumerateValidationMode(StrEnum):
+    PER_TABLE = "per_table"
+    COMPOSITE = "composite"
@@ -0,0 +1,16 @@
+from strenum import StrEnum
+
+
+class MongoReadPreference(StrEnum):
+    PRIMARY = "primary"
+    PRIMARY_PREFERRED = "primaryPreferred"
+    SECONDARY = "secondary"
+    SECONDARY_PREFERRED = "secondaryPreferred"
+    NEAREST = "nearest"
+
+
+class MongoReadConcern(StrEnum):
+    LOCAL = "local"
+    AVAILABLE = "available"
+    MAJORITY = "majority"
+    LINEARIZABLE = "linearizable"
@@ -0,0 +1,15 @@
+from strenum import StrEnum
+
+
+class OutboxEventType(StrEnum):
+    AUDIT_UPDATE_REGISTRATION_DATA = "audit_update_registration_data"
+    AUDIT_RATE_CLIENT_RISK = "audit_rate_client_risk"
+    IARA_SINACOR_UPDATE = "iara_sinacor_update"
+    IARA_DW_UPDATE = "iara_dw_update"
+
+
+class OutboxEventStatus(StrEnum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DELIVERED = "delivered"
+    FAILED = "failed"
@@ -0,0 +1,6 @@
+from strenum import StrEnum
+
+
+class ServerWorkerMode(StrEnum):
+    PREFORK = "prefork"
+    REUSE_PORT = "reuse_port"
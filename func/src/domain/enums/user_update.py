@@ -0,0 +1,6 @@
+from strenum import StrEnum
+
+
+class UserUpdateWriteMode(StrEnum):
+    DIFF = "diff"
+    FULL = "full"
@@ -27,6 +27,14 @@ class ErrorToUpdateUser(Exception):
     )
 
 
+class UserUpdateConflict(Exception):
+    msg = "User document was changed by a concurrent update"
+
+
+class OutboxEventNotDelivered(Exception):
+    msg = "Outbox event was not accepted by the downstream service"
+
+
 class UserUniqueIdNotExists(Exception):
     msg = "Jormungandr-Onboarding::get_registration_data::Not exists an user_data with this unique_id"
 
@@ -1,4 +1,4 @@
-from decouple import config
+from ...infrastructures.settings.infrastructure import SettingsInfrastructure
 
 
 class DeviceInfo:
@@ -10,6 +10,5 @@ class DeviceInfo:
         self.device_info = device_info
         self.device_id = device_id
         if device_info.get("precision") is None:
-            self.device_info.update(
-                {"precision": float(config("DEFAULT_PRECISION_VALUE"))}
-            )
+            settings = SettingsInfrastructure.get_settings()
+            self.device_info.update({"precision": settings.default_precision_value})
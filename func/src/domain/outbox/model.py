@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import uuid4
+
+from ..enums.outbox import OutboxEventStatus, OutboxEventType
+
+
+class OutboxEvent:
+    def __init__(
+        self,
+        event_type: OutboxEventType,
+        unique_id: str,
+        payload: dict,
+        idempotency_key: str = None,
+    ):
+        self.event_type = event_type
+        self.unique_id = unique_id
+        self.payload = payload
+        self.idempotency_key = idempotency_key or str(uuid4())
+
+    def to_document(self) -> dict:
+        now = datetime.utcnow()
+        document = {
+            "_id": self.idempotency_key,
+            "event_type": self.event_type.value,
+            "unique_id": self.unique_id,
+            "payload": self.payload,
+            "status": OutboxEventStatus.PENDING.value,
+            "attempts": 0,
+            "created_at": now,
+            "next_attempt_at": now,
+        }
+        return document
@@ -1,8 +1,8 @@
 from ..enums.code import InternalCode
 
 from json import dumps
+from typing import List, Tuple
 
-from flask import Response
 from nidavellir import Sindri
 
 
@@ -29,12 +29,8 @@ class ResponseModel:
         self.response = response_model
         return response_model
 
-    def build_http_response(
+    def build_raw_response(
         self, status: int, mimetype: str = "application/json"
-    ) -> Response:
-        http_response = Response(
-            self.response,
-            mimetype=mimetype,
-            status=status,
-        )
-        return http_response
+    ) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        headers = [("content-type", mimetype)]
+        return int(status), headers, self.response.encode()
@@ -0,0 +1,179 @@
+from http import HTTPStatus
+from typing import Dict, List, Tuple, Type
+
+from ..enums.code import InternalCode
+from ..exceptions.exceptions import (
+    BrAccountIsBlocked,
+    DeviceInfoNotSupplied,
+    DeviceInfoRequestFailed,
+    ErrorInLiveness,
+    ErrorOnDecodeJwt,
+    ErrorOnGetAccountBrIsBlocked,
+    ErrorOnGetUniqueId,
+    ErrorOnSendAuditLog,
+    ErrorToUpdateUser,
+    FinancialCapacityNotValid,
+    HighRiskActivityNotAllowed,
+    InconsistentUserData,
+    InvalidActivity,
+    InvalidApiKey,
+    InvalidCity,
+    InvalidCountryAcronym,
+    InvalidEmail,
+    InvalidMaritalStatus,
+    InvalidNationality,
+    InvalidOnboardingCurrentStep,
+    InvalidState,
+    LivenessRejected,
+    OnboardingStepsStatusCodeNotOk,
+    UserUniqueIdNotExists,
+)
+from .model import ResponseModel
+
+RawResponse = Tuple[int, List[Tuple[str, str]], bytes]
+
+unexpected_error_message = "Unexpected error occurred"
+
+
+class ResponseRegistry:
+    success = (HTTPStatus.OK, InternalCode.SUCCESS, "User data successfully updated")
+    errors = (
+        (
+            (InvalidApiKey,),
+            HTTPStatus.UNAUTHORIZED,
+            InternalCode.JWT_INVALID,
+            "Invalid Api Key",
+        ),
+        (
+            (ErrorOnDecodeJwt,),
+            HTTPStatus.UNAUTHORIZED,
+            InternalCode.JWT_INVALID,
+            "Error when trying to decode jwt",
+        ),
+        (
+            (ErrorOnGetUniqueId, ErrorOnGetAccountBrIsBlocked),
+            HTTPStatus.UNAUTHORIZED,
+            InternalCode.JWT_INVALID,
+            "Fail to get unique_id",
+        ),
+        (
+            (UserUniqueIdNotExists,),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.DATA_NOT_FOUND,
+            "There is no user with this unique_id",
+        ),
+        (
+            (FinancialCapacityNotValid,),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.FINANCIAL_CAPACITY_NOT_VALID,
+            "Insufficient financial capacity",
+        ),
+        (
+            (
+                InvalidNationality,
+                InvalidCity,
+                InvalidState,
+                InvalidEmail,
+                InvalidActivity,
+                InvalidMaritalStatus,
+                InvalidCountryAcronym,
+                LivenessRejected,
+            ),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.INVALID_PARAMS,
+            "Invalid params",
+        ),
+        (
+            (HighRiskActivityNotAllowed,),
+            HTTPStatus.FORBIDDEN,
+            InternalCode.INVALID_PARAMS,
+            "High risk occupation not allowed",
+        ),
+        (
+            (InvalidOnboardingCurrentStep,),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.ONBOARDING_STEP_INCORRECT,
+            "Invalid Onboarding Step",
+        ),
+        (
+            (BrAccountIsBlocked,),
+            HTTPStatus.UNAUTHORIZED,
+            InternalCode.ACCOUNT_BR_IS_BLOCKED,
+            "Account br is blocked",
+        ),
+        (
+            (
+                ErrorOnSendAuditLog,
+                ErrorToUpdateUser,
+                ErrorInLiveness,
+                OnboardingStepsStatusCodeNotOk,
+            ),
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            InternalCode.INTERNAL_SERVER_ERROR,
+            unexpected_error_message,
+        ),
+        (
+            (InconsistentUserData,),
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            InternalCode.INTERNAL_SERVER_ERROR,
+            "User data is inconsistent",
+        ),
+        (
+            (DeviceInfoRequestFailed,),
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            InternalCode.INTERNAL_SERVER_ERROR,
+            "Error trying to get device info",
+        ),
+        (
+            (DeviceInfoNotSupplied,),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.INVALID_PARAMS,
+            "Device info not supplied",
+        ),
+        (
+            (ValueError,),
+            HTTPStatus.BAD_REQUEST,
+            InternalCode.INVALID_PARAMS,
+            "Invalid params",
+        ),
+        (
+            (Exception,),
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            InternalCode.INTERNAL_SERVER_ERROR,
+            unexpected_error_message,
+        ),
+    )
+    success_response: RawResponse = None
+    error_responses: Dict[Type[BaseException], RawResponse] = {}
+
+    @staticmethod
+    def _encode(
+        success: bool, status: HTTPStatus, code: InternalCode, message: str
+    ) -> RawResponse:
+        response = ResponseModel(
+            success=success, code=code, message=message
+        ).build_raw_response(status=status)
+        return response
+
+    @classmethod
+    def build(cls):
+        cls.success_response = cls._encode(True, *cls.success)
+        cls.error_responses = {
+            exception_type: cls._encode(False, status, code, message)
+            for exception_types, status, code, message in cls.errors
+            for exception_type in exception_types
+        }
+
+    @classmethod
+    def get_success_response(cls) -> RawResponse:
+        return cls.success_response
+
+    @classmethod
+    def get_error_response(cls, error: Exception) -> RawResponse:
+        for exception_type in type(error).__mro__:
+            if response := cls.error_responses.get(exception_type):
+                return response
+        return cls.error_responses[Exception]
+
+
+ResponseRegistry.build()
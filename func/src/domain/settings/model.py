@@ -0,0 +1,98 @@
+from typing import Callable, Optional, Union
+
+from decouple import config
+from pydantic import BaseModel, confloat, conint, root_validator
+
+from ..enums.enumerate_validation import EnumerateValidationMode
+from ..enums.mongo_db import MongoReadConcern, MongoReadPreference
+from ..enums.user_update import UserUpdateWriteMode
+
+
+class Settings(BaseModel):
+    api_key: str
+    koh_feature_update_user_data: str
+    default_precision_value: float
+
+    mongodb_database_name: str
+    mongodb_user_collection: str
+    mongodb_outbox_collection: Optional[str] = None
+    mongodb_read_preference: MongoReadPreference = MongoReadPreference.PRIMARY
+    mongodb_read_concern: Optional[MongoReadConcern] = None
+    mongodb_write_concern: Optional[Union[conint(ge=0), str]] = None
+    mongodb_max_pool_size: Optional[conint(ge=0)] = None
+    mongodb_min_pool_size: Optional[conint(ge=0)] = None
+    mongodb_max_idle_time_ms: Optional[conint(ge=0)] = None
+    mongodb_wait_queue_timeout_ms: Optional[conint(ge=0)] = None
+    mongodb_server_selection_timeout_ms: Optional[conint(ge=0)] = None
+    mongodb_compressors: Optional[str] = None
+    mongodb_app_name: Optional[str] = None
+
+    persephone_topic_user: str
+    persephone_user_review_schema: str
+    persephone_user_pld_schema: str
+
+    onboarding_steps_br_url: str
+    onboarding_steps_us_url: str
+    device_security_decrypt_device_info_url: str
+    device_security_device_id_url: str
+
+    user_update_max_retries: conint(ge=0) = 3
+    user_update_retry_backoff_ms: confloat(ge=0) = 20.0
+    user_update_write_mode: UserUpdateWriteMode = UserUpdateWriteMode.FULL
+    enumerate_validation_mode: EnumerateValidationMode = (
+        EnumerateValidationMode.PER_TABLE
+    )
+    enumerate_validation_concurrency: conint(ge=1) = 8
+    enumerate_cache_ttl: confloat(ge=0) = 3600.0
+    enumerate_cache_negative_ttl: confloat(ge=0) = 60.0
+    enumerate_cache_max_size: conint(ge=0) = 10000
+    enumerate_snapshot_enabled: bool = False
+    enumerate_snapshot_refresh_interval: confloat(gt=0) = 3600.0
+    outbox_enabled: bool = False
+    outbox_relay_interval: confloat(gt=0) = 1.0
+    outbox_batch_size: conint(ge=1) = 50
+    outbox_lease_seconds: confloat(gt=0) = 30.0
+    outbox_max_attempts: conint(ge=1) = 10
+    outbox_retry_base_delay: confloat(ge=0) = 1.0
+    outbox_retry_max_delay: confloat(ge=0) = 300.0
+
+    oracle_pool_min: conint(ge=0) = 2
+    oracle_pool_max: conint(ge=1) = 100
+    oracle_pool_increment: conint(ge=0) = 1
+    oracle_pool_idle_timeout: conint(ge=0) = 0
+    oracle_pool_wait_timeout_ms: conint(ge=0) = 0
+    oracle_statement_cache_size: conint(ge=0) = 20
+    oracle_read_only_transaction: bool = False
+
+    audit_publisher_enabled: bool = False
+    audit_max_in_flight: conint(ge=1) = 1000
+
+    iara_send_timeout: confloat(gt=0) = 5.0
+    iara_sinacor_update_timeout: Optional[confloat(gt=0)] = None
+    iara_dw_update_timeout: Optional[confloat(gt=0)] = None
+
+    http_client_max_connections: conint(ge=1) = 100
+    http_client_max_keepalive_connections: conint(ge=0) = 20
+    http_client_keepalive_expiry: confloat(ge=0) = 5.0
+    http_client_timeout: confloat(gt=0) = 5.0
+    http_client_connect_timeout: confloat(gt=0) = 5.0
+    http_client_http2: bool = False
+
+    class Config:
+        allow_mutation = False
+
+    @root_validator(skip_on_failure=True)
+    def outbox_requires_collection(cls, values):
+        if values["outbox_enabled"] and not values["mongodb_outbox_collection"]:
+            raise ValueError("MONGODB_OUTBOX_COLLECTION is required by OUTBOX_ENABLED")
+        return values
+
+    @classmethod
+    def from_env(cls, source: Callable = config) -> "Settings":
+        values = {}
+        for name, field in cls.__fields__.items():
+            if field.required:
+                values[name] = source(name.upper())
+            else:
+                values[name] = source(name.upper(), default=field.default)
+        return cls(**values)
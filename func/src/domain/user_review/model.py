@@ -1,6 +1,6 @@
 from copy import deepcopy
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from regis import RegisResponse
 
@@ -10,6 +10,13 @@ from ..models.device_info import DeviceInfo
 
 
 class UserReviewModel:
+    risk_data_paths = (
+        ("pld",),
+        ("expiration_dates",),
+        ("record_date_control", "current_pld_risk_rating_defined_in"),
+        ("record_date_control", "registry_updates", "last_registration_data_update"),
+    )
+
     def __init__(
         self,
         user_review_data: dict,
@@ -19,6 +26,7 @@ class UserReviewModel:
         device_info: Optional[DeviceInfo],
         risk_data: RegisResponse = None,
         risk_rating_changed: bool = None,
+        modified_paths: Iterable[tuple] = (),
     ):
         self.user_review_data = user_review_data
         self.unique_id = unique_id
@@ -27,11 +35,16 @@ class UserReviewModel:
         self.device_info = device_info
         self.risk_data = risk_data
         self.risk_rating_changed = risk_rating_changed
+        self.modified_paths = tuple(modified_paths)
+        self.stored_user_data = None
 
     def add_risk_data(self, risk_data: RegisResponse, risk_rating_changed: bool):
         self.risk_data = risk_data
         self.risk_rating_changed = risk_rating_changed
 
+    def add_stored_user_data(self, stored_user_data: dict):
+        self.stored_user_data = stored_user_data
+
     def update_new_data_with_risk_data(self):
         risk_data_template = {
             "pld": {
@@ -88,11 +101,34 @@ class UserReviewModel:
                 "device_id": self.device_info.device_id
             })
         if not audit_template["approval"]:
-            audit_template.update(
-                {"user_data": deepcopy(self.new_user_registration_data)}
-            )
+            # the update reads a projection, the stored document fills in the rest
+            user_data = {
+                **(self.stored_user_data or {}),
+                **self.new_user_registration_data,
+            }
+            audit_template.update({"user_data": deepcopy(user_data)})
         return audit_template
 
     async def get_new_user_data(self) -> dict:
         del self.new_user_registration_data["_id"]
         return self.new_user_registration_data
+
+    async def get_new_user_data_changes(self) -> dict:
+        changes = {}
+        written_paths = []
+        for path in sorted({*self.modified_paths, *self.risk_data_paths}):
+            path, value = self._get_value_to_set(path)
+            if any(path[: len(parent)] == parent for parent in written_paths):
+                continue
+            written_paths.append(path)
+            changes[".".join(path)] = value
+        return changes
+
+    def _get_value_to_set(self, path: tuple) -> tuple:
+        value = self.new_user_registration_data
+        for depth, level in enumerate(path):
+            if not isinstance(value, dict):
+                # a null or scalar level cannot hold the dotted path, so it is set whole
+                return path[:depth], value
+            value = value.get(level)
+        return path, value
@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from ..settings.infrastructure import SettingsInfrastructure
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+
+class HttpInfrastructure:
+
+    client = None
+
+    @classmethod
+    def get_client(cls) -> "AsyncClient":
+        if cls.client is None or cls.client.is_closed:
+            # httpx is imported on first use, off the cold-start import path
+            from httpx import AsyncClient, Limits, Timeout
+
+            settings = SettingsInfrastructure.get_settings()
+            limits = Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+                keepalive_expiry=settings.http_client_keepalive_expiry,
+            )
+            timeout = Timeout(
+                settings.http_client_timeout,
+                connect=settings.http_client_connect_timeout,
+            )
+            cls.client = AsyncClient(
+                limits=limits,
+                timeout=timeout,
+                http2=settings.http_client_http2,
+            )
+        return cls.client
+
+    @classmethod
+    async def close_client(cls):
+        if cls.client is None:
+            return
+        await cls.client.aclose()
+        cls.client = None
@@ -1,17 +1,55 @@
 from decouple import config
-from motor import motor_asyncio
+
+from ..settings.infrastructure import SettingsInfrastructure
 
 
 class MongoDBInfrastructure:
 
     client = None
+    pool_listener = None
+
+    client_options = {
+        "maxPoolSize": "mongodb_max_pool_size",
+        "minPoolSize": "mongodb_min_pool_size",
+        "maxIdleTimeMS": "mongodb_max_idle_time_ms",
+        "waitQueueTimeoutMS": "mongodb_wait_queue_timeout_ms",
+        "serverSelectionTimeoutMS": "mongodb_server_selection_timeout_ms",
+        "compressors": "mongodb_compressors",
+        "appname": "mongodb_app_name",
+    }
+
+    @classmethod
+    def _get_client_options(cls) -> dict:
+        # unset options are left to the connection url and the driver defaults
+        settings = SettingsInfrastructure.get_settings()
+        options = {}
+        for option, setting in cls.client_options.items():
+            value = getattr(settings, setting)
+            if value is not None:
+                options[option] = value
+        return options
 
     @classmethod
     def get_client(cls):
         if cls.client is None:
             try:
+                from motor import motor_asyncio
+
+                from .pool_listener import MongoPoolStatsListener
+
                 url = config("MONGO_CONNECTION_URL")
-                cls.client = motor_asyncio.AsyncIOMotorClient(url)
+                cls.pool_listener = MongoPoolStatsListener()
+                cls.client = motor_asyncio.AsyncIOMotorClient(
+                    url,
+                    event_listeners=[cls.pool_listener],
+                    **cls._get_client_options()
+                )
             except Exception as ex:
                 raise ex
         return cls.client
+
+    @classmethod
+    def get_pool_stats(cls) -> dict:
+        if cls.pool_listener is None:
+            return {}
+        return cls.pool_listener.get_stats()
@@ -0,0 +1,68 @@
+from collections import Counter
+from threading import Lock
+
+from pymongo.monitoring import ConnectionPoolListener
+
+
+class MongoPoolStatsListener(ConnectionPoolListener):
+    def __init__(self):
+        self._lock = Lock()
+        self._open = Counter()
+        self._checked_out = Counter()
+        self._wait_queue = Counter()
+
+    def _add(self, counter: Counter, address: tuple, value: int):
+        with self._lock:
+            counter[address] += value
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            addresses = set(self._open) | set(self._checked_out) | set(self._wait_queue)
+            stats = {}
+            for address in sorted(addresses):
+                open_connections = self._open[address]
+                checked_out = self._checked_out[address]
+                stats[":".join(map(str, address))] = {
+                    "open": open_connections,
+                    "checked_out": checked_out,
+                    "available": max(open_connections - checked_out, 0),
+                    "wait_queue": self._wait_queue[address],
+                }
+            return stats
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        with self._lock:
+            for counter in (self._open, self._checked_out, self._wait_queue):
+                counter.pop(event.address, None)
+
+    def connection_created(self, event):
+        self._add(self._open, event.address, 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._add(self._open, event.address, -1)
+
+    def connection_check_out_started(self, event):
+        self._add(self._wait_queue, event.address, 1)
+
+    def connection_check_out_failed(self, event):
+        self._add(self._wait_queue, event.address, -1)
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self._wait_queue[event.address] -= 1
+            self._checked_out[event.address] += 1
+
+    def connection_checked_in(self, event):
+        self._add(self._checked_out, event.address, -1)
@@ -1,31 +1,133 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+from time import perf_counter
 
 from decouple import config
-import cx_Oracle_async
+
+from ..settings.infrastructure import SettingsInfrastructure
 
 
 class OracleInfrastructure:
 
     pool = None
+    pool_future = None
+    acquire_count = 0
+    acquire_wait_ms_total = 0.0
+    acquire_wait_ms_max = 0.0
+
+    @staticmethod
+    def _get_pool_options() -> dict:
+        import cx_Oracle
+
+        settings = SettingsInfrastructure.get_settings()
+        options = {
+            "min": settings.oracle_pool_min,
+            "max": settings.oracle_pool_max,
+            "increment": settings.oracle_pool_increment,
+            "timeout": settings.oracle_pool_idle_timeout,
+        }
+        if settings.oracle_pool_wait_timeout_ms:
+            # without a timed wait an exhausted pool blocks the acquire forever
+            options["getmode"] = cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT
+            options["waitTimeout"] = settings.oracle_pool_wait_timeout_ms
+        return options
+
+    @classmethod
+    async def _create_pool(cls):
+        import cx_Oracle_async
+
+        pool = await cx_Oracle_async.create_pool(
+            dsn=config("ORACLE_CONNECTION_STRING"),
+            user=config("ORACLE_USER"),
+            password=config("ORACLE_PASSWORD"),
+            **cls._get_pool_options()
+        )
+        # cx_Oracle_async does not forward it, so it is set on the wrapped pool
+        pool._pool.stmtcachesize = (
+            SettingsInfrastructure.get_settings().oracle_statement_cache_size
+        )
+        return pool
 
     @classmethod
     async def _get_pool(cls):
         if cls.pool is None:
-            cls.pool = await cx_Oracle_async.create_pool(
-                dsn=config("ORACLE_CONNECTION_STRING"),
-                user=config("ORACLE_USER"),
-                password=config("ORACLE_PASSWORD"),
-                min=2,
-                max=100,
-                increment=1
-            )
+            # the startup warm-up and the first requests share the same creation
+            if cls.pool_future is None:
+                cls.pool_future = asyncio.ensure_future(cls._create_pool())
+            try:
+                cls.pool = await asyncio.shield(cls.pool_future)
+            except Exception:
+                cls.pool_future = None
+                raise
         return cls.pool
 
+    @classmethod
+    def _record_acquire_wait(cls, wait_ms: float):
+        cls.acquire_count += 1
+        cls.acquire_wait_ms_total += wait_ms
+        cls.acquire_wait_ms_max = max(cls.acquire_wait_ms_max, wait_ms)
+
     @classmethod
     @asynccontextmanager
-    async def get_connection(cls):
+    async def _acquire(cls):
         pool = await cls._get_pool()
+        started_at = perf_counter()
         async with pool.acquire() as conn:
+            cls._record_acquire_wait((perf_counter() - started_at) * 1000)
+            yield conn
+
+    @classmethod
+    @asynccontextmanager
+    async def get_connection(cls):
+        async with cls._acquire() as conn:
             async with conn.cursor() as cursor:
                 yield cursor
                 await conn.commit()
+
+    @classmethod
+    @asynccontextmanager
+    async def get_read_only_connection(cls):
+        # plain selects open no transaction, so skipping the commit saves a round trip
+        read_only_transaction = (
+            SettingsInfrastructure.get_settings().oracle_read_only_transaction
+        )
+        async with cls._acquire() as conn:
+            async with conn.cursor() as cursor:
+                if not read_only_transaction:
+                    yield cursor
+                    return
+                await cursor.execute("SET TRANSACTION READ ONLY")
+                try:
+                    yield cursor
+                finally:
+                    await conn.rollback()
+
+    @classmethod
+    async def warm_up(cls):
+        pool = await cls._get_pool()
+        async with AsyncExitStack() as stack:
+            # holding every session until the end makes each ping reach a different one
+            connections = [
+                await stack.enter_async_context(cls._acquire())
+                for _ in range(pool._pool.min)
+            ]
+            await asyncio.gather(*(conn.ping() for conn in connections))
+
+    @classmethod
+    def get_pool_stats(cls) -> dict:
+        if cls.pool is None:
+            return {}
+        session_pool = cls.pool._pool
+        acquire_wait_ms_avg = (
+            cls.acquire_wait_ms_total / cls.acquire_count if cls.acquire_count else 0.0
+        )
+        stats = {
+            "min": session_pool.min,
+            "max": session_pool.max,
+            "open": session_pool.opened,
+            "busy": session_pool.busy,
+            "acquire_count": cls.acquire_count,
+            "acquire_wait_ms_avg": round(acquire_wait_ms_avg, 3),
+            "acquire_wait_ms_max": round(cls.acquire_wait_ms_max, 3),
+        }
+        return stats
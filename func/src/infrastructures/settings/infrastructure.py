@@ -0,0 +1,29 @@
+from decouple import AutoConfig
+from etria_logger import Gladsheim
+
+from ...domain.settings.model import Settings
+
+
+class SettingsInfrastructure:
+
+    settings = None
+
+    @classmethod
+    def get_settings(cls) -> Settings:
+        if cls.settings is None:
+            cls.settings = Settings.from_env()
+        return cls.settings
+
+    @classmethod
+    def reload(cls) -> Settings:
+        # the module level decouple config caches its env file, so a fresh one is read
+        try:
+            settings = Settings.from_env(source=AutoConfig())
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="SettingsInfrastructure::reload::Keeping previous settings",
+            )
+            return cls.settings
+        cls.settings = settings
+        return cls.settings
@@ -1,22 +1,62 @@
+import asyncio
+
+from ....domain.settings.model import Settings
 from ....infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from ....infrastructures.settings.infrastructure import SettingsInfrastructure
 
 from etria_logger import Gladsheim
-from decouple import config
 
 
 class MongoDbBaseRepository:
     infra = MongoDBInfrastructure
+    collection_name_setting = "mongodb_user_collection"
+    collections = {}
 
     @classmethod
-    async def _get_collection(cls):
-        mongo_client = cls.infra.get_client()
+    def _build_collection(cls, mongo_client, settings: Settings, read_only: bool):
+        from pymongo import ReadPreference
+        from pymongo.read_concern import ReadConcern
+        from pymongo.write_concern import WriteConcern
+
+        database = mongo_client[settings.mongodb_database_name]
+        options = {}
+        if read_only:
+            options["read_preference"] = getattr(
+                ReadPreference, settings.mongodb_read_preference.name
+            )
+            if settings.mongodb_read_concern is not None:
+                options["read_concern"] = ReadConcern(settings.mongodb_read_concern)
+        elif settings.mongodb_write_concern is not None:
+            options["write_concern"] = WriteConcern(w=settings.mongodb_write_concern)
+        collection = database.get_collection(
+            getattr(settings, cls.collection_name_setting), **options
+        )
+        return collection
+
+    @classmethod
+    async def _get_collection(cls, read_only: bool = False):
+        owner = (
+            asyncio.get_running_loop(),
+            cls.infra.get_client(),
+            SettingsInfrastructure.get_settings(),
+        )
+        key = (cls.collection_name_setting, read_only)
+        # handles are bound to the loop, client and settings they were built with
+        cached = cls.collections.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], owner)):
+            return cached[1]
         try:
-            database = mongo_client[config("MONGODB_DATABASE_NAME")]
-            collection = database[config("MONGODB_USER_COLLECTION")]
-            return collection
+            collection = cls._build_collection(*owner[1:], read_only=read_only)
         except Exception as ex:
             message = (
                 f"UserRepository::_get_collection::Error when trying to get collection"
             )
             Gladsheim.error(error=ex, message=message)
             raise ex
+        cls.collections[key] = (owner, collection)
+        return collection
+
+    @classmethod
+    async def ping(cls):
+        mongo_client = cls.infra.get_client()
+        await mongo_client.admin.command("ping")
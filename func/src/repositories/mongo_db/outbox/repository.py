@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+from etria_logger import Gladsheim
+
+from func.src.domain.enums.outbox import OutboxEventStatus
+from func.src.repositories.mongo_db.base_repository.base import MongoDbBaseRepository
+
+
+class OutboxRepository(MongoDbBaseRepository):
+    collection_name_setting = "mongodb_outbox_collection"
+
+    @classmethod
+    async def insert_events(cls, events: List[dict], session=None):
+        collection = await cls._get_collection()
+        try:
+            await collection.insert_many(events, ordered=False, session=session)
+        except Exception as ex:
+            message = "OutboxRepository::insert_events::error to insert outbox events"
+            Gladsheim.error(error=ex, message=message)
+            raise ex
+
+    @classmethod
+    async def claim_events(cls, batch_size: int, lease_seconds: float) -> List[dict]:
+        collection = await cls._get_collection()
+        now = datetime.utcnow()
+        claimable = {
+            "$or": [
+                {
+                    "status": OutboxEventStatus.PENDING.value,
+                    "next_attempt_at": {"$lte": now},
+                },
+                {
+                    "status": OutboxEventStatus.PROCESSING.value,
+                    "locked_until": {"$lte": now},
+                },
+            ]
+        }
+        lease_token = str(uuid4())
+        try:
+            candidates = (
+                collection.find(claimable, {"_id": 1})
+                .sort("next_attempt_at", 1)
+                .limit(batch_size)
+            )
+            candidate_keys = [event["_id"] async for event in candidates]
+            if not candidate_keys:
+                return []
+            # the claimable filter is checked again, so a concurrent relay keeps its events
+            await collection.update_many(
+                {"_id": {"$in": candidate_keys}, **claimable},
+                {
+                    "$set": {
+                        "status": OutboxEventStatus.PROCESSING.value,
+                        "locked_until": now + timedelta(seconds=lease_seconds),
+                        "lease_token": lease_token,
+                    },
+                    "$inc": {"attempts": 1},
+                },
+            )
+            claimed_events = collection.find(
+                {"_id": {"$in": candidate_keys}, "lease_token": lease_token}
+            )
+            events = await claimed_events.to_list(length=None)
+            return events
+        except Exception as ex:
+            message = "OutboxRepository::claim_events::error to claim outbox events"
+            Gladsheim.error(error=ex, message=message)
+            raise ex
+
+    @classmethod
+    async def mark_delivered(cls, idempotency_key: str, lease_token: str) -> bool:
+        return await cls._update_status(
+            idempotency_key=idempotency_key,
+            lease_token=lease_token,
+            fields={
+                "status": OutboxEventStatus.DELIVERED.value,
+                "delivered_at": datetime.utcnow(),
+            },
+        )
+
+    @classmethod
+    async def schedule_retry(
+        cls, idempotency_key: str, lease_token: str, next_attempt_at: datetime
+    ) -> bool:
+        return await cls._update_status(
+            idempotency_key=idempotency_key,
+            lease_token=lease_token,
+            fields={
+                "status": OutboxEventStatus.PENDING.value,
+                "next_attempt_at": next_attempt_at,
+            },
+        )
+
+    @classmethod
+    async def mark_failed(cls, idempotency_key: str, lease_token: str) -> bool:
+        return await cls._update_status(
+            idempotency_key=idempotency_key,
+            lease_token=lease_token,
+            fields={"status": OutboxEventStatus.FAILED.value},
+        )
+
+    @classmethod
+    async def _update_status(
+        cls, idempotency_key: str, lease_token: str, fields: dict
+    ) -> bool:
+        collection = await cls._get_collection()
+        try:
+            # only the relay holding the current lease may settle the event
+            event_updated = await collection.update_one(
+                {
+                    "_id": idempotency_key,
+                    "status": OutboxEventStatus.PROCESSING.value,
+                    "lease_token": lease_token,
+                },
+                {"$set": fields, "$unset": {"locked_until": "", "lease_token": ""}},
+            )
+        except Exception as ex:
+            message = "OutboxRepository::_update_status::error to update outbox event"
+            Gladsheim.error(error=ex, message=message)
+            raise ex
+        return bool(event_updated.matched_count)
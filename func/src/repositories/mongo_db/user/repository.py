@@ -1,15 +1,20 @@
+from typing import List
+
 from etria_logger import Gladsheim
 
 from func.src.repositories.mongo_db.base_repository.base import MongoDbBaseRepository
+from func.src.repositories.mongo_db.outbox.repository import OutboxRepository
 
 
 class UserRepository(MongoDbBaseRepository):
     @classmethod
-    async def get_user(cls, unique_id: str) -> dict:
-        collection = await cls._get_collection()
+    async def get_user(
+        cls, unique_id: str, projection: dict = None, read_only: bool = True
+    ) -> dict:
+        collection = await cls._get_collection(read_only=read_only)
         query = {"unique_id": unique_id}
         try:
-            user = await collection.find_one(query)
+            user = await collection.find_one(query, projection)
             return user
         except Exception as ex:
             message = f"UserRepository::get_user::with this query {query}"
@@ -17,14 +22,48 @@ class UserRepository(MongoDbBaseRepository):
             raise ex
 
     @classmethod
-    async def update_user(cls, unique_id: str, new_user_registration_data: dict):
+    async def update_user(
+        cls,
+        unique_id: str,
+        new_user_registration_data: dict,
+        version_filter: dict = None,
+    ):
         collection = await cls._get_collection()
+        query = {"unique_id": unique_id, **(version_filter or {})}
         try:
             user_updated = await collection.update_one(
-                {"unique_id": unique_id}, {"$set": new_user_registration_data}
+                query, {"$set": new_user_registration_data}
             )
             return user_updated
         except Exception as ex:
             message = f"UserRepository::update_user::error to update user data"
             Gladsheim.error(error=ex, message=message)
             raise ex
+
+    @classmethod
+    async def update_user_with_outbox(
+        cls,
+        unique_id: str,
+        new_user_registration_data: dict,
+        outbox_events: List[dict],
+        version_filter: dict = None,
+    ):
+        collection = await cls._get_collection()
+        query = {"unique_id": unique_id, **(version_filter or {})}
+        try:
+            async with await cls.infra.get_client().start_session() as session:
+                async with session.start_transaction():
+                    user_updated = await collection.update_one(
+                        query, {"$set": new_user_registration_data}, session=session
+                    )
+                    if user_updated.matched_count:
+                        await OutboxRepository.insert_events(
+                            events=outbox_events, session=session
+                        )
+            return user_updated
+        except Exception as ex:
+            message = (
+                f"UserRepository::update_user_with_outbox::error to update user data"
+            )
+            Gladsheim.error(error=ex, message=message)
+            raise ex
@@ -1,20 +1,51 @@
 from ...domain.exceptions.exceptions import FailedToGetData
+from ...infrastructures.cache.infrastructure import TtlCache
 from ...infrastructures.oracle.infrastrucuture import OracleInfrastructure
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 from etria_logger import Gladsheim
-import cx_Oracle
 
 
 class OracleBaseRepository:
 
     infra = OracleInfrastructure
+    cache = None
+
+    @classmethod
+    def _get_cache(cls) -> Optional[TtlCache]:
+        return cls.cache
+
+    @staticmethod
+    def _build_bind_list(size: int) -> str:
+        bind_list = ", ".join(f":{position}" for position in range(1, size + 1))
+        return bind_list
+
+    @classmethod
+    async def cached_query(cls, sql: str, filters: List[Union[str, int]]) -> list:
+        cache = cls._get_cache()
+        if cache is None:
+            return await cls.query(sql=sql, filters=filters)
+
+        key = (sql, tuple(filters))
+        found, rows = cache.get(key)
+        if found:
+            return rows
+
+        rows = await cls.query(sql=sql, filters=filters)
+        cache.set(key, rows)
+        return rows
+
+    @classmethod
+    async def ping(cls):
+        await cls.query(sql="SELECT 1 FROM DUAL", filters=[])
 
     @classmethod
     async def query(cls, sql: str, filters: List[Union[str, int]]) -> list:
+        import cx_Oracle
+
         try:
-            async with cls.infra.get_connection() as cursor:
+            async with cls.infra.get_read_only_connection() as cursor:
                 await cursor.execute(sql, filters)
                 rows = await cursor.fetchall()
                 return rows
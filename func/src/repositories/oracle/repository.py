@@ -1,9 +1,90 @@
+from func.src.domain.enums.enumerate_validation import EnumerateField
+from func.src.infrastructures.cache.infrastructure import TtlCache
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
 from func.src.repositories.oracle.base_repository import OracleBaseRepository
 
-from typing import List
+from typing import Any, List, Optional, Tuple
 
 
 class EnumerateRepository(OracleBaseRepository):
+    existence_probes = {
+        EnumerateField.ACTIVITY: """
+            SELECT 1
+            FROM USPIXDB001.SINCAD_EXTERNAL_PROFESSIONAL
+            WHERE CODE = {}
+        """,
+        EnumerateField.STATE: """
+            SELECT 1
+            FROM CORRWIN.TSCESTADO
+            WHERE SG_ESTADO = {}
+        """,
+        EnumerateField.NATIONALITY: """
+            SELECT 1
+            FROM USPIXDB001.SINCAD_EXTERNAL_NATIONALITY
+            WHERE CODE = {}
+        """,
+        EnumerateField.COUNTRY_TAX_RESIDENCE: """
+            SELECT 1
+            FROM CORRWIN.TSCPAIS
+            WHERE SG_PAIS = {}
+        """,
+        EnumerateField.MARITAL_STATUS: """
+            SELECT 1
+            FROM USPIXDB001.SINCAD_EXTERNAL_MARITAL_STATUS
+            WHERE CODE = {}
+        """,
+        EnumerateField.ADDRESS_CITY: """
+            SELECT 1
+            FROM CORRWIN.TSCDXMUNICIPIO
+            WHERE SIGL_PAIS = {}
+            AND SIGL_ESTADO = {}
+            AND NUM_SEQ_MUNI = {}
+        """,
+        EnumerateField.BIRTH_PLACE_CITY: """
+            SELECT 1
+            FROM CORRWIN.TSCDXMUNICIPIO
+            WHERE SIGL_PAIS = {}
+            AND SIGL_ESTADO = {}
+            AND NUM_SEQ_MUNI = {}
+        """,
+    }
+
+    @classmethod
+    def _get_cache(cls) -> TtlCache:
+        if cls.cache is None:
+            settings = SettingsInfrastructure.get_settings()
+            cls.cache = TtlCache(
+                ttl=settings.enumerate_cache_ttl,
+                negative_ttl=settings.enumerate_cache_negative_ttl,
+                max_size=settings.enumerate_cache_max_size,
+            )
+        return cls.cache
+
+    @classmethod
+    def get_cache_stats(cls) -> dict:
+        return cls._get_cache().get_stats()
+
+    @classmethod
+    async def get_invalid_enumerations(
+        cls, enumeration_probes: List[Tuple[EnumerateField, tuple]]
+    ) -> List[EnumerateField]:
+        statements = []
+        filters = []
+        for field, values in enumeration_probes:
+            binds = (
+                f":{position}"
+                for position in range(len(filters) + 1, len(filters) + len(values) + 1)
+            )
+            existence_probe = cls.existence_probes[field].format(*binds)
+            statements.append(
+                f"SELECT '{field}' FROM DUAL WHERE NOT EXISTS ({existence_probe})"
+            )
+            filters.extend(values)
+        sql = " UNION ALL ".join(statements)
+        rows = await cls.query(sql=sql, filters=filters)
+        invalid_fields = [EnumerateField(field.strip()) for (field,) in rows]
+        return invalid_fields
+
     @classmethod
     async def get_activity(cls, activity_code: int) -> List:
         sql = f"""
@@ -11,7 +92,7 @@ class EnumerateRepository(OracleBaseRepository):
     		    FROM USPIXDB001.SINCAD_EXTERNAL_PROFESSIONAL
     		    WHERE CODE = :code
             """
-        result = await cls.query(sql=sql, filters=[activity_code])
+        result = await cls.cached_query(sql=sql, filters=[activity_code])
         return result
 
     @classmethod
@@ -23,18 +104,49 @@ class EnumerateRepository(OracleBaseRepository):
         AND SIGL_ESTADO = :filter
         AND NUM_SEQ_MUNI = :filter
         """
-        result = await cls.query(sql=sql, filters=[country, state, id_city])
+        result = await cls.cached_query(sql=sql, filters=[country, state, id_city])
         return result
 
     @classmethod
     async def get_country(cls, country_acronym: str) -> List:
+        result = await cls._get_existing_countries(country_acronyms=[country_acronym])
+        return result
+
+    @staticmethod
+    def _to_key(value: Any) -> Any:
+        # CHAR columns come back blank padded, so both sides are stripped
+        return value.strip() if isinstance(value, str) else value
+
+    @staticmethod
+    def _to_int(value: Any) -> Optional[int]:
+        # NUMBER columns may come back as float or Decimal
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    async def get_missing_countries(cls, country_acronyms: List[str]) -> List[str]:
+        rows = await cls._get_existing_countries(country_acronyms=country_acronyms)
+        existing_countries = {
+            cls._to_key(country_acronym) for (country_acronym,) in rows
+        }
+        missing_countries = [
+            country_acronym
+            for country_acronym in country_acronyms
+            if cls._to_key(country_acronym) not in existing_countries
+        ]
+        return missing_countries
+
+    @classmethod
+    async def _get_existing_countries(cls, country_acronyms: List[str]) -> List:
+        filters = sorted(set(country_acronyms))
         sql = f"""
-            SELECT 1
+            SELECT SG_PAIS
             FROM CORRWIN.TSCPAIS
-            WHERE SG_PAIS = :filter
+            WHERE SG_PAIS IN ({cls._build_bind_list(size=len(filters))})
         """
-        result = await cls.query(sql=sql, filters=[country_acronym])
-
+        result = await cls.cached_query(sql=sql, filters=filters)
         return result
 
     @classmethod
@@ -44,19 +156,41 @@ class EnumerateRepository(OracleBaseRepository):
             FROM USPIXDB001.SINCAD_EXTERNAL_MARITAL_STATUS
             WHERE CODE = :filter
         """
-        result = await cls.query(sql=sql, filters=[marital_code])
+        result = await cls.cached_query(sql=sql, filters=[marital_code])
 
         return result
 
     @classmethod
     async def get_nationality(cls, nationality_code: int) -> List:
+        result = await cls._get_existing_nationalities(
+            nationality_codes=[nationality_code]
+        )
+        return result
+
+    @classmethod
+    async def get_missing_nationalities(cls, nationality_codes: List[int]) -> List[int]:
+        rows = await cls._get_existing_nationalities(
+            nationality_codes=nationality_codes
+        )
+        existing_nationalities = {
+            cls._to_int(nationality_code) for (nationality_code,) in rows
+        }
+        missing_nationalities = [
+            nationality_code
+            for nationality_code in nationality_codes
+            if cls._to_int(nationality_code) not in existing_nationalities
+        ]
+        return missing_nationalities
+
+    @classmethod
+    async def _get_existing_nationalities(cls, nationality_codes: List[int]) -> List:
+        filters = sorted(set(nationality_codes))
         sql = f"""
-            SELECT 1
+            SELECT CODE
             FROM USPIXDB001.SINCAD_EXTERNAL_NATIONALITY
-            WHERE CODE = :filter
+            WHERE CODE IN ({cls._build_bind_list(size=len(filters))})
         """
-        result = await cls.query(sql=sql, filters=[nationality_code])
-
+        result = await cls.cached_query(sql=sql, filters=filters)
         return result
 
     @classmethod
@@ -66,5 +200,59 @@ class EnumerateRepository(OracleBaseRepository):
             FROM CORRWIN.TSCESTADO
             WHERE SG_ESTADO = :filter
         """
-        result = await cls.query(sql=sql, filters=[state])
+        result = await cls.cached_query(sql=sql, filters=[state])
+        return result
+
+    @classmethod
+    async def get_all_activities(cls) -> List:
+        sql = f"""
+            SELECT CODE
+            FROM USPIXDB001.SINCAD_EXTERNAL_PROFESSIONAL
+        """
+        result = await cls.query(sql=sql, filters=[])
+        return result
+
+    @classmethod
+    async def get_all_cities(cls) -> List:
+        sql = f"""
+            SELECT SIGL_PAIS, SIGL_ESTADO, NUM_SEQ_MUNI
+            FROM CORRWIN.TSCDXMUNICIPIO
+        """
+        result = await cls.query(sql=sql, filters=[])
+        return result
+
+    @classmethod
+    async def get_all_countries(cls) -> List:
+        sql = f"""
+            SELECT SG_PAIS
+            FROM CORRWIN.TSCPAIS
+        """
+        result = await cls.query(sql=sql, filters=[])
+        return result
+
+    @classmethod
+    async def get_all_marital_statuses(cls) -> List:
+        sql = f"""
+            SELECT CODE
+            FROM USPIXDB001.SINCAD_EXTERNAL_MARITAL_STATUS
+        """
+        result = await cls.query(sql=sql, filters=[])
+        return result
+
+    @classmethod
+    async def get_all_nationalities(cls) -> List:
+        sql = f"""
+            SELECT CODE
+            FROM USPIXDB001.SINCAD_EXTERNAL_NATIONALITY
+        """
+        result = await cls.query(sql=sql, filters=[])
+        return result
+
+    @classmethod
+    async def get_all_states(cls) -> List:
+        sql = f"""
+            SELECT SG_ESTADO
+            FROM CORRWIN.TSCESTADO
+        """
+        result = await cls.query(sql=sql, filters=[])
         return result
@@ -1,7 +1,7 @@
 from ...domain.user_review.validator import UserUpdateData
 
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 
 class UpdateCustomerRegistrationBuilder:
@@ -13,8 +13,10 @@ class UpdateCustomerRegistrationBuilder:
         self.__unique_id = unique_id
         self.__update_buffer = old_personal_data.copy()
         self.__modified_data = []
+        self.__modified_paths = []
 
     def _update_modified_data(self, levels: tuple, old_field, new_filed):
+        self.__modified_paths.append(self._get_write_path(levels))
         UpdateCustomerRegistrationBuilder._dictionary_insert_with_levels(
             *levels, _value=new_filed, _current_dict_level=self.__update_buffer
         )
@@ -23,6 +25,17 @@ class UpdateCustomerRegistrationBuilder:
             {"old:": {field_id: old_field}, "new": {field_id: new_filed}}
         )
 
+    def _get_write_path(self, levels: tuple) -> tuple:
+        current_dict_level = self.__update_buffer
+        for depth, level in enumerate(levels[:-1]):
+            current_dict_level = current_dict_level.get(level)
+            if not isinstance(current_dict_level, dict):
+                return levels[: depth + 1]
+        return levels
+
+    def get_modified_paths(self) -> List[tuple]:
+        return list(self.__modified_paths)
+
     @staticmethod
     def _dictionary_insert_with_levels(
         *levels, _value: any, _current_dict_level: dict, _current_arg_id: int = 0
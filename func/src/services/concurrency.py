@@ -0,0 +1,33 @@
+import asyncio
+from contextlib import nullcontext
+from typing import Awaitable, List, Optional
+
+
+class ConcurrencyService:
+    @staticmethod
+    async def gather_fail_fast(
+        *awaitables: Awaitable, limit: Optional[int] = None
+    ) -> List:
+        semaphore = asyncio.Semaphore(limit) if limit else nullcontext()
+
+        async def _run(awaitable: Awaitable):
+            try:
+                async with semaphore:
+                    return await awaitable
+            finally:
+                if asyncio.iscoroutine(awaitable):
+                    awaitable.close()
+
+        tasks = [asyncio.ensure_future(_run(awaitable)) for awaitable in awaitables]
+        if not tasks:
+            return []
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception():
+                    raise task.exception()
+            return [task.result() for task in tasks]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
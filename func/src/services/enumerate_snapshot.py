@@ -0,0 +1,89 @@
+import asyncio
+from typing import Optional
+
+from etria_logger import Gladsheim
+
+from ..domain.enumerate_snapshot.model import EnumerateSnapshot
+from ..infrastructures.settings.infrastructure import SettingsInfrastructure
+from ..repositories.oracle.repository import EnumerateRepository
+
+
+class EnumerateSnapshotService:
+    snapshot = None
+    refresh_task = None
+
+    @classmethod
+    def get_snapshot(cls) -> Optional[EnumerateSnapshot]:
+        return cls.snapshot
+
+    @classmethod
+    async def load(cls) -> EnumerateSnapshot:
+        (
+            activities,
+            countries,
+            states,
+            marital_statuses,
+            nationalities,
+            cities,
+        ) = await asyncio.gather(
+            EnumerateRepository.get_all_activities(),
+            EnumerateRepository.get_all_countries(),
+            EnumerateRepository.get_all_states(),
+            EnumerateRepository.get_all_marital_statuses(),
+            EnumerateRepository.get_all_nationalities(),
+            EnumerateRepository.get_all_cities(),
+        )
+        cls.snapshot = EnumerateSnapshot(
+            activities=activities,
+            countries=countries,
+            states=states,
+            marital_statuses=marital_statuses,
+            nationalities=nationalities,
+            cities=cities,
+        )
+        Gladsheim.info(message="Enumerate snapshot loaded", **cls.snapshot.get_sizes())
+        return cls.snapshot
+
+    @classmethod
+    async def warm_up(cls):
+        if not SettingsInfrastructure.get_settings().enumerate_snapshot_enabled:
+            return
+        try:
+            await cls.load()
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="EnumerateSnapshotService::warm_up::Falling back to database lookups",
+            )
+        cls.start_refresh()
+
+    @classmethod
+    def start_refresh(cls):
+        if cls.refresh_task is None or cls.refresh_task.done():
+            cls.refresh_task = asyncio.create_task(cls._refresh_periodically())
+
+    @classmethod
+    async def stop_refresh(cls):
+        if cls.refresh_task is None:
+            return
+        cls.refresh_task.cancel()
+        try:
+            await cls.refresh_task
+        except asyncio.CancelledError:
+            pass
+        cls.refresh_task = None
+
+    @classmethod
+    async def _refresh_periodically(cls):
+        interval = (
+            SettingsInfrastructure.get_settings().enumerate_snapshot_refresh_interval
+        )
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await cls.load()
+            except Exception as ex:
+                Gladsheim.error(
+                    error=ex,
+                    message="EnumerateSnapshotService::_refresh_periodically::Keeping previous snapshot",
+                )
@@ -0,0 +1,74 @@
+import sys
+from importlib.abc import MetaPathFinder
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+
+class _TimedLoader:
+    def __init__(self, loader, profiler: "ImportProfiler", name: str):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.profiler.enter(self.name)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.profiler.exit()
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    def __init__(self):
+        self.timings: List[Tuple[str, int, float, float]] = []
+        self._stack: List[list] = []
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def enter(self, name: str):
+        self._stack.append([name, perf_counter(), 0.0])
+
+    def exit(self):
+        name, started_at, children = self._stack.pop()
+        cumulative = perf_counter() - started_at
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.timings.append((name, len(self._stack), cumulative - children, cumulative))
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def format_report(self, limit: Optional[int] = None) -> str:
+        timings = self.timings
+        if limit is not None:
+            timings = sorted(timings, key=lambda timing: timing[3], reverse=True)
+            timings = timings[:limit]
+        lines = ["import time: self [us] | cumulative | imported package"]
+        for name, depth, self_time, cumulative in timings:
+            lines.append(
+                f"import time: {self_time * 1e6:9.0f} | {cumulative * 1e6:10.0f} | "
+                f"{'  ' * depth}{name}"
+            )
+        return "\n".join(lines)
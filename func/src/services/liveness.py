@@ -1,8 +1,8 @@
-from decouple import config
 from koh import Koh, KohStatus
 
 from func.src.domain.exceptions.exceptions import ErrorInLiveness, LivenessRejected
 from func.src.domain.user_review.validator import UserUpdateData
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
 
 
 class LivenessService:
@@ -12,7 +12,7 @@ class LivenessService:
         approved, status = await Koh.check_face(
             unique_id,
             liveness.liveness,
-            config("KOH_FEATURE_UPDATE_USER_DATA")
+            SettingsInfrastructure.get_settings().koh_feature_update_user_data
         )
         if status != KohStatus.SUCCESS:
             raise ErrorInLiveness()
@@ -0,0 +1,46 @@
+from typing import List
+
+from ..domain.enums.outbox import OutboxEventType
+from ..domain.outbox.model import OutboxEvent
+from ..domain.user_review.model import UserReviewModel
+from ..infrastructures.settings.infrastructure import SettingsInfrastructure
+
+
+class OutboxService:
+    @staticmethod
+    def is_enabled() -> bool:
+        return SettingsInfrastructure.get_settings().outbox_enabled
+
+    @staticmethod
+    def build_update_registration_data_event(unique_id: str, message: dict) -> dict:
+        outbox_event = OutboxEvent(
+            event_type=OutboxEventType.AUDIT_UPDATE_REGISTRATION_DATA,
+            unique_id=unique_id,
+            payload=message,
+        )
+        return outbox_event.to_document()
+
+    @staticmethod
+    def build_rate_client_risk_event(unique_id: str, message: dict) -> dict:
+        outbox_event = OutboxEvent(
+            event_type=OutboxEventType.AUDIT_RATE_CLIENT_RISK,
+            unique_id=unique_id,
+            payload=message,
+        )
+        return outbox_event.to_document()
+
+    @staticmethod
+    def build_update_queues_events(user_review_model: UserReviewModel) -> List[dict]:
+        message = {"unique_id": user_review_model.unique_id}
+        outbox_events = [
+            OutboxEvent(
+                event_type=event_type,
+                unique_id=user_review_model.unique_id,
+                payload=message,
+            ).to_document()
+            for event_type in (
+                OutboxEventType.IARA_SINACOR_UPDATE,
+                OutboxEventType.IARA_DW_UPDATE,
+            )
+        ]
+        return outbox_events
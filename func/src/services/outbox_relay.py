@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+
+from etria_logger import Gladsheim
+from iara_client import IaraTopics
+
+from ..domain.enums.outbox import OutboxEventType
+from ..domain.exceptions.exceptions import OutboxEventNotDelivered
+from ..domain.settings.model import Settings
+from ..infrastructures.settings.infrastructure import SettingsInfrastructure
+from ..repositories.mongo_db.outbox.repository import OutboxRepository
+from ..services.outbox import OutboxService
+from ..transports.audit.transport import Audit
+from ..transports.iara.transport import IaraTransport
+
+
+class OutboxRelayService:
+    relay_task = None
+
+    @classmethod
+    def start(cls):
+        if not OutboxService.is_enabled():
+            return
+        if cls.relay_task is None or cls.relay_task.done():
+            cls.relay_task = asyncio.create_task(cls._relay_periodically())
+
+    @classmethod
+    async def stop(cls):
+        if cls.relay_task is None:
+            return
+        cls.relay_task.cancel()
+        try:
+            await cls.relay_task
+        except asyncio.CancelledError:
+            pass
+        cls.relay_task = None
+
+    @classmethod
+    async def _relay_periodically(cls):
+        while True:
+            settings = SettingsInfrastructure.get_settings()
+            try:
+                relayed_events = await cls.relay_batch(settings=settings)
+            except Exception as ex:
+                Gladsheim.error(
+                    error=ex,
+                    message="OutboxRelayService::_relay_periodically::Error draining outbox",
+                )
+                relayed_events = 0
+            if not relayed_events:
+                await asyncio.sleep(settings.outbox_relay_interval)
+
+    @classmethod
+    async def relay_batch(cls, settings: Settings = None) -> int:
+        settings = settings or SettingsInfrastructure.get_settings()
+        outbox_events = await OutboxRepository.claim_events(
+            batch_size=settings.outbox_batch_size,
+            lease_seconds=settings.outbox_lease_seconds,
+        )
+        await asyncio.gather(
+            *(
+                cls._relay_event(outbox_event, settings=settings)
+                for outbox_event in outbox_events
+            )
+        )
+        return len(outbox_events)
+
+    @classmethod
+    async def _relay_event(cls, outbox_event: dict, settings: Settings):
+        try:
+            await cls._send_event(outbox_event)
+        except Exception as ex:
+            await cls._handle_failure(outbox_event, ex, settings=settings)
+            return
+        lease_kept = await OutboxRepository.mark_delivered(
+            idempotency_key=outbox_event["_id"],
+            lease_token=outbox_event["lease_token"],
+        )
+        if not lease_kept:
+            cls._warn_lease_lost(outbox_event)
+
+    @staticmethod
+    def _warn_lease_lost(outbox_event: dict):
+        # another relay reclaimed the event after the lease expired and now owns it
+        Gladsheim.warning(
+            message="OutboxRelayService::_warn_lease_lost::Outbox event lease lost",
+            idempotency_key=outbox_event["_id"],
+            event_type=outbox_event.get("event_type"),
+        )
+
+    @staticmethod
+    async def _send_event(outbox_event: dict):
+        senders = {
+            OutboxEventType.AUDIT_UPDATE_REGISTRATION_DATA: (
+                Audit.send_message_log_to_update_registration_data
+            ),
+            OutboxEventType.AUDIT_RATE_CLIENT_RISK: (
+                Audit.send_message_log_to_rate_client_risk
+            ),
+            OutboxEventType.IARA_SINACOR_UPDATE: partial(
+                IaraTransport.send_to_queue, IaraTopics.SINACOR_UPDATE
+            ),
+            OutboxEventType.IARA_DW_UPDATE: partial(
+                IaraTransport.send_to_queue, IaraTopics.DW_UPDATE
+            ),
+        }
+        send = senders[OutboxEventType(outbox_event["event_type"])]
+        if not await send(message=outbox_event["payload"]):
+            raise OutboxEventNotDelivered()
+
+    @classmethod
+    async def _handle_failure(
+        cls, outbox_event: dict, error: Exception, settings: Settings
+    ):
+        idempotency_key = outbox_event["_id"]
+        lease_token = outbox_event["lease_token"]
+        attempts = outbox_event.get("attempts", 1)
+        Gladsheim.error(
+            error=error,
+            message="OutboxRelayService::_handle_failure::Error relaying outbox event",
+            idempotency_key=idempotency_key,
+            event_type=outbox_event.get("event_type"),
+            attempts=attempts,
+        )
+        if attempts >= settings.outbox_max_attempts:
+            lease_kept = await OutboxRepository.mark_failed(
+                idempotency_key=idempotency_key, lease_token=lease_token
+            )
+        else:
+            delay = min(
+                settings.outbox_retry_base_delay * 2 ** (attempts - 1),
+                settings.outbox_retry_max_delay,
+            )
+            lease_kept = await OutboxRepository.schedule_retry(
+                idempotency_key=idempotency_key,
+                lease_token=lease_token,
+                next_attempt_at=datetime.utcnow() + timedelta(seconds=delay),
+            )
+        if not lease_kept:
+            cls._warn_lease_lost(outbox_event)
@@ -7,49 +7,166 @@ from func.src.domain.exceptions.exceptions import (
     InvalidActivity,
     FinancialCapacityNotValid,
 )
+from func.src.domain.enums.enumerate_validation import (
+    EnumerateField,
+    EnumerateValidationMode,
+)
 from func.src.domain.user_enumerate.model import UserEnumerateDataModel
 from func.src.domain.user_review.validator import UserUpdateData
-from func.src.repositories.mongo_db.user.repository import UserRepository
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
 from func.src.repositories.oracle.repository import EnumerateRepository
+from func.src.services.concurrency import ConcurrencyService
+from func.src.services.enumerate_snapshot import EnumerateSnapshotService
+from func.src.services.user_loader import UserDocumentLoader
+
+from typing import List, Optional, Tuple
 
-from typing import List
+invalid_enumeration_exceptions = {
+    EnumerateField.ACTIVITY: InvalidActivity,
+    EnumerateField.STATE: InvalidState,
+    EnumerateField.NATIONALITY: InvalidNationality,
+    EnumerateField.COUNTRY_TAX_RESIDENCE: InvalidCountryAcronym,
+    EnumerateField.MARITAL_STATUS: InvalidMaritalStatus,
+    EnumerateField.ADDRESS_CITY: InvalidCity,
+    EnumerateField.BIRTH_PLACE_CITY: InvalidCity,
+}
 
 
 class UserEnumerateService:
-    def __init__(self, payload_validated: UserUpdateData, unique_id: str):
+    user_document_fields = ("assets.patrimony", "assets.income")
+
+    def __init__(
+        self,
+        payload_validated: UserUpdateData,
+        unique_id: str,
+        user_loader: UserDocumentLoader = None,
+    ):
         self.unique_id = unique_id
+        self.user_loader = user_loader or UserDocumentLoader(
+            unique_id, self.user_document_fields
+        )
         self.user_enumerate_model = UserEnumerateDataModel(
             payload_validated=payload_validated
         )
 
     async def validate_enumerate_params(self):
         activity_code = await self.user_enumerate_model.get_activity()
-        await self._validate_activity(activity_code=activity_code)
         state = await self.user_enumerate_model.get_document_state()
-        await self._validate_state(state=state)
         nationalities = await self.user_enumerate_model.get_nationalities()
-        await self._validate_nationality(nationalities=nationalities)
         countries = await self.user_enumerate_model.get_country_tax_residences()
-        await self._validate_country_acronym(countries=countries)
         marital_code = await self.user_enumerate_model.get_marital_status()
-        await self._validate_marital_status(marital_code=marital_code)
         address_combination = await self.user_enumerate_model.get_combination_address()
-        await self._validate_combination_place(combination_place=address_combination)
         birth_place_combination = (
             await self.user_enumerate_model.get_combination_birth_place()
         )
-        await self._validate_combination_place(
-            combination_place=birth_place_combination
+        if self._is_composite_mode():
+            enumerate_validations = (
+                self._validate_in_single_query(
+                    enumeration_probes=self._build_enumeration_probes(
+                        activity_code=activity_code,
+                        state=state,
+                        nationalities=nationalities,
+                        countries=countries,
+                        marital_code=marital_code,
+                        address_combination=address_combination,
+                        birth_place_combination=birth_place_combination,
+                    )
+                ),
+            )
+        else:
+            enumerate_validations = (
+                self._validate_activity(activity_code=activity_code),
+                self._validate_state(state=state),
+                self._validate_nationality(nationalities=nationalities),
+                self._validate_country_acronym(countries=countries),
+                self._validate_marital_status(marital_code=marital_code),
+                self._validate_combination_place(combination_place=address_combination),
+                self._validate_combination_place(
+                    combination_place=birth_place_combination
+                ),
+            )
+        await ConcurrencyService.gather_fail_fast(
+            *enumerate_validations,
+            self._validate_financial_capacity(
+                user_enumerate_model=self.user_enumerate_model,
+                user_loader=self.user_loader,
+            ),
+            limit=self._get_concurrency_limit(),
         )
-        await self._validate_financial_capacity(
-            user_enumerate_model=self.user_enumerate_model, unique_id=self.unique_id
+
+    @staticmethod
+    def _is_composite_mode() -> bool:
+        validation_mode = (
+            SettingsInfrastructure.get_settings().enumerate_validation_mode
+        )
+        is_composite_mode = (
+            validation_mode == EnumerateValidationMode.COMPOSITE
+            and EnumerateSnapshotService.get_snapshot() is None
         )
+        return is_composite_mode
+
+    @staticmethod
+    def _build_enumeration_probes(
+        activity_code: Optional[int],
+        state: Optional[str],
+        nationalities: Optional[List[int]],
+        countries: Optional[List[str]],
+        marital_code: Optional[int],
+        address_combination: Optional[dict],
+        birth_place_combination: Optional[dict],
+    ) -> List[Tuple[EnumerateField, tuple]]:
+        enumeration_probes = []
+        if activity_code:
+            enumeration_probes.append((EnumerateField.ACTIVITY, (activity_code,)))
+        if state:
+            enumeration_probes.append((EnumerateField.STATE, (state,)))
+        for nationality_code in nationalities or []:
+            enumeration_probes.append((EnumerateField.NATIONALITY, (nationality_code,)))
+        for country in countries or []:
+            enumeration_probes.append(
+                (EnumerateField.COUNTRY_TAX_RESIDENCE, (country,))
+            )
+        if marital_code:
+            enumeration_probes.append((EnumerateField.MARITAL_STATUS, (marital_code,)))
+        for field, combination_place in (
+            (EnumerateField.ADDRESS_CITY, address_combination),
+            (EnumerateField.BIRTH_PLACE_CITY, birth_place_combination),
+        ):
+            if combination_place:
+                enumeration_probes.append(
+                    (
+                        field,
+                        (
+                            combination_place.get("country"),
+                            combination_place.get("state"),
+                            combination_place.get("city"),
+                        ),
+                    )
+                )
+        return enumeration_probes
+
+    @staticmethod
+    async def _validate_in_single_query(
+        enumeration_probes: List[Tuple[EnumerateField, tuple]]
+    ):
+        if not enumeration_probes:
+            return
+        invalid_fields = await EnumerateRepository.get_invalid_enumerations(
+            enumeration_probes=enumeration_probes
+        )
+        for field, _ in enumeration_probes:
+            if field in invalid_fields:
+                raise invalid_enumeration_exceptions[field]()
+
+    @staticmethod
+    def _get_concurrency_limit() -> int:
+        return SettingsInfrastructure.get_settings().enumerate_validation_concurrency
 
     @staticmethod
     async def _validate_financial_capacity(
-        user_enumerate_model: UserEnumerateDataModel, unique_id: str
+        user_enumerate_model: UserEnumerateDataModel, user_loader: UserDocumentLoader
     ):
-        user = await UserRepository.get_user(unique_id=unique_id)
+        user = await user_loader.get_user()
 
         patrimony = user_enumerate_model.get_patrimony()
         if not patrimony:
@@ -69,7 +186,10 @@ class UserEnumerateService:
     async def _validate_activity(activity_code: int):
         if not activity_code:
             return
-        result = await EnumerateRepository.get_activity(activity_code=activity_code)
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            result = snapshot.has_activity(activity_code=activity_code)
+        else:
+            result = await EnumerateRepository.get_activity(activity_code=activity_code)
         if not result:
             raise InvalidActivity()
 
@@ -77,16 +197,27 @@ class UserEnumerateService:
     async def _validate_country_acronym(countries):
         if not countries:
             return
-        for country in countries:
-            result = await EnumerateRepository.get_country(country_acronym=country)
-            if not result:
-                raise InvalidCountryAcronym()
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            missing_countries = [
+                country for country in countries if not snapshot.has_country(country)
+            ]
+        else:
+            missing_countries = await EnumerateRepository.get_missing_countries(
+                country_acronyms=countries
+            )
+        if missing_countries:
+            raise InvalidCountryAcronym()
 
     @staticmethod
     async def _validate_marital_status(marital_code: int):
         if not marital_code:
             return
-        result = await EnumerateRepository.get_marital_status(marital_code=marital_code)
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            result = snapshot.has_marital_status(marital_code=marital_code)
+        else:
+            result = await EnumerateRepository.get_marital_status(
+                marital_code=marital_code
+            )
         if not result:
             raise InvalidMaritalStatus()
 
@@ -94,18 +225,27 @@ class UserEnumerateService:
     async def _validate_nationality(nationalities: List):
         if not nationalities:
             return
-        for nationality_code in nationalities:
-            result = await EnumerateRepository.get_nationality(
-                nationality_code=nationality_code
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            missing_nationalities = [
+                nationality_code
+                for nationality_code in nationalities
+                if not snapshot.has_nationality(nationality_code)
+            ]
+        else:
+            missing_nationalities = await EnumerateRepository.get_missing_nationalities(
+                nationality_codes=nationalities
             )
-            if not result:
-                raise InvalidNationality()
+        if missing_nationalities:
+            raise InvalidNationality()
 
     @staticmethod
     async def _validate_state(state: str):
         if not state:
             return
-        result = await EnumerateRepository.get_state(state=state)
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            result = snapshot.has_state(state=state)
+        else:
+            result = await EnumerateRepository.get_state(state=state)
         if not result:
             raise InvalidState()
 
@@ -113,10 +253,17 @@ class UserEnumerateService:
     async def _validate_combination_place(combination_place: dict):
         if not combination_place:
             return
-        result = await EnumerateRepository.get_city(
-            country=combination_place.get("country"),
-            state=combination_place.get("state"),
-            id_city=combination_place.get("city"),
-        )
+        if snapshot := EnumerateSnapshotService.get_snapshot():
+            result = snapshot.has_city(
+                country=combination_place.get("country"),
+                state=combination_place.get("state"),
+                id_city=combination_place.get("city"),
+            )
+        else:
+            result = await EnumerateRepository.get_city(
+                country=combination_place.get("country"),
+                state=combination_place.get("state"),
+                id_city=combination_place.get("city"),
+            )
         if not result:
             raise InvalidCity()
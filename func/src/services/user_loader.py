@@ -0,0 +1,58 @@
+import asyncio
+from typing import Iterable, Optional
+
+from ..domain.exceptions.exceptions import UserUniqueIdNotExists
+from ..repositories.mongo_db.user.repository import UserRepository
+
+
+class UserDocumentLoader:
+    def __init__(self, unique_id: str, *projections: Iterable[str]):
+        self.unique_id = unique_id
+        self.projection = self._merge_projections(*projections)
+        self._user_future: Optional[asyncio.Future] = None
+        self.read_only = True
+
+    @staticmethod
+    def _merge_projections(*projections: Iterable[str]) -> Optional[dict]:
+        if not projections:
+            return None
+        fields = sorted({field for projection in projections for field in projection})
+        projection = {}
+        for field in fields:
+            covered = any(field.startswith(f"{parent}.") for parent in projection)
+            if not covered:
+                projection[field] = 1
+        return projection
+
+    def load(self) -> asyncio.Future:
+        if self._user_future is None:
+            self._user_future = asyncio.ensure_future(
+                UserRepository.get_user(
+                    unique_id=self.unique_id,
+                    projection=self.projection,
+                    read_only=self.read_only,
+                )
+            )
+            self._user_future.add_done_callback(self._retrieve_result)
+        return self._user_future
+
+    async def get_user(self) -> dict:
+        user = await asyncio.shield(self.load())
+        if not user:
+            raise UserUniqueIdNotExists()
+        return user
+
+    async def close(self):
+        if self._user_future is not None and not self._user_future.done():
+            self._user_future.cancel()
+            await asyncio.gather(self._user_future, return_exceptions=True)
+
+    def invalidate(self):
+        # a stale read caused the conflict, so the reload goes to the write handle
+        self._user_future = None
+        self.read_only = False
+
+    @staticmethod
+    def _retrieve_result(user_future: asyncio.Future):
+        if not user_future.cancelled():
+            user_future.exception()
@@ -1,30 +1,70 @@
+import asyncio
+import random
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 from etria_logger import Gladsheim
 from regis import Regis, RegisResponse
 
 from ..domain.enums.user_review import UserOnboardingStep
+from ..domain.enums.user_update import UserUpdateWriteMode
 from ..domain.exceptions.exceptions import (
-    UserUniqueIdNotExists,
     ErrorToUpdateUser,
     InvalidOnboardingCurrentStep,
     FailedToGetData,
     InconsistentUserData,
+    UserUpdateConflict,
 )
 from ..domain.models.device_info import DeviceInfo
 from ..domain.thebes_answer.model import ThebesAnswer
 from ..domain.user_review.model import UserReviewModel
 from ..domain.user_review.validator import UserUpdateData
+from ..infrastructures.settings.infrastructure import SettingsInfrastructure
 from ..repositories.mongo_db.user.repository import UserRepository
 from ..services.builders.user_registration_update import (
     UpdateCustomerRegistrationBuilder,
 )
+from ..services.outbox import OutboxService
+from ..services.user_loader import UserDocumentLoader
 from ..transports.audit.transport import Audit
 from ..transports.iara.transport import IaraTransport
 from ..transports.onboarding_steps.transport import OnboardingSteps
 
 
 class UserReviewDataService:
+    version_field = "record_date_control.registry_updates.last_registration_data_update"
+    # every field the registration builder and the risk rating read; the critical
+    # risk audit reads the full document on its own, see rate_client_risk
+    user_document_fields = (
+        "address",
+        "assets",
+        "birth_date",
+        "birth_place_city",
+        "birth_place_country",
+        "birth_place_state",
+        "cpf",
+        "email",
+        "expiration_dates",
+        "external_exchange_requirements",
+        "father_name",
+        "gender",
+        "identifier_document",
+        "is_correlated_to_politically_exposed_person",
+        "is_politically_exposed_person",
+        "marital",
+        "mother_name",
+        "name",
+        "nationality",
+        "nick_name",
+        "occupation",
+        "phone",
+        "pld",
+        "record_date_control",
+        "tax_residences",
+        "unique_id",
+        "us_person",
+    )
+
     @staticmethod
     async def check_if_able_to_update(
         payload_validated: UserUpdateData, thebes_answer: ThebesAnswer, jwt: str
@@ -57,7 +97,9 @@ class UserReviewDataService:
             raise InvalidOnboardingCurrentStep()
 
     @staticmethod
-    async def rate_client_risk(user_review_model: UserReviewModel, old_user_data: dict):
+    async def rate_client_risk(
+        user_review_model: UserReviewModel, old_user_data: dict
+    ) -> dict:
         new_user_data = user_review_model.new_user_registration_data
         current_pld_rating = old_user_data.get("pld", {}).get("rating")
         try:
@@ -81,69 +123,217 @@ class UserReviewDataService:
                 f"score: {regis_response.risk_score}"
             )
             Gladsheim.warning(message=message)
+            stored_user_data = await UserRepository.get_user(
+                unique_id=user_review_model.unique_id
+            )
+            user_review_model.add_stored_user_data(stored_user_data or {})
 
         risk_rating_changed = current_pld_rating != regis_response.risk_rating.value
         user_review_model.add_risk_data(
             risk_data=regis_response, risk_rating_changed=risk_rating_changed
         )
 
-        await Audit.record_message_log_to_rate_client_risk(
+        # built before the risk data is merged, so the audit keeps the submitted data
+        risk_audit_message = await Audit.get_message_log_to_rate_client_risk(
             user_review_model=user_review_model
         )
         user_review_model.update_new_data_with_risk_data()
         user_review_model.update_new_data_with_expiration_dates()
+        return risk_audit_message
 
     @classmethod
     async def update_user_data(
-        cls, unique_id: str, payload_validated: dict, device_info: DeviceInfo = None
+        cls,
+        unique_id: str,
+        payload_validated: dict,
+        device_info: DeviceInfo = None,
+        user_loader: UserDocumentLoader = None,
     ):
-        user_data = await UserReviewDataService._get_user_data(unique_id=unique_id)
-        (
-            new_user_registration_data,
-            modified_register_data,
-        ) = UpdateCustomerRegistrationBuilder(
+        user_loader = user_loader or UserDocumentLoader(
+            unique_id, cls.user_document_fields
+        )
+        outbox_enabled = OutboxService.is_enabled()
+        settings = SettingsInfrastructure.get_settings()
+        max_retries = settings.user_update_max_retries
+        for attempt in range(max_retries + 1):
+            try:
+                user_review_model, audit_messages = await cls._apply_user_update(
+                    unique_id=unique_id,
+                    payload_validated=payload_validated,
+                    device_info=device_info,
+                    user_loader=user_loader,
+                    outbox_enabled=outbox_enabled,
+                )
+                break
+            except UserUpdateConflict as ex:
+                Gladsheim.warning(message=ex.msg, unique_id=unique_id, attempt=attempt)
+                user_loader.invalidate()
+                if attempt < max_retries:
+                    await cls._wait_before_retry(
+                        attempt=attempt,
+                        backoff_ms=settings.user_update_retry_backoff_ms,
+                    )
+        else:
+            raise ErrorToUpdateUser()
+
+        if not outbox_enabled:
+            await cls._publish_after_update(user_review_model, *audit_messages)
+
+    @staticmethod
+    async def _wait_before_retry(attempt: int, backoff_ms: float):
+        # full jitter keeps concurrent writers of the same user from retrying in step
+        await asyncio.sleep(random.uniform(0, backoff_ms * 2**attempt) / 1000)
+
+    @staticmethod
+    async def _publish_after_update(
+        user_review_model: UserReviewModel,
+        risk_audit_message: dict,
+        registration_audit_message: dict,
+    ):
+        audit_results = await asyncio.gather(
+            Audit.send_message_log_to_rate_client_risk(message=risk_audit_message),
+            Audit.send_message_log_to_update_registration_data(
+                message=registration_audit_message
+            ),
+            return_exceptions=True,
+        )
+        audit_errors = [
+            result for result in audit_results if isinstance(result, Exception)
+        ]
+        for audit_error in audit_errors:
+            Gladsheim.error(
+                error=audit_error,
+                message="UserReviewDataService::_publish_after_update::Audit not sent",
+                unique_id=user_review_model.unique_id,
+            )
+        # a failed audit must not keep the Sinacor and DW updates from going out
+        published_topics = await IaraTransport.send_to_update_queues(user_review_model)
+        failed_topics = [
+            topic.value
+            for topic, published in published_topics.items()
+            if not published
+        ]
+        if failed_topics:
+            # the user is already written, so the lost messages must be replayed by hand
+            Gladsheim.error(
+                message="UserReviewDataService::_publish_after_update::Iara topics not published",
+                unique_id=user_review_model.unique_id,
+                failed_topics=failed_topics,
+            )
+        if audit_errors:
+            raise audit_errors[0]
+
+    @classmethod
+    async def _apply_user_update(
+        cls,
+        unique_id: str,
+        payload_validated: dict,
+        device_info: Optional[DeviceInfo],
+        user_loader: UserDocumentLoader,
+        outbox_enabled: bool = False,
+    ) -> Tuple[UserReviewModel, Tuple[dict, dict]]:
+        user_data = await UserReviewDataService._get_user_data(user_loader=user_loader)
+        version_filter = cls._get_version_filter(user_data=user_data)
+        registration_builder = UpdateCustomerRegistrationBuilder(
             old_personal_data=user_data,
             new_personal_data=payload_validated,
             unique_id=unique_id,
-        ).build()
+        )
+        (
+            new_user_registration_data,
+            modified_register_data,
+        ) = registration_builder.build()
         user_review_model = UserReviewModel(
             user_review_data=payload_validated,
             unique_id=unique_id,
             modified_register_data=modified_register_data,
             new_user_registration_data=new_user_registration_data,
             device_info=device_info,
+            modified_paths=registration_builder.get_modified_paths(),
         )
 
-        await cls.rate_client_risk(user_review_model, user_data)
-        await Audit.record_message_log_to_update_registration_data(
-            user_review_model=user_review_model
+        risk_audit_message = await cls.rate_client_risk(user_review_model, user_data)
+        registration_audit_message = (
+            await Audit.get_message_log_to_update_registration_data(
+                user_review_model=user_review_model
+            )
         )
+        # nothing is published here: a lost compare-and-set must leave no trace
+        outbox_events = None
+        if outbox_enabled:
+            outbox_events = [
+                OutboxService.build_rate_client_risk_event(
+                    unique_id=unique_id, message=risk_audit_message
+                ),
+                OutboxService.build_update_registration_data_event(
+                    unique_id=unique_id, message=registration_audit_message
+                ),
+                *OutboxService.build_update_queues_events(
+                    user_review_model=user_review_model
+                ),
+            ]
 
         new_user_template = await user_review_model.get_new_user_data()
         await cls._update_user(
             unique_id=unique_id,
             new_user_registration_data=new_user_template,
+            user_review_model=user_review_model,
+            version_filter=version_filter,
+            outbox_events=outbox_events,
         )
-        await IaraTransport.send_to_sinacor_update_queue(user_review_model)
-        await IaraTransport.send_to_drive_wealth_update_queue(user_review_model)
+        return user_review_model, (risk_audit_message, registration_audit_message)
+
+    @classmethod
+    def _get_version_filter(cls, user_data: dict) -> dict:
+        record_date_control = user_data.get("record_date_control") or {}
+        registry_updates = record_date_control.get("registry_updates") or {}
+        version_filter = {
+            cls.version_field: registry_updates.get("last_registration_data_update")
+        }
+        return version_filter
 
     @staticmethod
-    async def _get_user_data(unique_id: str) -> dict:
-        user_data = await UserRepository.get_user(unique_id=unique_id)
-        if not user_data:
-            raise UserUniqueIdNotExists()
+    async def _get_user_data(user_loader: UserDocumentLoader) -> dict:
+        user_data = await user_loader.get_user()
         return user_data
 
     @staticmethod
-    async def _update_user(unique_id: str, new_user_registration_data: dict):
+    def _get_write_mode() -> UserUpdateWriteMode:
+        return SettingsInfrastructure.get_settings().user_update_write_mode
+
+    @classmethod
+    async def _update_user(
+        cls,
+        unique_id: str,
+        new_user_registration_data: dict,
+        user_review_model: UserReviewModel = None,
+        version_filter: dict = None,
+        outbox_events: List[dict] = None,
+    ):
         try:
             new_user_registration_data["record_date_control"]["registry_updates"][
                 "last_registration_data_update"
             ] = datetime.utcnow()
         except KeyError:
             raise InconsistentUserData()
-        user_updated = await UserRepository.update_user(
-            unique_id=unique_id, new_user_registration_data=new_user_registration_data
-        )
+        if user_review_model and cls._get_write_mode() == UserUpdateWriteMode.DIFF:
+            new_user_registration_data = (
+                await user_review_model.get_new_user_data_changes()
+            )
+        if outbox_events is None:
+            user_updated = await UserRepository.update_user(
+                unique_id=unique_id,
+                new_user_registration_data=new_user_registration_data,
+                version_filter=version_filter,
+            )
+        else:
+            user_updated = await UserRepository.update_user_with_outbox(
+                unique_id=unique_id,
+                new_user_registration_data=new_user_registration_data,
+                outbox_events=outbox_events,
+                version_filter=version_filter,
+            )
         if not user_updated.matched_count:
+            if version_filter:
+                raise UserUpdateConflict()
             raise ErrorToUpdateUser()
@@ -0,0 +1,84 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from etria_logger import Gladsheim
+
+from ..infrastructures.http.infrastructure import HttpInfrastructure
+from ..infrastructures.oracle.infrastrucuture import OracleInfrastructure
+from ..repositories.mongo_db.base_repository.base import MongoDbBaseRepository
+from .enumerate_snapshot import EnumerateSnapshotService
+
+
+class WarmUpService:
+    warm_up_task = None
+
+    @staticmethod
+    async def _warm_up_http_client():
+        HttpInfrastructure.get_client()
+
+    @classmethod
+    def _get_steps(cls) -> dict:
+        steps = {
+            "http_client": cls._warm_up_http_client,
+            "mongo": MongoDbBaseRepository.ping,
+            "oracle": OracleInfrastructure.warm_up,
+            "enumerate_snapshot": EnumerateSnapshotService.warm_up,
+        }
+        return steps
+
+    @staticmethod
+    async def _run_step(name: str, step: Callable[[], Awaitable]) -> dict:
+        started_at = perf_counter()
+        success = True
+        try:
+            await step()
+        except Exception as ex:
+            success = False
+            Gladsheim.error(error=ex, message=f"WarmUpService::{name}::Step failed")
+        result = {
+            "step": name,
+            "success": success,
+            "duration_ms": round((perf_counter() - started_at) * 1000, 3),
+        }
+        return result
+
+    @classmethod
+    async def _warm_up(cls) -> dict:
+        started_at = perf_counter()
+        steps = await asyncio.gather(
+            *(cls._run_step(name, step) for name, step in cls._get_steps().items())
+        )
+        report = {
+            "success": all(step["success"] for step in steps),
+            "duration_ms": round((perf_counter() - started_at) * 1000, 3),
+            "steps": steps,
+        }
+        Gladsheim.info(message="Warm-up finished", **report)
+        return report
+
+    @classmethod
+    def start(cls) -> asyncio.Task:
+        if cls.warm_up_task is None:
+            cls.warm_up_task = asyncio.ensure_future(cls._warm_up())
+            cls.warm_up_task.add_done_callback(cls._forget_if_interrupted)
+        return cls.warm_up_task
+
+    @classmethod
+    def _forget_if_interrupted(cls, warm_up_task: asyncio.Task):
+        # a cancelled or crashed warm-up must be retried by the next caller
+        interrupted = warm_up_task.cancelled() or warm_up_task.exception()
+        if interrupted and cls.warm_up_task is warm_up_task:
+            cls.warm_up_task = None
+
+    @classmethod
+    async def warm_up(cls) -> dict:
+        return await asyncio.shield(cls.start())
+
+    @classmethod
+    async def stop(cls):
+        if cls.warm_up_task is None:
+            return
+        cls.warm_up_task.cancel()
+        await asyncio.gather(cls.warm_up_task, return_exceptions=True)
+        cls.warm_up_task = None
@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Tuple
+
+from persephone_client import Persephone
+
+from ...infrastructures.settings.infrastructure import SettingsInfrastructure
+
+
+class AuditPublisher:
+    audit_client = Persephone
+    capacity = None
+    in_flight = set()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return SettingsInfrastructure.get_settings().audit_publisher_enabled
+
+    @classmethod
+    def _get_capacity(cls) -> asyncio.Semaphore:
+        if cls.capacity is None:
+            max_in_flight = SettingsInfrastructure.get_settings().audit_max_in_flight
+            cls.capacity = asyncio.Semaphore(max_in_flight)
+        return cls.capacity
+
+    @classmethod
+    def get_in_flight_count(cls) -> int:
+        return len(cls.in_flight)
+
+    @classmethod
+    def is_saturated(cls) -> bool:
+        return cls._get_capacity().locked()
+
+    @classmethod
+    async def send(
+        cls, topic: str, partition: int, message: dict, schema_name: str
+    ) -> Tuple[bool, Any]:
+        # the client has no multi-message send, so this only bounds concurrent sends
+        await cls._get_capacity().acquire()
+        send_task = asyncio.ensure_future(
+            cls.audit_client.send_to_persephone(
+                topic=topic,
+                partition=partition,
+                message=message,
+                schema_name=schema_name,
+            )
+        )
+        cls.in_flight.add(send_task)
+        send_task.add_done_callback(cls._release)
+        return await asyncio.shield(send_task)
+
+    @classmethod
+    def _release(cls, send_task: asyncio.Future):
+        cls.in_flight.discard(send_task)
+        cls._get_capacity().release()
+        if not send_task.cancelled():
+            send_task.exception()
+
+    @classmethod
+    async def close(cls):
+        await asyncio.gather(*cls.in_flight, return_exceptions=True)
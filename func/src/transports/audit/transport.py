@@ -1,4 +1,3 @@
-from decouple import config
 from etria_logger import Gladsheim
 from nidavellir import Sindri
 from persephone_client import Persephone
@@ -6,49 +5,76 @@ from persephone_client import Persephone
 from ...domain.enums.types import QueueTypes
 from ...domain.exceptions.exceptions import ErrorOnSendAuditLog
 from ...domain.user_review.model import UserReviewModel
+from ...infrastructures.settings.infrastructure import SettingsInfrastructure
+from .publisher import AuditPublisher
 
 
 class Audit:
     audit_client = Persephone
 
-    @classmethod
-    async def record_message_log_to_update_registration_data(
-        cls, user_review_model: UserReviewModel
-    ):
+    @staticmethod
+    async def get_message_log_to_update_registration_data(
+        user_review_model: UserReviewModel,
+    ) -> dict:
         message = (
             await user_review_model.get_audit_template_to_update_registration_data()
         )
         Sindri.dict_to_primitive_types(message)
-        partition = QueueTypes.USER_UPDATE_REGISTER_DATA
-        topic = config("PERSEPHONE_TOPIC_USER")
-        schema_name = config("PERSEPHONE_USER_REVIEW_SCHEMA")
-        (
-            success,
-            status_sent_to_persephone,
-        ) = await cls.audit_client.send_to_persephone(
-            topic=topic,
-            partition=partition,
-            message=message,
-            schema_name=schema_name,
+        return message
+
+    @staticmethod
+    async def get_message_log_to_rate_client_risk(
+        user_review_model: UserReviewModel,
+    ) -> dict:
+        message = await user_review_model.get_audit_template_to_update_risk_data()
+        Sindri.dict_to_primitive_types(message)
+        return message
+
+    @classmethod
+    async def record_message_log_to_update_registration_data(
+        cls, user_review_model: UserReviewModel
+    ):
+        message = await cls.get_message_log_to_update_registration_data(
+            user_review_model=user_review_model
         )
-        if not success:
-            Gladsheim.error(message="Error trying to register audit log")
-            raise ErrorOnSendAuditLog()
-        return True
+        return await cls.send_message_log_to_update_registration_data(message=message)
 
     @classmethod
     async def record_message_log_to_rate_client_risk(
         cls, user_review_model: UserReviewModel
     ):
-        message = await user_review_model.get_audit_template_to_update_risk_data()
-        Sindri.dict_to_primitive_types(message)
-        partition = QueueTypes.USER_UPDATE_RISK_DATA
-        topic = config("PERSEPHONE_TOPIC_USER")
-        schema_name = config("PERSEPHONE_USER_PLD_SCHEMA")
-        (
-            success,
-            status_sent_to_persephone,
-        ) = await cls.audit_client.send_to_persephone(
+        message = await cls.get_message_log_to_rate_client_risk(
+            user_review_model=user_review_model
+        )
+        return await cls.send_message_log_to_rate_client_risk(message=message)
+
+    @classmethod
+    async def send_message_log_to_update_registration_data(cls, message: dict):
+        return await cls._send_message(
+            message=message,
+            partition=QueueTypes.USER_UPDATE_REGISTER_DATA,
+            schema_name=SettingsInfrastructure.get_settings().persephone_user_review_schema,
+        )
+
+    @classmethod
+    async def send_message_log_to_rate_client_risk(cls, message: dict):
+        return await cls._send_message(
+            message=message,
+            partition=QueueTypes.USER_UPDATE_RISK_DATA,
+            schema_name=SettingsInfrastructure.get_settings().persephone_user_pld_schema,
+        )
+
+    @classmethod
+    async def _send_message(
+        cls, message: dict, partition: QueueTypes, schema_name: str
+    ):
+        topic = SettingsInfrastructure.get_settings().persephone_topic_user
+        send_to_persephone = (
+            AuditPublisher.send
+            if AuditPublisher.is_enabled()
+            else cls.audit_client.send_to_persephone
+        )
+        success, status_sent_to_persephone = await send_to_persephone(
             topic=topic,
             partition=partition,
             message=message,
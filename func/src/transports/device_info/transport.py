@@ -1,14 +1,13 @@
 import asyncio
 from http import HTTPStatus
 
-from decouple import config
-from httpx import AsyncClient
-
 from ...domain.exceptions.exceptions import (
     DeviceInfoRequestFailed,
     DeviceInfoNotSupplied,
 )
 from ...domain.models.device_info import DeviceInfo
+from ...infrastructures.http.infrastructure import HttpInfrastructure
+from ...infrastructures.settings.infrastructure import SettingsInfrastructure
 
 
 class DeviceSecurity:
@@ -17,12 +16,13 @@ class DeviceSecurity:
         if not device_info:
             raise DeviceInfoNotSupplied()
         body = {"deviceInfo": device_info}
-        async with AsyncClient() as httpx_client:
-            request_result = await httpx_client.post(
-                config("DEVICE_SECURITY_DECRYPT_DEVICE_INFO_URL"), json=body
-            )
-            if request_result.status_code != HTTPStatus.OK:
-                raise DeviceInfoRequestFailed()
+        httpx_client = HttpInfrastructure.get_client()
+        request_result = await httpx_client.post(
+            SettingsInfrastructure.get_settings().device_security_decrypt_device_info_url,
+            json=body,
+        )
+        if request_result.status_code != HTTPStatus.OK:
+            raise DeviceInfoRequestFailed()
         device_info_decrypted = request_result.json().get("deviceInfo")
         return device_info_decrypted
 
@@ -31,12 +31,13 @@ class DeviceSecurity:
         if not device_info:
             raise DeviceInfoNotSupplied()
         body = {"deviceInfo": device_info}
-        async with AsyncClient() as httpx_client:
-            request_result = await httpx_client.post(
-                config("DEVICE_SECURITY_DEVICE_ID_URL"), json=body
-            )
-            if request_result.status_code != HTTPStatus.OK:
-                raise DeviceInfoRequestFailed()
+        httpx_client = HttpInfrastructure.get_client()
+        request_result = await httpx_client.post(
+            SettingsInfrastructure.get_settings().device_security_device_id_url,
+            json=body,
+        )
+        if request_result.status_code != HTTPStatus.OK:
+            raise DeviceInfoRequestFailed()
         device_id = request_result.json().get("deviceID")
         return device_id
 
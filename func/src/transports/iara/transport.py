@@ -1,4 +1,8 @@
+import asyncio
+from typing import Awaitable, Dict
+
 from ...domain.user_review.model import UserReviewModel
+from ...infrastructures.settings.infrastructure import SettingsInfrastructure
 
 from etria_logger import Gladsheim
 from iara_client import Iara, IaraTopics
@@ -6,7 +10,7 @@ from iara_client import Iara, IaraTopics
 
 class IaraTransport:
     @staticmethod
-    async def send_to_sinacor_update_queue(user_model: UserReviewModel):
+    async def send_to_sinacor_update_queue(user_model: UserReviewModel) -> bool:
         message = {"unique_id": user_model.unique_id}
         topic = IaraTopics.SINACOR_UPDATE
 
@@ -19,9 +23,10 @@ class IaraTransport:
                 message=f"Failed to send user to queue of Sinacor account update",
                 status_sent_to_iara=status_sent_to_iara,
             )
+        return success
 
     @staticmethod
-    async def send_to_drive_wealth_update_queue(user_model: UserReviewModel):
+    async def send_to_drive_wealth_update_queue(user_model: UserReviewModel) -> bool:
         message = {"unique_id": user_model.unique_id}
         topic = IaraTopics.DW_UPDATE
 
@@ -34,3 +39,60 @@ class IaraTransport:
                 message=f"Failed to send user to queue of DriveWealth account update",
                 status_sent_to_iara=status_sent_to_iara,
             )
+        return success
+
+    @staticmethod
+    async def send_to_queue(topic: IaraTopics, message: dict) -> bool:
+        success, status_sent_to_iara = await Iara.send_to_iara(
+            message=message,
+            topic=topic,
+        )
+        if not success:
+            Gladsheim.error(
+                message=f"Failed to send message to queue {topic}",
+                status_sent_to_iara=status_sent_to_iara,
+            )
+        return success
+
+    @classmethod
+    async def send_to_update_queues(
+        cls, user_model: UserReviewModel
+    ) -> Dict[IaraTopics, bool]:
+        settings = SettingsInfrastructure.get_settings()
+        publishes = {
+            IaraTopics.SINACOR_UPDATE: (
+                cls.send_to_sinacor_update_queue(user_model),
+                settings.iara_sinacor_update_timeout or settings.iara_send_timeout,
+            ),
+            IaraTopics.DW_UPDATE: (
+                cls.send_to_drive_wealth_update_queue(user_model),
+                settings.iara_dw_update_timeout or settings.iara_send_timeout,
+            ),
+        }
+        results = await asyncio.gather(
+            *(
+                cls._publish_with_timeout(publish=publish, topic=topic, timeout=timeout)
+                for topic, (publish, timeout) in publishes.items()
+            )
+        )
+        return dict(zip(publishes, results))
+
+    @staticmethod
+    async def _publish_with_timeout(
+        publish: Awaitable[bool], topic: IaraTopics, timeout: float
+    ) -> bool:
+        try:
+            return bool(await asyncio.wait_for(publish, timeout=timeout))
+        except asyncio.TimeoutError:
+            Gladsheim.error(
+                message="IaraTransport::_publish_with_timeout::Timed out sending to queue",
+                topic=topic,
+                timeout=timeout,
+            )
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="IaraTransport::_publish_with_timeout::Error sending to queue",
+                topic=topic,
+            )
+        return False
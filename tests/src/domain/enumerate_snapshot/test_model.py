@@ -0,0 +1,93 @@
+from func.src.domain.enumerate_snapshot.model import EnumerateSnapshot
+
+snapshot = EnumerateSnapshot(
+    activities=[(101,), (102.0,)],
+    countries=[("BRA",), ("USA",)],
+    states=[("SP",), ("RJ ",)],
+    marital_statuses=[(1,)],
+    nationalities=[(1,), (2,)],
+    cities=[("BRA", "SP", 5150), ("BRA", "RJ", 3241), ("BRA", "SP", None)],
+)
+
+
+def test_has_activity():
+    assert snapshot.has_activity(activity_code=101) is True
+    assert snapshot.has_activity(activity_code=102) is True
+    assert snapshot.has_activity(activity_code=999) is False
+
+
+def test_has_country():
+    assert snapshot.has_country(country_acronym="BRA") is True
+    assert snapshot.has_country(country_acronym="ARG") is False
+
+
+def test_has_state():
+    assert snapshot.has_state(state="RJ") is True
+    assert snapshot.has_state(state="XX") is False
+
+
+def test_has_marital_status():
+    assert snapshot.has_marital_status(marital_code=1) is True
+    assert snapshot.has_marital_status(marital_code=None) is False
+
+
+def test_has_nationality():
+    assert snapshot.has_nationality(nationality_code=2) is True
+    assert snapshot.has_nationality(nationality_code=3) is False
+
+
+def test_has_city():
+    assert snapshot.has_city(country="BRA", state="SP", id_city=5150) is True
+    assert snapshot.has_city(country="BRA", state="RJ", id_city=5150) is False
+    assert snapshot.has_city(country="USA", state="SP", id_city=5150) is False
+    assert snapshot.has_city(country="BRA", state="SP", id_city=None) is False
+
+
+def test_lookups_strip_input_like_stored_keys():
+    assert snapshot.has_country(country_acronym="BRA ") is True
+    assert snapshot.has_state(state=" SP") is True
+    assert snapshot.has_city(country="BRA ", state="RJ ", id_city=3241) is True
+
+
+def test_get_sizes():
+    assert snapshot.get_sizes() == {
+        "activities": 2,
+        "countries": 2,
+        "states": 2,
+        "marital_statuses": 1,
+        "nationalities": 2,
+        "cities": 2,
+    }
+
+
+def test_null_columns_and_lookups():
+    snapshot_with_nulls = EnumerateSnapshot(
+        activities=[],
+        countries=[("BRA",), (None,)],
+        states=[(None,)],
+        marital_statuses=[],
+        nationalities=[],
+        cities=[(None, "SP", 1), ("BRA", None, 2)],
+    )
+    assert snapshot_with_nulls.has_country(country_acronym="BRA") is True
+    assert snapshot_with_nulls.has_country(country_acronym=None) is False
+    assert snapshot_with_nulls.has_state(state=None) is False
+    assert snapshot_with_nulls.has_city(country="BRA", state=None, id_city=2) is True
+    assert snapshot_with_nulls.get_sizes()["countries"] == 1
+
+
+def test_city_ids_outside_the_packed_range_are_rejected():
+    snapshot_with_large_ids = EnumerateSnapshot(
+        activities=[],
+        countries=[],
+        states=[],
+        marital_statuses=[],
+        nationalities=[],
+        cities=[("BRA", "SP", 1), ("BRA", "RJ", -1), ("BRA", "RJ", 1 << 32)],
+    )
+    assert snapshot_with_large_ids.has_city(country="BRA", state="SP", id_city=1)
+    assert not snapshot_with_large_ids.has_city(
+        country="BRA", state="SP", id_city=(1 << 32) + 1
+    )
+    assert not snapshot_with_large_ids.has_city(country="BRA", state="RJ", id_city=-1)
+    assert snapshot_with_large_ids.get_sizes()["cities"] == 1
@@ -0,0 +1,29 @@
+from func.src.domain.enums.outbox import OutboxEventStatus, OutboxEventType
+from func.src.domain.outbox.model import OutboxEvent
+
+
+def test_to_document():
+    outbox_event = OutboxEvent(
+        event_type=OutboxEventType.IARA_DW_UPDATE,
+        unique_id="unique_id",
+        payload={"unique_id": "unique_id"},
+        idempotency_key="key",
+    )
+    document = outbox_event.to_document()
+    assert document["_id"] == "key"
+    assert document["event_type"] == "iara_dw_update"
+    assert document["status"] == OutboxEventStatus.PENDING.value
+    assert document["attempts"] == 0
+    assert document["next_attempt_at"] == document["created_at"]
+
+
+def test_idempotency_key_is_generated():
+    first_event, second_event = (
+        OutboxEvent(
+            event_type=OutboxEventType.AUDIT_RATE_CLIENT_RISK,
+            unique_id="unique_id",
+            payload={},
+        )
+        for _ in range(2)
+    )
+    assert first_event.idempotency_key != second_event.idempotency_key
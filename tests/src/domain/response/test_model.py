@@ -8,3 +8,11 @@ def test_instance(mocked_dumps):
     model = ResponseModel(dummy_value, dummy_value)
     assert model.message is None
     assert model.result is None
+
+
+def test_build_raw_response():
+    model = ResponseModel(success=True, code=0, message="ok")
+    status, headers, body = model.build_raw_response(status=200)
+    assert status == 200
+    assert headers == [("content-type", "application/json")]
+    assert body == model.response.encode()
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+from json import loads
+
+from func.src.domain.enums.code import InternalCode
+from func.src.domain.exceptions.exceptions import (
+    BrAccountIsBlocked,
+    ErrorOnGetAccountBrIsBlocked,
+    LivenessRejected,
+)
+from func.src.domain.response.registry import ResponseRegistry
+
+
+def test_get_success_response():
+    status, headers, body = ResponseRegistry.get_success_response()
+    assert status == HTTPStatus.OK
+    assert headers == [("content-type", "application/json")]
+    assert loads(body) == {
+        "result": None,
+        "message": "User data successfully updated",
+        "success": True,
+        "code": InternalCode.SUCCESS,
+    }
+
+
+def test_get_error_response():
+    status, _, body = ResponseRegistry.get_error_response(BrAccountIsBlocked())
+    assert status == HTTPStatus.UNAUTHORIZED
+    assert loads(body)["message"] == "Account br is blocked"
+    assert loads(body)["code"] == InternalCode.ACCOUNT_BR_IS_BLOCKED
+
+
+def test_error_responses_are_encoded_once():
+    first_response = ResponseRegistry.get_error_response(LivenessRejected())
+    second_response = ResponseRegistry.get_error_response(LivenessRejected())
+    assert first_response is second_response
+
+
+def test_get_error_response_shares_grouped_exceptions():
+    response = ResponseRegistry.get_error_response(ErrorOnGetAccountBrIsBlocked())
+    assert loads(response[2])["message"] == "Fail to get unique_id"
+
+
+def test_get_error_response_follows_mro():
+    class DummyValueError(ValueError):
+        pass
+
+    status, _, body = ResponseRegistry.get_error_response(DummyValueError())
+    assert status == HTTPStatus.BAD_REQUEST
+    assert loads(body)["message"] == "Invalid params"
+
+
+def test_get_error_response_for_unknown_exception():
+    class DummyError(Exception):
+        pass
+
+    status, _, body = ResponseRegistry.get_error_response(DummyError())
+    assert status == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert loads(body)["message"] == "Unexpected error occurred"
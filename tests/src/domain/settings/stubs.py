@@ -0,0 +1,20 @@
+from func.src.domain.settings.model import Settings
+
+stub_required_env = {
+    "API_KEY": "api_key",
+    "KOH_FEATURE_UPDATE_USER_DATA": "koh_feature",
+    "DEFAULT_PRECISION_VALUE": "1",
+    "MONGODB_DATABASE_NAME": "database",
+    "MONGODB_USER_COLLECTION": "users",
+    "PERSEPHONE_TOPIC_USER": "topic",
+    "PERSEPHONE_USER_REVIEW_SCHEMA": "review_schema",
+    "PERSEPHONE_USER_PLD_SCHEMA": "pld_schema",
+    "ONBOARDING_STEPS_BR_URL": "http://onboarding/br",
+    "ONBOARDING_STEPS_US_URL": "http://onboarding/us",
+    "DEVICE_SECURITY_DECRYPT_DEVICE_INFO_URL": "http://device/decrypt",
+    "DEVICE_SECURITY_DEVICE_ID_URL": "http://device/id",
+}
+
+stub_settings = Settings(
+    **{name.lower(): value for name, value in stub_required_env.items()}
+)
@@ -0,0 +1,85 @@
+import pytest
+from decouple import UndefinedValueError
+from pydantic import ValidationError
+
+from func.src.domain.enums.user_update import UserUpdateWriteMode
+from func.src.domain.settings.model import Settings
+from tests.src.domain.settings.stubs import stub_required_env, stub_settings
+
+
+def _source(values: dict):
+    def _get(name, **kwargs):
+        if name in values:
+            return values[name]
+        if "default" in kwargs:
+            return kwargs["default"]
+        raise UndefinedValueError(name)
+
+    return _get
+
+
+def test_from_env():
+    env = {
+        **stub_required_env,
+        "USER_UPDATE_MAX_RETRIES": "5",
+        "USER_UPDATE_WRITE_MODE": "diff",
+        "AUDIT_PUBLISHER_ENABLED": "True",
+    }
+    settings = Settings.from_env(source=_source(env))
+    assert settings.default_precision_value == 1.0
+    assert settings.user_update_max_retries == 5
+    assert settings.user_update_write_mode == UserUpdateWriteMode.DIFF
+    assert settings.audit_publisher_enabled is True
+    assert settings.audit_max_in_flight == 1000
+    assert settings.iara_dw_update_timeout is None
+
+
+def test_write_mode_defaults_to_full():
+    assert stub_settings.user_update_write_mode == UserUpdateWriteMode.FULL
+
+
+def test_from_env_without_required_setting():
+    env = dict(stub_required_env)
+    env.pop("API_KEY")
+    with pytest.raises(UndefinedValueError):
+        Settings.from_env(source=_source(env))
+
+
+def test_from_env_with_invalid_setting():
+    env = {**stub_required_env, "USER_UPDATE_WRITE_MODE": "partial"}
+    with pytest.raises(ValidationError):
+        Settings.from_env(source=_source(env))
+
+
+def test_outbox_requires_collection():
+    with pytest.raises(ValidationError):
+        Settings(**{**stub_settings.dict(), "outbox_enabled": True})
+
+
+def test_settings_are_immutable():
+    with pytest.raises(TypeError):
+        stub_settings.api_key = "other"
+
+
+@pytest.mark.parametrize("write_concern,expected", [("1", 1), ("majority", "majority")])
+def test_from_env_with_write_concern(write_concern, expected):
+    env = {**stub_required_env, "MONGODB_WRITE_CONCERN": write_concern}
+    settings = Settings.from_env(source=_source(env))
+    assert settings.mongodb_write_concern == expected
+
+
+def test_from_env_with_pool_settings():
+    env = {
+        **stub_required_env,
+        "MONGODB_MAX_POOL_SIZE": "50",
+        "MONGODB_COMPRESSORS": "zstd,snappy",
+        "ORACLE_POOL_MAX": "8",
+        "ORACLE_STATEMENT_CACHE_SIZE": "50",
+    }
+    settings = Settings.from_env(source=_source(env))
+    assert settings.mongodb_max_pool_size == 50
+    assert settings.mongodb_min_pool_size is None
+    assert settings.mongodb_compressors == "zstd,snappy"
+    assert settings.oracle_pool_min == 2
+    assert settings.oracle_pool_max == 8
+    assert settings.oracle_statement_cache_size == 50
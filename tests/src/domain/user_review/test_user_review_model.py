@@ -198,3 +198,74 @@ async def test_get_templates_without_device_id():
         "validations": stub.risk_data.risk_validations.to_dict(),
     }
     assert result == expected_result
+
+
+@pytest.mark.asyncio
+async def test_get_new_user_data_changes():
+    model_stub = UserReviewModel(
+        user_review_data={},
+        unique_id="unique_id",
+        modified_register_data={},
+        new_user_registration_data={
+            "_id": "id",
+            "name": "name",
+            "address": {"city": 1, "number": "10"},
+            "marital": {"spouse": {"cpf": "cpf", "name": "spouse"}},
+            "pld": {"rating": "LOW_RISK", "score": 1},
+            "expiration_dates": {"suitability": 1, "register": 1},
+            "record_date_control": {
+                "current_pld_risk_rating_defined_in": 1,
+                "registry_updates": {"last_registration_data_update": 2},
+                "created_at": 0,
+            },
+        },
+        device_info=None,
+        modified_paths=[
+            ("address", "number"),
+            ("marital", "spouse", "cpf"),
+            ("marital", "spouse"),
+        ],
+    )
+    result = await model_stub.get_new_user_data_changes()
+    assert result == {
+        "address.number": "10",
+        "expiration_dates": {"suitability": 1, "register": 1},
+        "marital.spouse": {"cpf": "cpf", "name": "spouse"},
+        "pld": {"rating": "LOW_RISK", "score": 1},
+        "record_date_control.current_pld_risk_rating_defined_in": 1,
+        "record_date_control.registry_updates.last_registration_data_update": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_new_user_data_changes_with_null_parent():
+    model_stub = UserReviewModel(
+        user_review_data={},
+        unique_id="unique_id",
+        modified_register_data={},
+        new_user_registration_data={
+            "address": None,
+            "marital": {"spouse": None},
+            "pld": {"rating": "LOW_RISK", "score": 1},
+            "expiration_dates": {"suitability": 1, "register": 1},
+            "record_date_control": {
+                "current_pld_risk_rating_defined_in": 1,
+                "registry_updates": {"last_registration_data_update": 2},
+            },
+        },
+        device_info=None,
+        modified_paths=[
+            ("address", "city"),
+            ("address", "number"),
+            ("marital", "spouse", "cpf"),
+        ],
+    )
+    result = await model_stub.get_new_user_data_changes()
+    assert result == {
+        "address": None,
+        "expiration_dates": {"suitability": 1, "register": 1},
+        "marital.spouse": None,
+        "pld": {"rating": "LOW_RISK", "score": 1},
+        "record_date_control.current_pld_risk_rating_defined_in": 1,
+        "record_date_control.registry_updates.last_registration_data_update": 2,
+    }
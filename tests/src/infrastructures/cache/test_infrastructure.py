@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+from func.src.infrastructures.cache.infrastructure import TtlCache
+
+dummy_key = ("sql", ("filter",))
+dummy_rows = [(1,)]
+
+
+@patch("func.src.infrastructures.cache.infrastructure.monotonic", return_value=0)
+def test_get_cached_value(mocked_clock):
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=10)
+    cache.set(dummy_key, dummy_rows)
+    found, value = cache.get(dummy_key)
+    assert found is True
+    assert value == dummy_rows
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_get_missing_value():
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=10)
+    found, value = cache.get(dummy_key)
+    assert found is False
+    assert value is None
+    assert cache.get_stats()["misses"] == 1
+
+
+@patch("func.src.infrastructures.cache.infrastructure.monotonic")
+def test_get_expired_value(mocked_clock):
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=10)
+    mocked_clock.return_value = 0
+    cache.set(dummy_key, dummy_rows)
+    mocked_clock.return_value = 10
+    found, value = cache.get(dummy_key)
+    assert found is False
+    assert cache.get_stats()["size"] == 0
+
+
+@patch("func.src.infrastructures.cache.infrastructure.monotonic")
+def test_negative_result_uses_negative_ttl(mocked_clock):
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=10)
+    mocked_clock.return_value = 0
+    cache.set(dummy_key, [])
+    mocked_clock.return_value = 0.5
+    assert cache.get(dummy_key) == (True, [])
+    mocked_clock.return_value = 1
+    assert cache.get(dummy_key) == (False, None)
+
+
+def test_negative_result_not_cached_when_disabled():
+    cache = TtlCache(ttl=10, negative_ttl=0, max_size=10)
+    cache.set(dummy_key, [])
+    assert cache.get_stats()["size"] == 0
+
+
+def test_evict_least_recently_used():
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=2)
+    cache.set("first", dummy_rows)
+    cache.set("second", dummy_rows)
+    cache.get("first")
+    cache.set("third", dummy_rows)
+    assert cache.get("second") == (False, None)
+    assert cache.get("first") == (True, dummy_rows)
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_clear():
+    cache = TtlCache(ttl=10, negative_ttl=1, max_size=2)
+    cache.set(dummy_key, dummy_rows)
+    cache.clear()
+    assert cache.get_stats()["size"] == 0
@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+
+from func.src.infrastructures.http.infrastructure import HttpInfrastructure
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from tests.src.domain.settings.stubs import stub_settings
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_get_client_is_shared(mocked_settings):
+    client = HttpInfrastructure.get_client()
+    assert isinstance(client, AsyncClient)
+    assert HttpInfrastructure.get_client() is client
+    await HttpInfrastructure.close_client()
+    assert client.is_closed
+    assert HttpInfrastructure.client is None
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_get_client_recreates_closed_client(mocked_settings):
+    client = HttpInfrastructure.get_client()
+    await client.aclose()
+    new_client = HttpInfrastructure.get_client()
+    assert new_client is not client
+    await HttpInfrastructure.close_client()
+
+
+@pytest.mark.asyncio
+async def test_close_client_without_client():
+    HttpInfrastructure.client = None
+    await HttpInfrastructure.close_client()
+    assert HttpInfrastructure.client is None
+
+
+@pytest.mark.asyncio
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(
+        update={"http_client_timeout": 2.0, "http_client_connect_timeout": 1.0}
+    ),
+)
+async def test_get_client_uses_settings(mocked_settings):
+    client = HttpInfrastructure.get_client()
+    assert client.timeout.read == 2.0
+    assert client.timeout.connect == 1.0
+    await HttpInfrastructure.close_client()
@@ -1,26 +1,95 @@
 # OUTSIDE LIBRARIES
 from func.src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from func.src.infrastructures.mongo_db.pool_listener import MongoPoolStatsListener
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from tests.src.domain.settings.stubs import stub_settings
 from unittest.mock import patch, MagicMock
 from decouple import AutoConfig
 from motor import motor_asyncio
+import pytest
 
 
 dummy_env = "dummy env"
 
 
-@patch.object(AutoConfig, "__call__", return_value=dummy_env)
-def test_get_client(mocked_env, monkeypatch):
+def _config_from(values: dict):
+    def _config(key, default=None, **_):
+        return values.get(key, default)
+
+    return _config
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    yield
+    MongoDBInfrastructure.client = None
+    MongoDBInfrastructure.pool_listener = None
+
+
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+@patch.object(
+    AutoConfig,
+    "__call__",
+    side_effect=_config_from({"MONGO_CONNECTION_URL": dummy_env}),
+)
+def test_get_client(mocked_env, mocked_settings, monkeypatch):
     dummy_connection = "dummy connection"
     mock_connection = MagicMock(return_value=dummy_connection)
     monkeypatch.setattr(motor_asyncio, "AsyncIOMotorClient", mock_connection)
 
     new_connection_created = MongoDBInfrastructure.get_client()
     assert new_connection_created == dummy_connection
-    mock_connection.assert_called_once_with(dummy_env)
-    mocked_env.assert_called_once()
+    mock_connection.assert_called_once_with(
+        dummy_env, event_listeners=[MongoDBInfrastructure.pool_listener]
+    )
+    assert isinstance(MongoDBInfrastructure.pool_listener, MongoPoolStatsListener)
+    calls = mocked_env.call_count
 
     reused_client = MongoDBInfrastructure.get_client()
     assert reused_client == new_connection_created
-    mock_connection.assert_called_once_with(dummy_env)
-    mocked_env.assert_called_once()
-    MongoDBInfrastructure.client = None
+    mock_connection.assert_called_once()
+    assert mocked_env.call_count == calls
+
+
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(
+        update={
+            "mongodb_max_pool_size": 50,
+            "mongodb_min_pool_size": 5,
+            "mongodb_wait_queue_timeout_ms": 2000,
+            "mongodb_compressors": "zstd,snappy",
+            "mongodb_app_name": "update-user-data",
+        }
+    ),
+)
+@patch.object(
+    AutoConfig,
+    "__call__",
+    side_effect=_config_from({"MONGO_CONNECTION_URL": dummy_env}),
+)
+def test_get_client_with_pool_options(mocked_env, mocked_settings, monkeypatch):
+    mock_connection = MagicMock()
+    monkeypatch.setattr(motor_asyncio, "AsyncIOMotorClient", mock_connection)
+
+    MongoDBInfrastructure.get_client()
+    mock_connection.assert_called_once_with(
+        dummy_env,
+        event_listeners=[MongoDBInfrastructure.pool_listener],
+        maxPoolSize=50,
+        minPoolSize=5,
+        waitQueueTimeoutMS=2000,
+        compressors="zstd,snappy",
+        appname="update-user-data",
+    )
+
+
+def test_get_pool_stats_without_client():
+    assert MongoDBInfrastructure.get_pool_stats() == {}
+
+
+def test_get_pool_stats():
+    MongoDBInfrastructure.pool_listener = MagicMock()
+    MongoDBInfrastructure.pool_listener.get_stats.return_value = {"stats": 1}
+    assert MongoDBInfrastructure.get_pool_stats() == {"stats": 1}
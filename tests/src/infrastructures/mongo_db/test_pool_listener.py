@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from func.src.infrastructures.mongo_db.pool_listener import MongoPoolStatsListener
+
+address = ("localhost", 27017)
+event = SimpleNamespace(address=address)
+
+
+def test_get_stats_tracks_connections():
+    listener = MongoPoolStatsListener()
+    listener.connection_created(event)
+    listener.connection_created(event)
+    listener.connection_check_out_started(event)
+    listener.connection_checked_out(event)
+    listener.connection_check_out_started(event)
+
+    assert listener.get_stats() == {
+        "localhost:27017": {
+            "open": 2,
+            "checked_out": 1,
+            "available": 1,
+            "wait_queue": 1,
+        }
+    }
+
+
+def test_get_stats_after_check_in_and_failure():
+    listener = MongoPoolStatsListener()
+    listener.connection_created(event)
+    listener.connection_check_out_started(event)
+    listener.connection_checked_out(event)
+    listener.connection_checked_in(event)
+    listener.connection_check_out_started(event)
+    listener.connection_check_out_failed(event)
+    listener.connection_closed(event)
+
+    assert listener.get_stats() == {
+        "localhost:27017": {
+            "open": 0,
+            "checked_out": 0,
+            "available": 0,
+            "wait_queue": 0,
+        }
+    }
+
+
+def test_pool_closed_drops_address():
+    listener = MongoPoolStatsListener()
+    listener.connection_created(event)
+    listener.pool_closed(event)
+    assert listener.get_stats() == {}
@@ -1,42 +1,213 @@
-from unittest.mock import patch, AsyncMock
-
-import cx_Oracle_async
-import pytest
-from decouple import AutoConfig
-
-from func.src.infrastructures.oracle.infrastrucuture import OracleInfrastructure
-
-dummy_env = "env"
-dummy_connection = "dummy connection"
-
-
-@pytest.mark.asyncio
-@patch.object(
-    cx_Oracle_async, "create_pool", side_effect=AsyncMock(return_value=dummy_connection)
-)
-@patch.object(AutoConfig, "__call__", return_value=dummy_env)
-async def test_get_pool(mocked_env, mock_connection):
-    new_connection_created = await OracleInfrastructure._get_pool()
-    assert new_connection_created == dummy_connection
-    mock_connection.assert_called_once_with(
-        dsn=dummy_env,
-        user=dummy_env,
-        password=dummy_env,
-        min=2,
-        max=100,
-        increment=1,
-    )
-    mocked_env.assert_called()
-
-    reused_client = await OracleInfrastructure._get_pool()
-    assert reused_client == new_connection_created
-    mock_connection.assert_called_once_with(
-        dsn=dummy_env,
-        user=dummy_env,
-        password=dummy_env,
-        min=2,
-        max=100,
-        increment=1,
-    )
-    mocked_env.assert_called()
-    OracleInfrastructure.client = None
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import cx_Oracle_async
+import pytest
+from decouple import AutoConfig
+
+from func.src.infrastructures.oracle.infrastrucuture import OracleInfrastructure
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from tests.src.domain.settings.stubs import stub_settings
+
+dummy_env = "env"
+
+
+def _config_from(values: dict):
+    def _config(key, default=None, **_):
+        return values.get(key, default)
+
+    return _config
+
+
+def _build_pool(min_sessions: int = 2) -> MagicMock:
+    pool = MagicMock()
+    pool._pool.min = min_sessions
+    pool._pool.max = 10
+    pool._pool.opened = min_sessions
+    pool._pool.busy = 0
+    connection = MagicMock()
+    connection.ping = AsyncMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=connection)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    yield
+    OracleInfrastructure.pool = None
+    OracleInfrastructure.pool_future = None
+    OracleInfrastructure.acquire_count = 0
+    OracleInfrastructure.acquire_wait_ms_total = 0.0
+    OracleInfrastructure.acquire_wait_ms_max = 0.0
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+@patch.object(AutoConfig, "__call__", side_effect=_config_from({}))
+async def test_get_pool(mocked_env, mocked_settings):
+    dummy_pool = _build_pool()
+    with patch.object(
+        cx_Oracle_async, "create_pool", side_effect=AsyncMock(return_value=dummy_pool)
+    ) as mock_connection:
+        new_connection_created = await OracleInfrastructure._get_pool()
+        reused_client = await OracleInfrastructure._get_pool()
+
+    assert new_connection_created == dummy_pool
+    assert reused_client == new_connection_created
+    mock_connection.assert_called_once_with(
+        dsn=None,
+        user=None,
+        password=None,
+        min=2,
+        max=100,
+        increment=1,
+        timeout=0,
+    )
+    assert dummy_pool._pool.stmtcachesize == 20
+    mocked_env.assert_called()
+
+
+@pytest.mark.asyncio
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(
+        update={
+            "oracle_pool_min": 4,
+            "oracle_pool_max": 8,
+            "oracle_pool_increment": 2,
+            "oracle_pool_wait_timeout_ms": 500,
+            "oracle_statement_cache_size": 50,
+        }
+    ),
+)
+@patch.object(
+    AutoConfig,
+    "__call__",
+    side_effect=_config_from(
+        {
+            "ORACLE_CONNECTION_STRING": dummy_env,
+            "ORACLE_USER": dummy_env,
+            "ORACLE_PASSWORD": dummy_env,
+        }
+    ),
+)
+async def test_get_pool_with_options(mocked_env, mocked_settings):
+    dummy_pool = _build_pool()
+    with patch.object(
+        cx_Oracle_async, "create_pool", side_effect=AsyncMock(return_value=dummy_pool)
+    ) as mock_connection:
+        await OracleInfrastructure._get_pool()
+
+    _, kwargs = mock_connection.call_args
+    assert kwargs["min"] == 4
+    assert kwargs["max"] == 8
+    assert kwargs["increment"] == 2
+    assert kwargs["waitTimeout"] == 500
+    assert "getmode" in kwargs
+    assert dummy_pool._pool.stmtcachesize == 50
+
+
+@pytest.mark.asyncio
+async def test_get_pool_retries_after_failure():
+    dummy_pool = _build_pool()
+    create_pool = AsyncMock(side_effect=[ValueError(), dummy_pool])
+    with patch.object(OracleInfrastructure, "_create_pool", create_pool):
+        with pytest.raises(ValueError):
+            await OracleInfrastructure._get_pool()
+        assert await OracleInfrastructure._get_pool() == dummy_pool
+    assert create_pool.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_connection_records_acquire_wait():
+    OracleInfrastructure.pool = _build_pool()
+    connection = OracleInfrastructure.pool.acquire.return_value.__aenter__.return_value
+    cursor = MagicMock()
+    connection.cursor.return_value.__aenter__ = AsyncMock(return_value=cursor)
+    connection.cursor.return_value.__aexit__ = AsyncMock(return_value=None)
+    connection.commit = AsyncMock()
+
+    async with OracleInfrastructure.get_connection() as received_cursor:
+        assert received_cursor is cursor
+
+    connection.commit.assert_awaited_once_with()
+    assert OracleInfrastructure.acquire_count == 1
+    assert OracleInfrastructure.acquire_wait_ms_max >= 0
+
+
+def _build_cursor(connection: MagicMock) -> MagicMock:
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    connection.cursor.return_value.__aenter__ = AsyncMock(return_value=cursor)
+    connection.cursor.return_value.__aexit__ = AsyncMock(return_value=None)
+    connection.commit = AsyncMock()
+    connection.rollback = AsyncMock()
+    return cursor
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_get_read_only_connection(mocked_settings):
+    OracleInfrastructure.pool = _build_pool()
+    connection = OracleInfrastructure.pool.acquire.return_value.__aenter__.return_value
+    cursor = _build_cursor(connection)
+
+    async with OracleInfrastructure.get_read_only_connection() as received_cursor:
+        assert received_cursor is cursor
+
+    cursor.execute.assert_not_called()
+    connection.commit.assert_not_called()
+    connection.rollback.assert_not_called()
+    assert OracleInfrastructure.acquire_count == 1
+
+
+@pytest.mark.asyncio
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(update={"oracle_read_only_transaction": True}),
+)
+async def test_get_read_only_connection_with_read_only_transaction(mocked_settings):
+    OracleInfrastructure.pool = _build_pool()
+    connection = OracleInfrastructure.pool.acquire.return_value.__aenter__.return_value
+    cursor = _build_cursor(connection)
+
+    with pytest.raises(ValueError):
+        async with OracleInfrastructure.get_read_only_connection():
+            raise ValueError()
+
+    cursor.execute.assert_awaited_once_with("SET TRANSACTION READ ONLY")
+    connection.commit.assert_not_called()
+    connection.rollback.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pings_min_sessions():
+    OracleInfrastructure.pool = _build_pool(min_sessions=3)
+    connection = OracleInfrastructure.pool.acquire.return_value.__aenter__.return_value
+
+    await OracleInfrastructure.warm_up()
+
+    assert OracleInfrastructure.pool.acquire.call_count == 3
+    assert connection.ping.await_count == 3
+    assert OracleInfrastructure.pool.acquire.return_value.__aexit__.await_count == 3
+
+
+def test_get_pool_stats_without_pool():
+    assert OracleInfrastructure.get_pool_stats() == {}
+
+
+def test_get_pool_stats():
+    OracleInfrastructure.pool = _build_pool()
+    OracleInfrastructure._record_acquire_wait(1.0)
+    OracleInfrastructure._record_acquire_wait(3.0)
+    assert OracleInfrastructure.get_pool_stats() == {
+        "min": 2,
+        "max": 10,
+        "open": 2,
+        "busy": 0,
+        "acquire_count": 2,
+        "acquire_wait_ms_avg": 2.0,
+        "acquire_wait_ms_max": 3.0,
+    }
@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import pytest
+from decouple import UndefinedValueError
+from etria_logger import Gladsheim
+
+from func.src.domain.settings.model import Settings
+from func.src.infrastructures.settings import infrastructure
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from tests.src.domain.settings.stubs import stub_required_env, stub_settings
+
+
+def _source(values: dict):
+    def _get(name, **kwargs):
+        if name in values:
+            return values[name]
+        if "default" in kwargs:
+            return kwargs["default"]
+        raise UndefinedValueError(name)
+
+    return _get
+
+
+@pytest.fixture(autouse=True)
+def reset_settings():
+    yield
+    SettingsInfrastructure.settings = None
+
+
+@patch.object(Settings, "from_env", return_value=stub_settings)
+def test_get_settings_loads_once(mocked_from_env):
+    assert SettingsInfrastructure.get_settings() is stub_settings
+    assert SettingsInfrastructure.get_settings() is stub_settings
+    mocked_from_env.assert_called_once_with()
+
+
+@patch.object(infrastructure, "AutoConfig")
+def test_reload_reads_a_fresh_config(mocked_auto_config):
+    mocked_auto_config.return_value = _source(
+        {**stub_required_env, "API_KEY": "new_api_key"}
+    )
+    SettingsInfrastructure.settings = stub_settings
+
+    settings = SettingsInfrastructure.reload()
+
+    mocked_auto_config.assert_called_once_with()
+    assert settings.api_key == "new_api_key"
+    assert SettingsInfrastructure.get_settings() is settings
+
+
+@patch.object(Gladsheim, "error")
+@patch.object(infrastructure, "AutoConfig")
+def test_reload_keeps_previous_settings_when_invalid(mocked_auto_config, mocked_logger):
+    mocked_auto_config.return_value = _source(
+        {**stub_required_env, "USER_UPDATE_WRITE_MODE": "partial"}
+    )
+    SettingsInfrastructure.settings = stub_settings
+
+    assert SettingsInfrastructure.reload() is stub_settings
+    assert SettingsInfrastructure.get_settings() is stub_settings
+    mocked_logger.assert_called_once()
@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
+
+from func.src.domain.enums.mongo_db import MongoReadConcern, MongoReadPreference
+from func.src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.repositories.mongo_db.base_repository.base import MongoDbBaseRepository
+from tests.src.domain.settings.stubs import stub_settings
+
+
+def _build_client() -> MagicMock:
+    mongo_client = MagicMock()
+    mongo_client["database"].get_collection.side_effect = lambda *args, **kwargs: (
+        MagicMock()
+    )
+    return mongo_client
+
+
+stub_tuned_settings = stub_settings.copy(
+    update={
+        "mongodb_read_preference": MongoReadPreference.SECONDARY_PREFERRED,
+        "mongodb_read_concern": MongoReadConcern.MAJORITY,
+        "mongodb_write_concern": "majority",
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_collections():
+    yield
+    MongoDbBaseRepository.collections = {}
+
+
+def test_build_read_only_collection():
+    mongo_client = MagicMock()
+    MongoDbBaseRepository._build_collection(
+        mongo_client, stub_tuned_settings, read_only=True
+    )
+    mongo_client["database"].get_collection.assert_called_once_with(
+        "users",
+        read_preference=ReadPreference.SECONDARY_PREFERRED,
+        read_concern=ReadConcern("majority"),
+    )
+
+
+def test_build_write_collection():
+    mongo_client = MagicMock()
+    MongoDbBaseRepository._build_collection(
+        mongo_client, stub_tuned_settings, read_only=False
+    )
+    mongo_client["database"].get_collection.assert_called_once_with(
+        "users", write_concern=WriteConcern(w="majority")
+    )
+
+
+def test_build_collection_with_defaults():
+    mongo_client = MagicMock()
+    MongoDbBaseRepository._build_collection(mongo_client, stub_settings, read_only=True)
+    mongo_client["database"].get_collection.assert_called_once_with(
+        "users", read_preference=ReadPreference.PRIMARY
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+@patch.object(MongoDBInfrastructure, "get_client", return_value=_build_client())
+async def test_get_collection_is_cached(mocked_client, mocked_settings):
+    collection = await MongoDbBaseRepository._get_collection()
+    assert await MongoDbBaseRepository._get_collection() is collection
+    assert await MongoDbBaseRepository._get_collection(read_only=True) is not collection
+    assert mocked_client.return_value["database"].get_collection.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch.object(MongoDBInfrastructure, "get_client", return_value=_build_client())
+async def test_get_collection_rebuilt_after_settings_change(mocked_client):
+    with patch.object(
+        SettingsInfrastructure, "get_settings", return_value=stub_settings
+    ):
+        collection = await MongoDbBaseRepository._get_collection()
+    with patch.object(
+        SettingsInfrastructure, "get_settings", return_value=stub_tuned_settings
+    ):
+        assert await MongoDbBaseRepository._get_collection() is not collection
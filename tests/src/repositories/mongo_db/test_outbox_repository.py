@@ -0,0 +1,94 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from func.src.domain.enums.outbox import OutboxEventStatus
+from func.src.repositories.mongo_db.outbox.repository import OutboxRepository
+
+stub_event = {"_id": "key", "status": OutboxEventStatus.PROCESSING.value}
+
+
+class _Cursor:
+    def __init__(self, documents: list):
+        self.documents = documents
+
+    def sort(self, *args):
+        return self
+
+    def limit(self, *args):
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+def _build_collection(candidates: list, claimed: list) -> MagicMock:
+    collection = MagicMock()
+    collection.find.side_effect = [_Cursor(candidates), _Cursor(claimed)]
+    collection.update_many = AsyncMock()
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_claim_events():
+    collection = _build_collection(candidates=[{"_id": "key"}], claimed=[stub_event])
+    with patch.object(OutboxRepository, "_get_collection", return_value=collection):
+        events = await OutboxRepository.claim_events(batch_size=10, lease_seconds=30)
+
+    assert events == [stub_event]
+    update_filter, update = collection.update_many.call_args.args
+    assert update_filter["_id"] == {"$in": ["key"]}
+    assert "$or" in update_filter
+    lease_token = update["$set"]["lease_token"]
+    assert update["$inc"] == {"attempts": 1}
+    claimed_filter = collection.find.call_args.args[0]
+    assert claimed_filter == {"_id": {"$in": ["key"]}, "lease_token": lease_token}
+
+
+@pytest.mark.asyncio
+async def test_claim_events_when_outbox_is_empty():
+    collection = _build_collection(candidates=[], claimed=[])
+    with patch.object(OutboxRepository, "_get_collection", return_value=collection):
+        events = await OutboxRepository.claim_events(batch_size=10, lease_seconds=30)
+
+    assert events == []
+    collection.update_many.assert_not_called()
+    assert collection.find.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mark_delivered_requires_the_lease():
+    collection = MagicMock()
+    collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+    with patch.object(OutboxRepository, "_get_collection", return_value=collection):
+        lease_kept = await OutboxRepository.mark_delivered(
+            idempotency_key="key", lease_token="token"
+        )
+
+    assert lease_kept is True
+    update_filter, update = collection.update_one.call_args.args
+    assert update_filter == {
+        "_id": "key",
+        "status": OutboxEventStatus.PROCESSING.value,
+        "lease_token": "token",
+    }
+    assert update["$set"]["status"] == OutboxEventStatus.DELIVERED.value
+
+
+@pytest.mark.asyncio
+async def test_schedule_retry_after_the_lease_was_lost():
+    collection = MagicMock()
+    collection.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+    with patch.object(OutboxRepository, "_get_collection", return_value=collection):
+        lease_kept = await OutboxRepository.schedule_retry(
+            idempotency_key="key", lease_token="expired", next_attempt_at=None
+        )
+
+    assert lease_kept is False
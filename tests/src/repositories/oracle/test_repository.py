@@ -0,0 +1,84 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from func.src.domain.enums.enumerate_validation import EnumerateField
+from func.src.repositories.oracle.repository import EnumerateRepository
+
+
+def test_build_bind_list():
+    assert EnumerateRepository._build_bind_list(size=3) == ":1, :2, :3"
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "query", return_value=[(1,)])
+async def test_ping(mocked_query):
+    await EnumerateRepository.ping()
+    mocked_query.assert_called_once_with(sql="SELECT 1 FROM DUAL", filters=[])
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "cached_query", return_value=[("BRA",)])
+async def test_get_missing_countries(mocked_query):
+    result = await EnumerateRepository.get_missing_countries(
+        country_acronyms=["USA", "BRA", "USA"]
+    )
+    assert result == ["USA", "USA"]
+    assert mocked_query.call_args.kwargs["filters"] == ["BRA", "USA"]
+    assert "IN (:1, :2)" in mocked_query.call_args.kwargs["sql"]
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "cached_query", return_value=[(1,), (2,)])
+async def test_get_missing_nationalities(mocked_query):
+    result = await EnumerateRepository.get_missing_nationalities(
+        nationality_codes=[2, 1]
+    )
+    assert result == []
+    assert mocked_query.call_args.kwargs["filters"] == [1, 2]
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "cached_query", return_value=[("BRA ",)])
+async def test_get_missing_countries_with_padded_rows(mocked_query):
+    result = await EnumerateRepository.get_missing_countries(
+        country_acronyms=["BRA", "USA"]
+    )
+    assert result == ["USA"]
+
+
+@pytest.mark.asyncio
+@patch.object(
+    EnumerateRepository, "cached_query", return_value=[(Decimal("1"),), (2.0,)]
+)
+async def test_get_missing_nationalities_with_decimal_rows(mocked_query):
+    result = await EnumerateRepository.get_missing_nationalities(
+        nationality_codes=[1, 2, 3]
+    )
+    assert result == [3]
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "cached_query", return_value=[])
+async def test_get_country_uses_batched_query(mocked_query):
+    result = await EnumerateRepository.get_country(country_acronym="XXX")
+    assert result == []
+    assert mocked_query.call_args.kwargs["filters"] == ["XXX"]
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "query", return_value=[("address_city",)])
+async def test_get_invalid_enumerations(mocked_query):
+    result = await EnumerateRepository.get_invalid_enumerations(
+        enumeration_probes=[
+            (EnumerateField.ACTIVITY, (101,)),
+            (EnumerateField.ADDRESS_CITY, ("BRA", "SP", 5150)),
+        ]
+    )
+    assert result == [EnumerateField.ADDRESS_CITY]
+    sql = mocked_query.call_args.kwargs["sql"]
+    assert sql.count("UNION ALL") == 1
+    assert "CODE = :1" in sql
+    assert "NUM_SEQ_MUNI = :4" in sql
+    assert mocked_query.call_args.kwargs["filters"] == [101, "BRA", "SP", 5150]
@@ -870,3 +870,35 @@ def test_marital_spouse_name_empty_spouse():
         old_field=None,
         new_filed=fake_instance._get_new_value.return_value.get.return_value.get.return_value,
     )
+
+
+def test_modified_paths_use_dotted_levels():
+    builder = UpdateCustomerRegistrationBuilder(
+        old_personal_data={"address": {"city": 1}},
+        new_personal_data={},
+        unique_id="unique_id",
+    )
+    builder._update_modified_data(
+        levels=("address", "number"), old_field=None, new_filed="10"
+    )
+    assert builder.get_modified_paths() == [("address", "number")]
+
+
+def test_modified_paths_stop_at_missing_parent():
+    builder = UpdateCustomerRegistrationBuilder(
+        old_personal_data={"marital": {"spouse": None}},
+        new_personal_data={},
+        unique_id="unique_id",
+    )
+    builder._update_modified_data(
+        levels=("marital", "spouse", "cpf"), old_field=None, new_filed="cpf"
+    )
+    builder._update_modified_data(
+        levels=("external_exchange_requirements", "us", "user_employ_type"),
+        old_field=None,
+        new_filed="type",
+    )
+    assert builder.get_modified_paths() == [
+        ("marital", "spouse"),
+        ("external_exchange_requirements",),
+    ]
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from func.src.services.concurrency import ConcurrencyService
+
+
+async def _return_after(value, delay: float = 0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _raise_after(exception: Exception, delay: float = 0):
+    await asyncio.sleep(delay)
+    raise exception
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_keeps_order():
+    result = await ConcurrencyService.gather_fail_fast(
+        _return_after(1, 0.02), _return_after(2), _return_after(3, 0.01)
+    )
+    assert result == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_without_coroutines():
+    result = await ConcurrencyService.gather_fail_fast()
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_raises_and_cancels_pending():
+    slow_task_finished = []
+
+    async def _slow():
+        await asyncio.sleep(1)
+        slow_task_finished.append(True)
+
+    with pytest.raises(ValueError):
+        await ConcurrencyService.gather_fail_fast(_slow(), _raise_after(ValueError()))
+    await asyncio.sleep(0)
+    assert not slow_task_finished
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_respects_limit():
+    running = []
+    max_running = []
+
+    async def _track():
+        running.append(True)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    await ConcurrencyService.gather_fail_fast(*(_track() for _ in range(5)), limit=2)
+    assert max(max_running) == 2
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_closes_coroutines_never_started():
+    never_started = _return_after(1)
+    with pytest.raises(ValueError):
+        await ConcurrencyService.gather_fail_fast(
+            _raise_after(ValueError()), never_started, limit=1
+        )
+    assert never_started.cr_frame is None
+
+
+@pytest.mark.asyncio
+async def test_gather_fail_fast_with_running_task():
+    running_task = asyncio.ensure_future(_raise_after(ValueError(), 0.01))
+    slow_validation = asyncio.ensure_future(_return_after(1, 1))
+    with pytest.raises(ValueError):
+        await ConcurrencyService.gather_fail_fast(running_task, slow_validation)
+    assert slow_validation.cancelled()
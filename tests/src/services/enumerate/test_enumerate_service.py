@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
@@ -13,9 +14,13 @@ from func.src.domain.exceptions.exceptions import (
 )
 
 
+from func.src.domain.enumerate_snapshot.model import EnumerateSnapshot
+from func.src.domain.enums.enumerate_validation import EnumerateField
 from func.src.domain.user_enumerate.model import UserEnumerateDataModel
 from func.src.repositories.mongo_db.user.repository import UserRepository
+from func.src.services.enumerate_snapshot import EnumerateSnapshotService
 from func.src.services.user_enumerate_data import UserEnumerateService
+from func.src.services.user_loader import UserDocumentLoader
 from tests.src.services.user_review.stubs import (
     stub_payload_validated,
     stub_payload_missing_data,
@@ -250,8 +255,8 @@ async def test_when_invalid_activity_then_raises(
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_nationality",
-    side_effect=[True, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_nationalities",
+    return_value=[],
 )
 async def test_when_valid_nationality_then_return_none(
     mock_validate_nationality, enumerate_service_missing_some_data
@@ -259,13 +264,14 @@ async def test_when_valid_nationality_then_return_none(
     result = await enumerate_service_missing_some_data._validate_nationality(
         nationalities=[1, 2]
     )
+    mock_validate_nationality.assert_called_once_with(nationality_codes=[1, 2])
     assert result is None
 
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_nationality",
-    side_effect=[True, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_nationalities",
+    return_value=[],
 )
 async def test_when_valid_nationality_none(
     mock_validate_nationality, enumerate_service_missing_some_data
@@ -279,8 +285,8 @@ async def test_when_valid_nationality_none(
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_nationality",
-    side_effect=[False, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_nationalities",
+    return_value=[1],
 )
 async def test_when_invalid_nationality_then_raises(
     mock_validate_nationality, enumerate_service_missing_some_data
@@ -301,8 +307,8 @@ async def test_when_no_countries_then_return_none_(enumerate_service_missing_som
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_country",
-    side_effect=[True, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_countries",
+    return_value=[],
 )
 async def test_when_valid_countries_then_return_none(
     mock_validate_countries, enumerate_service_missing_some_data
@@ -310,13 +316,14 @@ async def test_when_valid_countries_then_return_none(
     result = await enumerate_service_missing_some_data._validate_country_acronym(
         countries=[1, 2]
     )
+    mock_validate_countries.assert_called_once_with(country_acronyms=[1, 2])
     assert result is None
 
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_country",
-    side_effect=[True, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_countries",
+    return_value=[],
 )
 async def test_when_valid_countries_none(
     mock_validate_countries, enumerate_service_missing_some_data
@@ -330,8 +337,8 @@ async def test_when_valid_countries_none(
 
 @pytest.mark.asyncio
 @patch(
-    "func.src.services.user_enumerate_data.EnumerateRepository.get_country",
-    side_effect=[False, True],
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_missing_countries",
+    return_value=[1],
 )
 async def test_when_invalid_country_then_raises(
     mock_validate_countries, enumerate_service_missing_some_data
@@ -347,6 +354,8 @@ async def test_when_success_to_validate_enumerate_params_then_return_true(
     enumerate_service,
 ):
     fake_instance = AsyncMock()
+    fake_instance._get_concurrency_limit = MagicMock(return_value=8)
+    fake_instance._is_composite_mode = MagicMock(return_value=False)
     result = await UserEnumerateService.validate_enumerate_params(fake_instance)
     assert fake_instance.user_enumerate_model.get_activity.called
     assert fake_instance.user_enumerate_model.get_document_state.called
@@ -354,6 +363,31 @@ async def test_when_success_to_validate_enumerate_params_then_return_true(
     assert fake_instance.user_enumerate_model.get_country_tax_residences.called
     assert fake_instance.user_enumerate_model.get_marital_status.called
     assert fake_instance.user_enumerate_model.get_combination_address.called
+    fake_instance._validate_activity.assert_awaited_once()
+    fake_instance._validate_state.assert_awaited_once()
+    fake_instance._validate_nationality.assert_awaited_once()
+    fake_instance._validate_country_acronym.assert_awaited_once()
+    fake_instance._validate_marital_status.assert_awaited_once()
+    assert fake_instance._validate_combination_place.await_count == 2
+    fake_instance._validate_financial_capacity.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_when_one_enumerate_param_is_invalid_then_raises_and_cancels_others():
+    fake_instance = AsyncMock()
+    fake_instance._get_concurrency_limit = MagicMock(return_value=8)
+    fake_instance._is_composite_mode = MagicMock(return_value=False)
+    fake_instance._validate_state.side_effect = InvalidState()
+    slow_validation_finished = []
+
+    async def _slow_validation(*args, **kwargs):
+        await asyncio.sleep(1)
+        slow_validation_finished.append(True)
+
+    fake_instance._validate_financial_capacity.side_effect = _slow_validation
+    with pytest.raises(InvalidState):
+        await UserEnumerateService.validate_enumerate_params(fake_instance)
+    assert not slow_validation_finished
 
 
 stub_get_user_greater_than_a_thousand_and_two_values = {
@@ -375,7 +409,9 @@ async def test__validate_financial_capacity_false_false_false(
 ):
     response = await UserEnumerateService._validate_financial_capacity(
         user_enumerate_model=UserEnumerateDataModel(MagicMock()),
-        unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491",
+        user_loader=UserDocumentLoader(
+            unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491"
+        ),
     )
     mock___init__.assert_not_called()
 
@@ -399,7 +435,9 @@ async def test__validate_financial_capacity_true_false_false(
 ):
     response = await UserEnumerateService._validate_financial_capacity(
         user_enumerate_model=UserEnumerateDataModel(MagicMock()),
-        unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491",
+        user_loader=UserDocumentLoader(
+            unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491"
+        ),
     )
     mock___init__.assert_not_called()
 
@@ -423,7 +461,9 @@ async def test__validate_financial_capacity_false_true_false(
 ):
     response = await UserEnumerateService._validate_financial_capacity(
         user_enumerate_model=UserEnumerateDataModel(MagicMock()),
-        unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491",
+        user_loader=UserDocumentLoader(
+            unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491"
+        ),
     )
     mock_get_user["assets"]["patrimony"].assert_not_called()
     mock___init__.assert_not_called()
@@ -448,7 +488,9 @@ async def test__validate_financial_capacity_true_true_false(
 ):
     response = await UserEnumerateService._validate_financial_capacity(
         user_enumerate_model=UserEnumerateDataModel(MagicMock()),
-        unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491",
+        user_loader=UserDocumentLoader(
+            unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491"
+        ),
     )
     mock___init__.assert_not_called()
 
@@ -473,6 +515,104 @@ async def test__validate_financial_capacity_false_false_true(
     with pytest.raises(Exception):
         response = await UserEnumerateService._validate_financial_capacity(
             user_enumerate_model=UserEnumerateDataModel(MagicMock()),
-            unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491",
+            user_loader=UserDocumentLoader(
+                unique_id="40db7fee-6d60-4d73-824f-1bf87edc4491"
+            ),
         )
     mock___init__.assert_called()
+
+
+stub_snapshot = EnumerateSnapshot(
+    activities=[(101,)],
+    countries=[("BRA",)],
+    states=[("SP",)],
+    marital_statuses=[(1,)],
+    nationalities=[(1,)],
+    cities=[("BRA", "SP", 5150)],
+)
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateSnapshotService, "get_snapshot", return_value=stub_snapshot)
+@patch("func.src.services.user_enumerate_data.EnumerateRepository")
+async def test_when_snapshot_loaded_then_validate_without_queries(
+    mocked_repository, mocked_snapshot
+):
+    await UserEnumerateService._validate_activity(activity_code=101)
+    await UserEnumerateService._validate_state(state="SP")
+    await UserEnumerateService._validate_marital_status(marital_code=1)
+    await UserEnumerateService._validate_nationality(nationalities=[1])
+    await UserEnumerateService._validate_country_acronym(countries=["BRA"])
+    await UserEnumerateService._validate_combination_place(
+        combination_place={"country": "BRA", "state": "SP", "city": 5150}
+    )
+    assert not mocked_repository.mock_calls
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateSnapshotService, "get_snapshot", return_value=stub_snapshot)
+async def test_when_snapshot_loaded_and_invalid_city_then_raises(mocked_snapshot):
+    with pytest.raises(InvalidCity):
+        await UserEnumerateService._validate_combination_place(
+            combination_place={"country": "BRA", "state": "RJ", "city": 5150}
+        )
+
+
+def test_build_enumeration_probes():
+    result = UserEnumerateService._build_enumeration_probes(
+        activity_code=101,
+        state=None,
+        nationalities=[1, 2],
+        countries=["BRA"],
+        marital_code=None,
+        address_combination={"country": "BRA", "state": "SP", "city": 5150},
+        birth_place_combination=None,
+    )
+    assert result == [
+        (EnumerateField.ACTIVITY, (101,)),
+        (EnumerateField.NATIONALITY, (1,)),
+        (EnumerateField.NATIONALITY, (2,)),
+        (EnumerateField.COUNTRY_TAX_RESIDENCE, ("BRA",)),
+        (EnumerateField.ADDRESS_CITY, ("BRA", "SP", 5150)),
+    ]
+
+
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_invalid_enumerations",
+    return_value=[EnumerateField.BIRTH_PLACE_CITY, EnumerateField.STATE],
+)
+async def test_when_single_query_finds_invalid_fields_then_raises_first(
+    mocked_repository,
+):
+    with pytest.raises(InvalidState):
+        await UserEnumerateService._validate_in_single_query(
+            enumeration_probes=[
+                (EnumerateField.STATE, ("XX",)),
+                (EnumerateField.BIRTH_PLACE_CITY, ("BRA", "SP", 1)),
+            ]
+        )
+
+
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_enumerate_data.EnumerateRepository.get_invalid_enumerations"
+)
+async def test_when_single_query_has_no_probes_then_return_none(mocked_repository):
+    result = await UserEnumerateService._validate_in_single_query(enumeration_probes=[])
+    assert result is None
+    mocked_repository.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_when_composite_mode_then_validate_in_single_query():
+    fake_instance = AsyncMock()
+    fake_instance._get_concurrency_limit = MagicMock(return_value=8)
+    fake_instance._is_composite_mode = MagicMock(return_value=True)
+    fake_instance._build_enumeration_probes = MagicMock()
+    await UserEnumerateService.validate_enumerate_params(fake_instance)
+    fake_instance._validate_in_single_query.assert_awaited_once_with(
+        enumeration_probes=fake_instance._build_enumeration_probes.return_value
+    )
+    fake_instance._validate_activity.assert_not_called()
+    fake_instance._validate_financial_capacity.assert_awaited_once()
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+from etria_logger import Gladsheim
+
+from func.src.domain.enumerate_snapshot.model import EnumerateSnapshot
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.repositories.oracle.repository import EnumerateRepository
+from func.src.services.enumerate_snapshot import EnumerateSnapshotService
+from tests.src.domain.settings.stubs import stub_settings
+
+stub_snapshot_settings = stub_settings.copy(update={"enumerate_snapshot_enabled": True})
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateRepository, "get_all_cities", return_value=[("BRA", "SP", 1)])
+@patch.object(EnumerateRepository, "get_all_nationalities", return_value=[(1,)])
+@patch.object(EnumerateRepository, "get_all_marital_statuses", return_value=[(1,)])
+@patch.object(EnumerateRepository, "get_all_states", return_value=[("SP",)])
+@patch.object(EnumerateRepository, "get_all_countries", return_value=[("BRA",)])
+@patch.object(EnumerateRepository, "get_all_activities", return_value=[(101,)])
+@patch.object(Gladsheim, "info")
+async def test_load(mocked_logger, *mocked_repository):
+    snapshot = await EnumerateSnapshotService.load()
+    assert isinstance(snapshot, EnumerateSnapshot)
+    assert EnumerateSnapshotService.get_snapshot() is snapshot
+    assert snapshot.has_city(country="BRA", state="SP", id_city=1)
+    EnumerateSnapshotService.snapshot = None
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateSnapshotService, "start_refresh")
+@patch.object(EnumerateSnapshotService, "load")
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_warm_up_disabled(mocked_env, mocked_load, mocked_refresh):
+    await EnumerateSnapshotService.warm_up()
+    mocked_load.assert_not_called()
+    mocked_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateSnapshotService, "start_refresh")
+@patch.object(EnumerateSnapshotService, "load")
+@patch.object(
+    SettingsInfrastructure, "get_settings", return_value=stub_snapshot_settings
+)
+async def test_warm_up(mocked_env, mocked_load, mocked_refresh):
+    await EnumerateSnapshotService.warm_up()
+    mocked_load.assert_called_once_with()
+    mocked_refresh.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+@patch.object(EnumerateSnapshotService, "start_refresh")
+@patch.object(EnumerateSnapshotService, "load", side_effect=Exception())
+@patch.object(
+    SettingsInfrastructure, "get_settings", return_value=stub_snapshot_settings
+)
+@patch.object(Gladsheim, "error")
+async def test_warm_up_with_error(
+    mocked_logger, mocked_env, mocked_load, mocked_refresh
+):
+    await EnumerateSnapshotService.warm_up()
+    mocked_logger.assert_called_once()
+    mocked_refresh.assert_called_once_with()
@@ -0,0 +1,40 @@
+import sys
+
+from func.src.services.import_profiler import ImportProfiler
+
+
+def test_profile_import():
+    sys.modules.pop("colorsys", None)
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import colorsys
+    finally:
+        profiler.uninstall()
+    assert profiler not in sys.meta_path
+    assert colorsys.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+    ((name, depth, self_time, cumulative),) = profiler.timings
+    assert (name, depth) == ("colorsys", 0)
+    assert 0 <= self_time <= cumulative
+
+
+def test_nested_timings():
+    profiler = ImportProfiler()
+    profiler.enter("parent")
+    profiler.enter("parent.child")
+    profiler.exit()
+    profiler.exit()
+    child, parent = profiler.timings
+    assert child[:2] == ("parent.child", 1)
+    assert parent[:2] == ("parent", 0)
+    assert parent[3] >= child[3]
+    assert abs(parent[2] - (parent[3] - child[3])) < 1e-9
+
+
+def test_format_report():
+    profiler = ImportProfiler()
+    profiler.timings = [("fast", 1, 0.000001, 0.000001), ("slow", 0, 0.001, 0.002)]
+    report = profiler.format_report(limit=1).splitlines()
+    assert report[0] == "import time: self [us] | cumulative | imported package"
+    assert report[1] == "import time:      1000 |       2000 | slow"
+    assert len(report) == 2
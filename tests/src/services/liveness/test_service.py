@@ -1,46 +1,47 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
-from decouple import Config
 from koh import Koh, KohStatus
 
 from func.src.domain.exceptions.exceptions import ErrorInLiveness, LivenessRejected
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
 from func.src.services.liveness import LivenessService
+from tests.src.domain.settings.stubs import stub_settings
 
 
 @pytest.mark.asyncio
 @patch.object(Koh, "check_face")
-@patch.object(Config, "__call__")
-async def test_validate(mocked_env, mocked_validator):
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_validate(mocked_settings, mocked_validator):
     dummy = MagicMock()
     mocked_validator.return_value = True, KohStatus.SUCCESS
     await LivenessService.validate(dummy, dummy)
     mocked_validator.assert_called_once_with(
-        dummy, dummy.liveness, mocked_env.return_value
+        dummy, dummy.liveness, stub_settings.koh_feature_update_user_data
     )
 
 
 @pytest.mark.asyncio
 @patch.object(Koh, "check_face")
-@patch.object(Config, "__call__")
-async def test_validate_koh_error(mocked_env, mocked_validator):
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_validate_koh_error(mocked_settings, mocked_validator):
     dummy = MagicMock()
     mocked_validator.return_value = True, None
     with pytest.raises(ErrorInLiveness):
         await LivenessService.validate(dummy, dummy)
     mocked_validator.assert_called_once_with(
-        dummy, dummy.liveness, mocked_env.return_value
+        dummy, dummy.liveness, stub_settings.koh_feature_update_user_data
     )
 
 
 @pytest.mark.asyncio
 @patch.object(Koh, "check_face")
-@patch.object(Config, "__call__")
-async def test_validate_koh_rejected(mocked_env, mocked_validator):
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_validate_koh_rejected(mocked_settings, mocked_validator):
     dummy = MagicMock()
     mocked_validator.return_value = False, KohStatus.SUCCESS
     with pytest.raises(LivenessRejected):
         await LivenessService.validate(dummy, dummy)
     mocked_validator.assert_called_once_with(
-        dummy, dummy.liveness, mocked_env.return_value
+        dummy, dummy.liveness, stub_settings.koh_feature_update_user_data
     )
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from func.src.domain.enums.outbox import OutboxEventType
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.services.outbox import OutboxService
+from tests.src.domain.settings.stubs import stub_settings
+
+stub_user_review_model = MagicMock(unique_id="unique_id")
+
+
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(update={"outbox_enabled": True}),
+)
+def test_is_enabled(mocked_settings):
+    assert OutboxService.is_enabled() is True
+
+
+def test_build_rate_client_risk_event():
+    outbox_event = OutboxService.build_rate_client_risk_event(
+        unique_id="unique_id", message={"score": 1}
+    )
+    assert outbox_event["event_type"] == OutboxEventType.AUDIT_RATE_CLIENT_RISK
+    assert outbox_event["payload"] == {"score": 1}
+    assert outbox_event["unique_id"] == "unique_id"
+
+
+def test_build_update_registration_data_event():
+    outbox_event = OutboxService.build_update_registration_data_event(
+        unique_id="unique_id", message={"unique_id": "unique_id"}
+    )
+    assert outbox_event["event_type"] == OutboxEventType.AUDIT_UPDATE_REGISTRATION_DATA
+    assert outbox_event["payload"] == {"unique_id": "unique_id"}
+
+
+def test_build_update_queues_events():
+    outbox_events = OutboxService.build_update_queues_events(
+        user_review_model=stub_user_review_model
+    )
+    assert [outbox_event["event_type"] for outbox_event in outbox_events] == [
+        OutboxEventType.IARA_SINACOR_UPDATE,
+        OutboxEventType.IARA_DW_UPDATE,
+    ]
+    assert outbox_events[0]["_id"] != outbox_events[1]["_id"]
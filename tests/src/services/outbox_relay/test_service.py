@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from etria_logger import Gladsheim
+from iara_client import IaraTopics
+
+from func.src.domain.enums.outbox import OutboxEventType
+from func.src.domain.exceptions.exceptions import (
+    ErrorOnSendAuditLog,
+    OutboxEventNotDelivered,
+)
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.repositories.mongo_db.outbox.repository import OutboxRepository
+from func.src.services.outbox import OutboxService
+from func.src.services.outbox_relay import OutboxRelayService
+from func.src.transports.audit.transport import Audit
+from func.src.transports.iara.transport import IaraTransport
+from tests.src.domain.settings.stubs import stub_settings
+
+stub_audit_event = {
+    "_id": "audit",
+    "event_type": OutboxEventType.AUDIT_RATE_CLIENT_RISK.value,
+    "payload": {"score": 1},
+    "attempts": 1,
+    "lease_token": "audit_token",
+}
+stub_iara_event = {
+    "_id": "iara",
+    "event_type": OutboxEventType.IARA_DW_UPDATE.value,
+    "payload": {"unique_id": "unique_id"},
+    "attempts": 1,
+    "lease_token": "iara_token",
+}
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRepository, "mark_delivered", return_value=True)
+@patch.object(IaraTransport, "send_to_queue", return_value=True)
+@patch.object(Audit, "send_message_log_to_rate_client_risk", return_value=True)
+@patch.object(
+    OutboxRepository,
+    "claim_events",
+    return_value=[stub_audit_event, stub_iara_event],
+)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_relay_batch(
+    mocked_settings, mocked_claim, mocked_audit, mocked_iara, mocked_delivered
+):
+    relayed_events = await OutboxRelayService.relay_batch()
+    assert relayed_events == 2
+    mocked_claim.assert_called_once_with(batch_size=50, lease_seconds=30.0)
+    mocked_audit.assert_called_once_with(message={"score": 1})
+    mocked_iara.assert_called_once_with(
+        IaraTopics.DW_UPDATE, message={"unique_id": "unique_id"}
+    )
+    mocked_delivered.assert_any_call(idempotency_key="audit", lease_token="audit_token")
+    mocked_delivered.assert_any_call(idempotency_key="iara", lease_token="iara_token")
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRepository, "claim_events", return_value=[])
+async def test_relay_batch_when_outbox_is_empty(mocked_claim):
+    assert await OutboxRelayService.relay_batch(settings=stub_settings) == 0
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRepository, "schedule_retry", return_value=True)
+@patch.object(OutboxRepository, "mark_delivered")
+@patch.object(IaraTransport, "send_to_queue", return_value=False)
+@patch.object(Gladsheim, "error")
+async def test_relay_event_schedules_retry(
+    mocked_logger, mocked_iara, mocked_delivered, mocked_retry
+):
+    await OutboxRelayService._relay_event(stub_iara_event, settings=stub_settings)
+    mocked_delivered.assert_not_called()
+    mocked_retry.assert_called_once()
+    assert mocked_retry.call_args.kwargs["lease_token"] == "iara_token"
+    assert isinstance(mocked_logger.call_args.kwargs["error"], OutboxEventNotDelivered)
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRepository, "mark_failed", return_value=True)
+@patch.object(OutboxRepository, "schedule_retry")
+@patch.object(
+    Audit,
+    "send_message_log_to_rate_client_risk",
+    side_effect=ErrorOnSendAuditLog(),
+)
+@patch.object(Gladsheim, "error")
+async def test_relay_event_gives_up_after_max_attempts(
+    mocked_logger, mocked_audit, mocked_retry, mocked_failed
+):
+    await OutboxRelayService._relay_event(
+        stub_audit_event, settings=stub_settings.copy(update={"outbox_max_attempts": 1})
+    )
+    mocked_retry.assert_not_called()
+    mocked_failed.assert_called_once_with(
+        idempotency_key="audit", lease_token="audit_token"
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRepository, "mark_delivered", return_value=False)
+@patch.object(IaraTransport, "send_to_queue", return_value=True)
+@patch.object(Gladsheim, "warning")
+async def test_relay_event_when_lease_was_lost(
+    mocked_warning, mocked_iara, mocked_delivered
+):
+    await OutboxRelayService._relay_event(stub_iara_event, settings=stub_settings)
+    mocked_delivered.assert_called_once_with(
+        idempotency_key="iara", lease_token="iara_token"
+    )
+    mocked_warning.assert_called_once()
+    assert mocked_warning.call_args.kwargs["idempotency_key"] == "iara"
+
+
+@patch.object(OutboxService, "is_enabled", return_value=False)
+def test_start_when_disabled(mocked_enabled):
+    OutboxRelayService.start()
+    assert OutboxRelayService.relay_task is None
+
+
+@pytest.mark.asyncio
+@patch.object(OutboxRelayService, "relay_batch", return_value=0)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+@patch.object(OutboxService, "is_enabled", return_value=True)
+async def test_start_and_stop(mocked_enabled, mocked_env, mocked_relay):
+    OutboxRelayService.start()
+    assert OutboxRelayService.relay_task is not None
+    await OutboxRelayService.stop()
+    assert OutboxRelayService.relay_task is None
@@ -0,0 +1,92 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from func.src.domain.exceptions.exceptions import UserUniqueIdNotExists
+from func.src.repositories.mongo_db.user.repository import UserRepository
+from func.src.services.user_loader import UserDocumentLoader
+
+stub_unique_id = "40db7fee-6d60-4d73-824f-1bf87edc4491"
+stub_user = {"unique_id": stub_unique_id}
+
+
+@pytest.mark.asyncio
+@patch.object(UserRepository, "get_user", return_value=stub_user)
+async def test_get_user_reads_once(mocked_repository):
+    user_loader = UserDocumentLoader(unique_id=stub_unique_id)
+    users = await asyncio.gather(user_loader.get_user(), user_loader.get_user())
+    assert users == [stub_user, stub_user]
+    mocked_repository.assert_called_once_with(
+        unique_id=stub_unique_id, projection=None, read_only=True
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(UserRepository, "get_user", return_value=stub_user)
+async def test_get_user_with_merged_projections(mocked_repository):
+    user_loader = UserDocumentLoader(
+        stub_unique_id,
+        ("assets.patrimony", "assets.income"),
+        ("assets", "pld"),
+    )
+    await user_loader.get_user()
+    mocked_repository.assert_called_once_with(
+        unique_id=stub_unique_id, projection={"assets": 1, "pld": 1}, read_only=True
+    )
+
+
+def test_merge_projections_keeps_sibling_prefixes():
+    projection = UserDocumentLoader._merge_projections(
+        ("assets.income", "assets_history")
+    )
+    assert projection == {"assets.income": 1, "assets_history": 1}
+
+
+@pytest.mark.asyncio
+@patch.object(UserRepository, "get_user", return_value=None)
+async def test_get_user_not_found(mocked_repository):
+    user_loader = UserDocumentLoader(unique_id=stub_unique_id)
+    with pytest.raises(UserUniqueIdNotExists):
+        await user_loader.get_user()
+
+
+@pytest.mark.asyncio
+@patch.object(UserRepository, "get_user", return_value=stub_user)
+async def test_invalidate_reads_again(mocked_repository):
+    user_loader = UserDocumentLoader(unique_id=stub_unique_id)
+    await user_loader.get_user()
+    user_loader.invalidate()
+    await user_loader.get_user()
+    assert mocked_repository.call_count == 2
+    assert mocked_repository.call_args.kwargs["read_only"] is False
+
+
+@pytest.mark.asyncio
+async def test_cancelled_consumer_does_not_cancel_shared_read():
+    read_started = asyncio.Event()
+
+    async def _slow_get_user(unique_id: str, projection: dict, read_only: bool):
+        read_started.set()
+        await asyncio.sleep(0.01)
+        return stub_user
+
+    with patch.object(UserRepository, "get_user", side_effect=_slow_get_user):
+        user_loader = UserDocumentLoader(unique_id=stub_unique_id)
+        cancelled_consumer = asyncio.ensure_future(user_loader.get_user())
+        await read_started.wait()
+        cancelled_consumer.cancel()
+        assert await user_loader.get_user() == stub_user
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_read():
+    async def _slow_get_user(unique_id: str, projection: dict, read_only: bool):
+        await asyncio.sleep(10)
+
+    with patch.object(UserRepository, "get_user", side_effect=_slow_get_user):
+        user_loader = UserDocumentLoader(unique_id=stub_unique_id)
+        user_future = user_loader.load()
+        await asyncio.sleep(0)
+        await user_loader.close()
+    assert user_future.cancelled()
@@ -1,22 +1,33 @@
+from copy import deepcopy
 from datetime import datetime
 from unittest.mock import patch, MagicMock, AsyncMock
 
 import pytest
 from etria_logger import Gladsheim
+from iara_client import IaraTopics
 from regis import Regis, RiskValidations, RiskRatings, RegisResponse
 
 from func.src.domain.enums.user_review import UserOnboardingStep
 from func.src.domain.exceptions.exceptions import (
+    ErrorOnSendAuditLog,
     UserUniqueIdNotExists,
     ErrorToUpdateUser,
     InvalidOnboardingCurrentStep,
     FailedToGetData,
     InconsistentUserData,
+    UserUpdateConflict,
 )
 from func.src.domain.user_review.model import UserReviewModel
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.services.builders.user_registration_update import (
+    UpdateCustomerRegistrationBuilder,
+)
+from func.src.services.user_loader import UserDocumentLoader
 from func.src.services.user_review import UserReviewDataService
+from func.src.transports.iara.transport import IaraTransport
 from func.src.transports.onboarding_steps.transport import OnboardingSteps
 from func.src.domain.thebes_answer.model import ThebesAnswer
+from tests.src.domain.settings.stubs import stub_settings
 from tests.src.services.user_review.stubs import (
     stub_unique_id,
     stub_payload_validated,
@@ -34,7 +45,9 @@ from tests.src.services.user_review.stubs import (
     return_value={"data": True},
 )
 async def test_when_get_user_successfully_then_return_user_data(mock_repository):
-    user_data = await UserReviewDataService._get_user_data(unique_id=stub_unique_id)
+    user_data = await UserReviewDataService._get_user_data(
+        user_loader=UserDocumentLoader(unique_id=stub_unique_id)
+    )
 
     assert isinstance(user_data, dict)
     assert user_data.get("data") is True
@@ -47,7 +60,9 @@ async def test_when_get_user_successfully_then_return_user_data(mock_repository)
 )
 async def test_when_not_found_an_user_then_raises(mock_repository):
     with pytest.raises(UserUniqueIdNotExists):
-        await UserReviewDataService._get_user_data(unique_id=stub_unique_id)
+        await UserReviewDataService._get_user_data(
+            user_loader=UserDocumentLoader(unique_id=stub_unique_id)
+        )
 
 
 @pytest.mark.asyncio
@@ -56,19 +71,25 @@ async def test_when_not_found_an_user_then_raises(mock_repository):
 @patch("func.src.services.user_review.UserReviewDataService.rate_client_risk")
 @patch("func.src.services.user_review.UserReviewDataService._update_user")
 @patch(
-    "func.src.services.user_review.Audit.record_message_log_to_update_registration_data"
+    "func.src.services.user_review.Audit.send_message_log_to_update_registration_data"
+)
+@patch("func.src.services.user_review.Audit.send_message_log_to_rate_client_risk")
+@patch(
+    "func.src.services.user_review.Audit.get_message_log_to_update_registration_data"
 )
-@patch("func.src.services.user_review.Audit.record_message_log_to_rate_client_risk")
 @patch(
     "func.src.services.user_review.UserReviewDataService._get_user_data",
     return_value=stub_user_from_database,
 )
-@patch.object(UserReviewModel, "__new__")
+@patch("func.src.services.user_review.UserReviewModel")
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
 async def test_when_apply_rules_successfully_then_return_true(
+    mocked_settings,
     mocked_model,
     mock_get_user,
-    mock_audit_registration_data,
+    mock_registration_message,
     mock_audit_pld,
+    mock_audit_registration_data,
     mock_update,
     rate_risk,
     iara_mock_sinacor,
@@ -120,6 +141,336 @@ async def test_when_failure_to_update_user_then_raises(mock_update_user):
         )
 
 
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_review.UserRepository.update_user",
+    return_value=stub_user_updated,
+)
+@patch.object(UserReviewDataService, "_get_write_mode", return_value="diff")
+async def test_update_user_in_diff_mode_sets_only_changes(
+    mocked_write_mode, mock_update_user
+):
+    user_review_model = MagicMock()
+    user_review_model.get_new_user_data_changes = AsyncMock(
+        return_value={"name": "name"}
+    )
+    await UserReviewDataService._update_user(
+        unique_id=stub_unique_id,
+        new_user_registration_data=deepcopy(stub_user_from_database),
+        user_review_model=user_review_model,
+    )
+    mock_update_user.assert_called_once_with(
+        unique_id=stub_unique_id,
+        new_user_registration_data={"name": "name"},
+        version_filter=None,
+    )
+
+
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_review.UserRepository.update_user",
+    return_value=stub_user_updated,
+)
+@patch.object(UserReviewDataService, "_get_write_mode", return_value="full")
+async def test_update_user_in_full_mode_sets_whole_document(
+    mocked_write_mode, mock_update_user
+):
+    user_review_model = MagicMock()
+    new_user_registration_data = deepcopy(stub_user_from_database)
+    await UserReviewDataService._update_user(
+        unique_id=stub_unique_id,
+        new_user_registration_data=new_user_registration_data,
+        user_review_model=user_review_model,
+    )
+    mock_update_user.assert_called_once_with(
+        unique_id=stub_unique_id,
+        new_user_registration_data=new_user_registration_data,
+        version_filter=None,
+    )
+
+
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_review.UserRepository.update_user",
+    return_value=stub_user_not_updated,
+)
+async def test_update_user_with_stale_version_raises_conflict(mock_update_user):
+    with pytest.raises(UserUpdateConflict):
+        await UserReviewDataService._update_user(
+            unique_id=stub_unique_id,
+            new_user_registration_data=deepcopy(stub_user_from_database),
+            version_filter={UserReviewDataService.version_field: None},
+        )
+
+
+@pytest.mark.asyncio
+@patch("func.src.services.user_review.UserRepository.update_user")
+@patch(
+    "func.src.services.user_review.UserRepository.update_user_with_outbox",
+    return_value=stub_user_updated,
+)
+@patch.object(UserReviewDataService, "_get_write_mode", return_value="full")
+async def test_update_user_with_outbox_events(
+    mocked_write_mode, mock_update_with_outbox, mock_update_user
+):
+    outbox_events = [{"_id": "key"}]
+    new_user_registration_data = deepcopy(stub_user_from_database)
+    await UserReviewDataService._update_user(
+        unique_id=stub_unique_id,
+        new_user_registration_data=new_user_registration_data,
+        outbox_events=outbox_events,
+    )
+    mock_update_user.assert_not_called()
+    mock_update_with_outbox.assert_called_once_with(
+        unique_id=stub_unique_id,
+        new_user_registration_data=new_user_registration_data,
+        outbox_events=outbox_events,
+        version_filter=None,
+    )
+
+
+def test_get_version_filter():
+    last_update = datetime(2022, 1, 1)
+    user_data = {
+        "record_date_control": {
+            "registry_updates": {"last_registration_data_update": last_update}
+        }
+    }
+    version_filter = UserReviewDataService._get_version_filter(user_data=user_data)
+    assert version_filter == {UserReviewDataService.version_field: last_update}
+
+
+def test_get_version_filter_without_record_date_control():
+    version_filter = UserReviewDataService._get_version_filter(user_data={})
+    assert version_filter == {UserReviewDataService.version_field: None}
+
+
+@pytest.mark.asyncio
+@patch.object(UserReviewDataService, "_publish_after_update")
+@patch.object(UserReviewDataService, "_wait_before_retry")
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(update={"user_update_max_retries": 2}),
+)
+@patch.object(UserReviewDataService, "_apply_user_update")
+async def test_update_user_data_retries_on_conflict(
+    mocked_apply, mocked_settings, mocked_wait, mocked_publish
+):
+    user_review_model = MagicMock()
+    audit_messages = ({"score": 1}, {"unique_id": stub_unique_id})
+    mocked_apply.side_effect = [
+        UserUpdateConflict(),
+        (user_review_model, audit_messages),
+    ]
+    user_loader = MagicMock()
+    await UserReviewDataService.update_user_data(
+        unique_id=stub_unique_id,
+        payload_validated={},
+        user_loader=user_loader,
+    )
+    assert mocked_apply.call_count == 2
+    user_loader.invalidate.assert_called_once_with()
+    mocked_wait.assert_called_once_with(attempt=0, backoff_ms=20.0)
+    mocked_publish.assert_called_once_with(user_review_model, *audit_messages)
+
+
+@pytest.mark.asyncio
+@patch.object(UserReviewDataService, "_publish_after_update")
+@patch.object(UserReviewDataService, "_wait_before_retry")
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=stub_settings.copy(update={"user_update_max_retries": 2}),
+)
+@patch.object(
+    UserReviewDataService, "_apply_user_update", side_effect=UserUpdateConflict()
+)
+async def test_update_user_data_gives_up_after_max_retries(
+    mocked_apply, mocked_settings, mocked_wait, mocked_publish
+):
+    with pytest.raises(ErrorToUpdateUser):
+        await UserReviewDataService.update_user_data(
+            unique_id=stub_unique_id,
+            payload_validated={},
+            user_loader=MagicMock(),
+        )
+    assert mocked_apply.call_count == 3
+    assert mocked_wait.call_count == 2
+    mocked_publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(IaraTransport, "send_to_update_queues")
+@patch("func.src.services.user_review.Audit.send_message_log_to_rate_client_risk")
+@patch(
+    "func.src.services.user_review.Audit.send_message_log_to_update_registration_data"
+)
+@patch(
+    "func.src.services.user_review.Audit.get_message_log_to_rate_client_risk",
+    return_value={"score": 1},
+)
+@patch(
+    "func.src.services.user_review.Audit.get_message_log_to_update_registration_data",
+    return_value={"unique_id": stub_unique_id},
+)
+@patch.object(Regis, "rate_client_risk", new_callable=AsyncMock)
+@patch(
+    "func.src.services.user_review.UserRepository.update_user",
+    side_effect=[stub_user_not_updated, stub_user_updated],
+)
+@patch.object(
+    UserReviewDataService,
+    "_get_user_data",
+    side_effect=lambda user_loader: deepcopy(stub_user_from_database),
+)
+@patch.object(UserReviewDataService, "_wait_before_retry")
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_update_user_data_publishes_once_after_conflict(
+    mocked_settings,
+    mocked_wait,
+    mocked_get_user,
+    mocked_update_user,
+    mocked_regis,
+    mocked_registration_message,
+    mocked_risk_message,
+    mocked_send_registration,
+    mocked_send_risk,
+    mocked_iara,
+):
+    mocked_regis.return_value = MagicMock(risk_approval=True)
+    mocked_iara.return_value = {}
+    await UserReviewDataService.update_user_data(
+        unique_id=stub_unique_id,
+        payload_validated=stub_payload_validated.dict(),
+        user_loader=MagicMock(),
+    )
+    assert mocked_update_user.call_count == 2
+    mocked_send_risk.assert_called_once_with(message={"score": 1})
+    mocked_send_registration.assert_called_once_with(
+        message={"unique_id": stub_unique_id}
+    )
+    mocked_iara.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(IaraTransport, "send_to_update_queues")
+@patch("func.src.services.user_review.Audit.send_message_log_to_rate_client_risk")
+@patch(
+    "func.src.services.user_review.Audit.send_message_log_to_update_registration_data"
+)
+async def test_publish_after_update_logs_failed_topics(
+    mocked_send_registration, mocked_send_risk, mocked_iara, mocked_logger
+):
+    mocked_iara.return_value = {
+        IaraTopics.SINACOR_UPDATE: True,
+        IaraTopics.DW_UPDATE: False,
+    }
+    await UserReviewDataService._publish_after_update(
+        MagicMock(unique_id=stub_unique_id), {"score": 1}, {}
+    )
+    mocked_send_risk.assert_called_once_with(message={"score": 1})
+    mocked_send_registration.assert_called_once_with(message={})
+    mocked_logger.assert_called_once()
+    assert mocked_logger.call_args.kwargs["failed_topics"] == [
+        IaraTopics.DW_UPDATE.value
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(IaraTransport, "send_to_update_queues")
+@patch("func.src.services.user_review.Audit.send_message_log_to_rate_client_risk")
+@patch(
+    "func.src.services.user_review.Audit.send_message_log_to_update_registration_data"
+)
+async def test_publish_after_update_when_all_topics_are_published(
+    mocked_send_registration, mocked_send_risk, mocked_iara, mocked_logger
+):
+    mocked_iara.return_value = {
+        IaraTopics.SINACOR_UPDATE: True,
+        IaraTopics.DW_UPDATE: True,
+    }
+    await UserReviewDataService._publish_after_update(MagicMock(), {}, {})
+    mocked_logger.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(IaraTransport, "send_to_update_queues")
+@patch(
+    "func.src.services.user_review.Audit.send_message_log_to_rate_client_risk",
+    side_effect=ErrorOnSendAuditLog(),
+)
+@patch(
+    "func.src.services.user_review.Audit.send_message_log_to_update_registration_data"
+)
+async def test_publish_after_update_publishes_to_iara_when_audit_fails(
+    mocked_send_registration, mocked_send_risk, mocked_iara, mocked_logger
+):
+    mocked_iara.return_value = {
+        IaraTopics.SINACOR_UPDATE: True,
+        IaraTopics.DW_UPDATE: True,
+    }
+    user_review_model = MagicMock(unique_id=stub_unique_id)
+    with pytest.raises(ErrorOnSendAuditLog):
+        await UserReviewDataService._publish_after_update(
+            user_review_model, {"score": 1}, {}
+        )
+    mocked_send_registration.assert_called_once_with(message={})
+    mocked_iara.assert_called_once_with(user_review_model)
+    mocked_logger.assert_called_once()
+    assert mocked_logger.call_args.kwargs["unique_id"] == stub_unique_id
+
+
+@pytest.mark.asyncio
+@patch("func.src.services.user_review.asyncio.sleep")
+async def test_wait_before_retry_is_jittered_and_bounded(mocked_sleep):
+    for attempt in range(3):
+        await UserReviewDataService._wait_before_retry(attempt=attempt, backoff_ms=20)
+        (delay,) = mocked_sleep.call_args.args
+        assert 0 <= delay <= 0.02 * 2**attempt
+
+
+class _RecordingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_fields = set()
+
+    def get(self, key, default=None):
+        self.read_fields.add(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        self.read_fields.add(key)
+        return super().__getitem__(key)
+
+
+@pytest.mark.asyncio
+@patch("func.src.services.user_review.Audit.get_message_log_to_rate_client_risk")
+@patch.object(Regis, "rate_client_risk", new_callable=AsyncMock)
+async def test_user_document_fields_cover_fields_read_on_update(
+    mocked_regis, mocked_audit
+):
+    mocked_regis.return_value = MagicMock(risk_approval=True)
+    user_data = _RecordingDict(deepcopy(stub_user_from_database))
+    registration_builder = UpdateCustomerRegistrationBuilder(
+        old_personal_data=user_data,
+        new_personal_data=stub_payload_validated.dict(),
+        unique_id=stub_unique_id,
+    )
+    new_user_registration_data, _ = registration_builder.build()
+    user_review_model = MagicMock(new_user_registration_data=new_user_registration_data)
+    UserReviewDataService._get_version_filter(user_data=user_data)
+    await UserReviewDataService.rate_client_risk(user_review_model, user_data)
+
+    not_projected = user_data.read_fields - set(
+        UserReviewDataService.user_document_fields
+    )
+    assert not_projected == set()
+
+
 dummy_value = MagicMock()
 
 
@@ -196,7 +547,7 @@ async def test_check_if_able_to_update_us_with_warning(mocked_logger, mocked_tra
 
 
 @pytest.mark.asyncio
-@patch("func.src.services.user_review.Audit.record_message_log_to_rate_client_risk")
+@patch("func.src.services.user_review.Audit.get_message_log_to_rate_client_risk")
 @patch.object(
     Regis,
     "rate_client_risk",
@@ -231,14 +582,18 @@ async def test_rate_client_risk(mock_warning, rate_client_risk, audit_log):
 
 
 @pytest.mark.asyncio
+@patch(
+    "func.src.services.user_review.UserRepository.get_user",
+    return_value=stub_user_from_database,
+)
 @patch.object(Gladsheim, "warning")
-@patch("func.src.services.user_review.Audit.record_message_log_to_rate_client_risk")
+@patch("func.src.services.user_review.Audit.get_message_log_to_rate_client_risk")
 @patch.object(
     Regis,
     "rate_client_risk",
 )
 async def test_rate_client_risk_when_risk_is_not_aprroved(
-    rate_client_risk, audit_log, etria_warning
+    rate_client_risk, audit_log, etria_warning, mocked_get_user
 ):
     risk_data_stub = RegisResponse(
         risk_score=19,
@@ -259,10 +614,57 @@ async def test_rate_client_risk_when_risk_is_not_aprroved(
     )
     assert etria_warning.called
     assert rate_client_risk.called
+    mocked_get_user.assert_called_once_with(unique_id=stub_unique_id)
+
+
+@pytest.mark.asyncio
+@patch(
+    "func.src.services.user_review.UserRepository.get_user",
+    return_value={"unique_id": stub_unique_id, "bureau_status": "approved"},
+)
+@patch.object(Gladsheim, "warning")
+@patch.object(Regis, "rate_client_risk", new_callable=AsyncMock)
+async def test_rate_client_risk_audit_keeps_fields_outside_the_projection(
+    rate_client_risk, etria_warning, mocked_get_user
+):
+    assert "bureau_status" not in UserReviewDataService.user_document_fields
+    rate_client_risk.return_value = MagicMock(
+        risk_score=19,
+        risk_rating=MagicMock(value="D"),
+        risk_approval=False,
+        expiration_date=datetime.now(),
+    )
+    rate_client_risk.return_value.risk_validations.to_dict.return_value = {}
+    user_review_model = UserReviewModel(
+        user_review_data={},
+        unique_id=stub_unique_id,
+        modified_register_data={},
+        new_user_registration_data={
+            "name": "new name",
+            "assets": {"patrimony": 1.0},
+            "address": {"city": 1},
+            "occupation": {"activity": 1},
+            "record_date_control": {},
+        },
+        device_info=None,
+    )
+
+    async def _get_audit_template(user_review_model):
+        return await user_review_model.get_audit_template_to_update_risk_data()
+
+    with patch(
+        "func.src.services.user_review.Audit.get_message_log_to_rate_client_risk",
+        side_effect=_get_audit_template,
+    ):
+        audit_message = await UserReviewDataService.rate_client_risk(
+            user_review_model, {"unique_id": stub_unique_id}
+        )
+    assert audit_message["user_data"]["bureau_status"] == "approved"
+    assert audit_message["user_data"]["name"] == "new name"
 
 
 @pytest.mark.asyncio
-@patch("func.src.services.user_review.Audit.record_message_log_to_rate_client_risk")
+@patch("func.src.services.user_review.Audit.get_message_log_to_rate_client_risk")
 @patch.object(
     Regis,
     "rate_client_risk",
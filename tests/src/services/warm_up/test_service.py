@@ -0,0 +1,86 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from etria_logger import Gladsheim
+
+from func.src.services.warm_up import WarmUpService
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_run_step(mocked_logger):
+    result = await WarmUpService._run_step("mongo", AsyncMock())
+    assert result["step"] == "mongo"
+    assert result["success"] is True
+    assert result["duration_ms"] >= 0
+    mocked_logger.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_run_step_failed(mocked_logger):
+    result = await WarmUpService._run_step(
+        "oracle", AsyncMock(side_effect=ValueError())
+    )
+    assert result["success"] is False
+    mocked_logger.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Gladsheim, "info")
+async def test_warm_up(mocked_info, mocked_error):
+    steps = {
+        "mongo": AsyncMock(),
+        "oracle": AsyncMock(side_effect=ValueError()),
+    }
+    with patch.object(WarmUpService, "_get_steps", return_value=steps):
+        report = await WarmUpService.warm_up()
+        same_report = await WarmUpService.warm_up()
+    assert report is same_report
+    assert report["success"] is False
+    assert [step["step"] for step in report["steps"]] == ["mongo", "oracle"]
+    steps["mongo"].assert_called_once_with()
+    mocked_info.assert_called_once()
+    await WarmUpService.stop()
+    assert WarmUpService.warm_up_task is None
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_warm_up():
+    async def _slow_step():
+        await asyncio.sleep(10)
+
+    with patch.object(WarmUpService, "_get_steps", return_value={"mongo": _slow_step}):
+        task = WarmUpService.start()
+        await asyncio.sleep(0)
+    await WarmUpService.stop()
+    assert task.cancelled()
+    assert WarmUpService.warm_up_task is None
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "info")
+async def test_warm_up_is_retried_after_an_interrupted_run(mocked_info):
+    with patch.object(WarmUpService, "_warm_up", side_effect=[ValueError(), {}]):
+        with pytest.raises(ValueError):
+            await WarmUpService.warm_up()
+        assert WarmUpService.warm_up_task is None
+        report = await WarmUpService.warm_up()
+    assert report == {}
+    assert WarmUpService.warm_up_task.done()
+    await WarmUpService.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_warm_up_is_forgotten():
+    async def _slow_step():
+        await asyncio.sleep(10)
+
+    with patch.object(WarmUpService, "_get_steps", return_value={"mongo": _slow_step}):
+        task = WarmUpService.start()
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    assert WarmUpService.warm_up_task is None
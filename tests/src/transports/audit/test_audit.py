@@ -1,6 +1,9 @@
 # Jormungandr - Onboarding
 from func.src.domain.exceptions.exceptions import ErrorOnSendAuditLog
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.transports.audit.publisher import AuditPublisher
 from func.src.transports.audit.transport import Audit
+from tests.src.domain.settings.stubs import stub_settings
 from tests.src.services.user_review.stubs import stub_user_review_model
 
 # Standards
@@ -15,9 +18,9 @@ import pytest
     "func.src.transports.audit.transport.Persephone.send_to_persephone",
     return_value=(1, 0),
 )
-@patch("func.src.transports.audit.transport.config")
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
 async def test_when_success_to_record_message_then_return_true(
-    mock_config, mock_persephone
+    mocked_settings, mock_persephone
 ):
     result = await Audit.record_message_log_to_update_registration_data(
         user_review_model=stub_user_review_model
@@ -31,9 +34,23 @@ async def test_when_success_to_record_message_then_return_true(
     "func.src.transports.audit.transport.Persephone.send_to_persephone",
     return_value=(0, 0),
 )
-@patch("func.src.transports.audit.transport.config")
-async def test_when_fail_to_record_message_then_raises(mock_config, mock_persephone):
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_when_fail_to_record_message_then_raises(
+    mocked_settings, mock_persephone
+):
     with pytest.raises(ErrorOnSendAuditLog):
         await Audit.record_message_log_to_update_registration_data(
             user_review_model=stub_user_review_model
         )
+
+
+@pytest.mark.asyncio
+@patch.object(AuditPublisher, "send", return_value=(0, 0))
+@patch.object(AuditPublisher, "is_enabled", return_value=True)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_when_batching_fails_to_record_message_then_raises(
+    mocked_settings, mocked_enabled, mocked_send
+):
+    with pytest.raises(ErrorOnSendAuditLog):
+        await Audit.send_message_log_to_rate_client_risk(message={})
+    mocked_send.assert_called_once()
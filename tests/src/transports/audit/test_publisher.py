@@ -0,0 +1,99 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.transports.audit.publisher import AuditPublisher
+from tests.src.domain.settings.stubs import stub_settings
+
+
+@pytest.fixture(autouse=True)
+def reset_publisher():
+    yield
+    AuditPublisher.capacity = None
+    AuditPublisher.in_flight = set()
+
+
+def _settings(values: dict):
+    return stub_settings.copy(update=values)
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_send(mocked_settings):
+    with patch.object(
+        AuditPublisher.audit_client, "send_to_persephone", return_value=(True, 0)
+    ) as mocked_send:
+        result = await AuditPublisher.send("topic", 1, {"first": 1}, "schema")
+    assert result == (True, 0)
+    mocked_send.assert_called_once_with(
+        topic="topic", partition=1, message={"first": 1}, schema_name="schema"
+    )
+    assert AuditPublisher.get_in_flight_count() == 0
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_send_propagates_client_errors(mocked_settings):
+    with patch.object(
+        AuditPublisher.audit_client, "send_to_persephone", side_effect=ValueError()
+    ):
+        with pytest.raises(ValueError):
+            await AuditPublisher.send("topic", 1, {"first": 1}, "schema")
+    assert not AuditPublisher.is_saturated()
+
+
+@pytest.mark.asyncio
+@patch.object(
+    SettingsInfrastructure,
+    "get_settings",
+    return_value=_settings({"audit_max_in_flight": 1}),
+)
+async def test_send_applies_backpressure(mocked_settings):
+    release_send = asyncio.Event()
+
+    async def _slow_send(**kwargs):
+        await release_send.wait()
+        return True, 0
+
+    with patch.object(
+        AuditPublisher.audit_client, "send_to_persephone", side_effect=_slow_send
+    ):
+        first_send = asyncio.ensure_future(
+            AuditPublisher.send("topic", 1, {"first": 1}, "schema")
+        )
+        await asyncio.sleep(0)
+        assert AuditPublisher.is_saturated()
+        second_send = asyncio.ensure_future(
+            AuditPublisher.send("topic", 1, {"second": 2}, "schema")
+        )
+        await asyncio.sleep(0)
+        assert AuditPublisher.get_in_flight_count() == 1
+        release_send.set()
+        assert await asyncio.gather(first_send, second_send) == [(True, 0), (True, 0)]
+    assert AuditPublisher.get_in_flight_count() == 0
+
+
+@pytest.mark.asyncio
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_close_waits_for_sends_of_cancelled_requests(mocked_settings):
+    release_send = asyncio.Event()
+
+    async def _slow_send(**kwargs):
+        await release_send.wait()
+        return True, 0
+
+    with patch.object(
+        AuditPublisher.audit_client, "send_to_persephone", side_effect=_slow_send
+    ):
+        request = asyncio.ensure_future(
+            AuditPublisher.send("topic", 1, {"first": 1}, "schema")
+        )
+        await asyncio.sleep(0)
+        request.cancel()
+        (send_task,) = AuditPublisher.in_flight
+        release_send.set()
+        await AuditPublisher.close()
+    assert send_task.result() == (True, 0)
+    assert AuditPublisher.get_in_flight_count() == 0
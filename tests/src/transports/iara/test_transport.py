@@ -1,10 +1,13 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from etria_logger import Gladsheim
-from iara_client import Iara
+from iara_client import Iara, IaraTopics
 
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
 from func.src.transports.iara.transport import IaraTransport
+from tests.src.domain.settings.stubs import stub_settings
 
 stub_user = MagicMock()
 
@@ -45,3 +48,36 @@ async def test_send_to_drive_wealth_update_queue_with_errors(mocked_logger, mock
     mocked_lib.return_value = False, dummy_value
     await IaraTransport.send_to_drive_wealth_update_queue(stub_user)
     mocked_logger.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(IaraTransport, "send_to_drive_wealth_update_queue", return_value=False)
+@patch.object(IaraTransport, "send_to_sinacor_update_queue", return_value=True)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
+async def test_send_to_update_queues(mocked_settings, mocked_sinacor, mocked_dw):
+    result = await IaraTransport.send_to_update_queues(stub_user)
+    assert result == {IaraTopics.SINACOR_UPDATE: True, IaraTopics.DW_UPDATE: False}
+    mocked_sinacor.assert_called_once_with(stub_user)
+    mocked_dw.assert_called_once_with(stub_user)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_publish_with_timeout_when_broker_is_slow(mocked_logger):
+    slow_publish = asyncio.sleep(1, result=True)
+    result = await IaraTransport._publish_with_timeout(
+        publish=slow_publish, topic=IaraTopics.DW_UPDATE, timeout=0.01
+    )
+    assert result is False
+    mocked_logger.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_publish_with_timeout_when_publish_raises(mocked_logger):
+    failed_publish = AsyncMock(side_effect=ValueError())()
+    result = await IaraTransport._publish_with_timeout(
+        publish=failed_publish, topic=IaraTopics.SINACOR_UPDATE, timeout=1
+    )
+    assert result is False
+    mocked_logger.assert_called_once()
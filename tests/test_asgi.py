@@ -0,0 +1,142 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+
+from func import asgi
+
+
+def _build_receive(*messages: dict):
+    pending_messages = list(messages)
+
+    async def receive():
+        return pending_messages.pop(0)
+
+    return receive
+
+
+def _build_send(sent_messages: list):
+    async def send(message: dict):
+        sent_messages.append(message)
+
+    return send
+
+
+def _http_scope(path: str, method: str, headers: list = None) -> dict:
+    return {"type": "http", "path": path, "method": method, "headers": headers or []}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path,method,status",
+    [
+        ("/healthz", "GET", HTTPStatus.OK),
+        ("/unknown", "GET", HTTPStatus.NOT_FOUND),
+    ],
+)
+async def test_static_routes(path, method, status):
+    sent_messages = []
+    await asgi.app(
+        _http_scope(path, method), _build_receive(), _build_send(sent_messages)
+    )
+    assert sent_messages[0]["status"] == status
+    assert sent_messages[1]["body"] == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/specialize", "/v2/specialize"])
+@patch.object(asgi.WarmUpService, "warm_up", return_value={"success": True})
+async def test_specialize_routes(mocked_warm_up, path):
+    sent_messages = []
+    await asgi.app(
+        _http_scope(path, "POST"), _build_receive(), _build_send(sent_messages)
+    )
+    mocked_warm_up.assert_called_once_with()
+    assert sent_messages[0]["status"] == HTTPStatus.OK
+    assert (b"content-type", b"application/json") in sent_messages[0]["headers"]
+    assert sent_messages[1]["body"] == b'{"success": true}'
+
+
+@pytest.mark.asyncio
+@patch.object(
+    asgi.MongoDBInfrastructure,
+    "get_pool_stats",
+    return_value={"localhost:27017": {"open": 2, "checked_out": 1}},
+)
+@patch.object(
+    asgi.OracleInfrastructure, "get_pool_stats", return_value={"open": 2, "busy": 0}
+)
+async def test_stats_route(mocked_oracle_pool_stats, mocked_pool_stats):
+    sent_messages = []
+    await asgi.app(
+        _http_scope("/stats", "GET"), _build_receive(), _build_send(sent_messages)
+    )
+    mocked_pool_stats.assert_called_once_with()
+    mocked_oracle_pool_stats.assert_called_once_with()
+    assert sent_messages[0]["status"] == HTTPStatus.OK
+    assert (b"content-type", b"application/json") in sent_messages[0]["headers"]
+    assert sent_messages[1]["body"] == (
+        b'{"mongo": {"localhost:27017": {"open": 2, "checked_out": 1}}, '
+        b'"oracle": {"open": 2, "busy": 0}}'
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(asgi, "update_user_data")
+async def test_update_user_data_route(mocked_handler):
+    mocked_handler.return_value = (
+        HTTPStatus.OK,
+        [("content-type", "application/json")],
+        b'{"success": true}',
+    )
+    sent_messages = []
+    receive = _build_receive(
+        {"type": "http.request", "body": b'{"per', "more_body": True},
+        {"type": "http.request", "body": b'sonal": {}}', "more_body": False},
+    )
+    scope = _http_scope("/", "POST", headers=[(b"X-Thebes-Answer", b"jwt")])
+
+    await asgi.app(scope, receive, _build_send(sent_messages))
+
+    mocked_handler.assert_called_once_with(
+        headers={"x-thebes-answer": "jwt"}, body=b'{"personal": {}}'
+    )
+    assert sent_messages[0] == {
+        "type": "http.response.start",
+        "status": HTTPStatus.OK,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", b"17"),
+        ],
+    }
+    assert sent_messages[1] == {
+        "type": "http.response.body",
+        "body": b'{"success": true}',
+    }
+
+
+@pytest.mark.asyncio
+@patch.object(asgi, "shutdown")
+@patch.object(asgi, "startup")
+async def test_lifespan(mocked_startup, mocked_shutdown):
+    sent_messages = []
+    receive = _build_receive(
+        {"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}
+    )
+    await asgi.app({"type": "lifespan"}, receive, _build_send(sent_messages))
+    mocked_startup.assert_called_once_with()
+    mocked_shutdown.assert_called_once_with()
+    assert [message["type"] for message in sent_messages] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+
+
+@pytest.mark.asyncio
+@patch.object(asgi, "startup", side_effect=ValueError("boom"))
+@patch.object(asgi.Gladsheim, "error")
+async def test_lifespan_startup_failed(mocked_logger, mocked_startup):
+    sent_messages = []
+    receive = _build_receive({"type": "lifespan.startup"})
+    await asgi.app({"type": "lifespan"}, receive, _build_send(sent_messages))
+    assert sent_messages == [{"type": "lifespan.startup.failed", "message": "boom"}]
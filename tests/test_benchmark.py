@@ -0,0 +1,32 @@
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from func import benchmark
+from func.benchmark import RequestBenchmark
+
+
+@pytest.mark.asyncio
+@patch.object(benchmark, "update_user_data", new_callable=AsyncMock)
+async def test_run(mocked_handler):
+    mocked_handler.side_effect = [
+        (HTTPStatus.OK, [], b"{}"),
+        (HTTPStatus.OK, [], b"{}"),
+        (HTTPStatus.BAD_REQUEST, [], b"{}"),
+    ]
+    report = await RequestBenchmark(
+        headers={"X-Thebes-Answer": "jwt"}, body=b"{}", requests=3, concurrency=2
+    ).run()
+    mocked_handler.assert_called_with(headers={"x-thebes-answer": "jwt"}, body=b"{}")
+    assert mocked_handler.call_count == 3
+    assert report["requests"] == 3
+    assert report["concurrency"] == 2
+    assert report["statuses"] == {200: 2, 400: 1}
+    assert set(report["latency_ms"]) == {"p50", "p90", "p99"}
+
+
+def test_get_percentile():
+    latencies = [0.1, 0.2, 0.3, 0.4]
+    assert RequestBenchmark._get_percentile(latencies, 50) == 0.3
+    assert RequestBenchmark._get_percentile(latencies, 99) == 0.4
@@ -0,0 +1,52 @@
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+from func import flask_app
+
+
+@patch.object(flask_app, "update_user_data", new_callable=AsyncMock)
+def test_update_user_data_route(mocked_handler):
+    mocked_handler.return_value = (
+        HTTPStatus.OK,
+        [("content-type", "application/json")],
+        b'{"success": true}',
+    )
+    client = flask_app.app.test_client()
+
+    response = client.post(
+        "/", data=b'{"personal": {}}', headers={"X-Thebes-Answer": "jwt"}
+    )
+
+    headers = mocked_handler.call_args.kwargs["headers"]
+    assert headers["x-thebes-answer"] == "jwt"
+    assert mocked_handler.call_args.kwargs["body"] == b'{"personal": {}}'
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == "application/json"
+    assert response.get_data() == b'{"success": true}'
+
+
+def test_healthz_route():
+    response = flask_app.app.test_client().get("/healthz")
+    assert response.status_code == HTTPStatus.OK
+
+
+@patch.object(flask_app, "update_user_data", new_callable=AsyncMock)
+def test_update_user_data_route_reuses_the_event_loop(mocked_handler):
+    loops = []
+
+    async def _handler(headers: dict, body: bytes):
+        loops.append(asyncio.get_running_loop())
+        return HTTPStatus.OK, [("content-type", "application/json")], body
+
+    mocked_handler.side_effect = _handler
+    client = flask_app.app.test_client()
+
+    first_response = client.post("/", data=b"first")
+    second_response = client.post("/", data=b"second")
+
+    assert first_response.get_data() == b"first"
+    assert second_response.get_data() == b"second"
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loops[0] is flask_app.app.get_loop()
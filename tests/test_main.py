@@ -1,13 +1,17 @@
+import asyncio
 import logging.config
 from http import HTTPStatus
 from unittest.mock import patch, MagicMock
 
-import flask
 import pytest
 from decouple import RepositoryEnv, Config
 
+from func.src.infrastructures.settings.infrastructure import SettingsInfrastructure
+from func.src.repositories.mongo_db.user.repository import UserRepository
 from func.src.services.liveness import LivenessService
+from func.src.services.user_loader import UserDocumentLoader
 from func.src.transports.device_info.transport import DeviceSecurity
+from tests.src.domain.settings.stubs import stub_settings
 
 with patch.object(RepositoryEnv, "__init__", return_value=None):
     with patch.object(Config, "__init__", return_value=None):
@@ -36,6 +40,9 @@ with patch.object(RepositoryEnv, "__init__", return_value=None):
                 )
                 from func.src.services.user_review import UserReviewDataService
 
+stub_legacy_headers = {"x-thebes-answer": "jwt", "x-device-info": "device_info"}
+stub_body = b"{}"
+
 error_on_decode_jwt_case = (
     ErrorOnDecodeJwt(),
     ErrorOnDecodeJwt.msg,
@@ -160,17 +167,13 @@ exception_case = (
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(Gladsheim, "error")
 @patch.object(JwtService, "decode_jwt")
-@patch.object(ResponseModel, "__init__", return_value=None)
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "build_http_response")
 @patch.object(DeviceSecurity, "get_device_info")
 @patch.object(LivenessService, "validate")
 async def test_update_user_data_raising_errors(
     mocked_liveness,
     device_info,
-    mocked_build_response,
     mocked_model,
-    mocked_response_instance,
     mocked_jwt_decode,
     mocked_logger,
     mocked_service,
@@ -182,15 +185,13 @@ async def test_update_user_data_raising_errors(
     response_message,
     response_status_code,
 ):
-    monkeypatch.setattr(flask, "request", MagicMock())
     mocked_jwt_decode.side_effect = exception
-    await update_user_data()
+    response = await update_user_data(headers=stub_legacy_headers, body=stub_body)
     mocked_service.assert_not_called()
     mocked_logger.assert_called_once_with(error=exception, message=error_message)
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=False, code=internal_status_code, message=response_message
-    )
-    mocked_build_response.assert_called_once_with(status=response_status_code)
+    ).build_raw_response(status=response_status_code)
 
 
 @pytest.mark.asyncio
@@ -201,15 +202,11 @@ async def test_update_user_data_raising_errors(
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(UserReviewDataService, "check_if_able_to_update")
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "__init__", return_value=None)
-@patch.object(ResponseModel, "build_http_response")
 @patch.object(DeviceSecurity, "get_device_info")
 @patch.object(LivenessService, "validate")
 async def test_update_user_review_without_headers(
     mocked_liveness,
     device_info,
-    mocked_build_response,
-    mocked_response_instance,
     mocked_rules_application,
     mocked_validation_step,
     mocked_validation_server_instance,
@@ -217,23 +214,17 @@ async def test_update_user_review_without_headers(
     mocked_instance,
     mocked_jwt_decode,
     mocked_logger,
-    monkeypatch,
 ):
-    request_mock = MagicMock()
-    request_mock.headers.get.return_value = None
-    monkeypatch.setattr(flask, "request", request_mock)
-    await update_user_data()
+    response = await update_user_data(headers={}, body=b"")
     mocked_validation.assert_not_called()
     mocked_logger.assert_called_once()
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=False, code=InternalCode.JWT_INVALID, message="Error when trying to decode jwt"
-    )
-    mocked_build_response.assert_called_once_with(status=HTTPStatus.UNAUTHORIZED)
-
-dummy_response = "response"
+    ).build_raw_response(status=HTTPStatus.UNAUTHORIZED)
 
 
 @pytest.mark.asyncio
+@patch.object(UserDocumentLoader, "load")
 @patch.object(Gladsheim, "error")
 @patch.object(JwtService, "decode_jwt", return_value={"user": {"unique_id": "id"}})
 @patch.object(UserEnumerateService, "__init__", return_value=None)
@@ -241,15 +232,11 @@ dummy_response = "response"
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(UserReviewDataService, "check_if_able_to_update")
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "__init__", return_value=None)
-@patch.object(ResponseModel, "build_http_response", return_value=dummy_response)
 @patch.object(DeviceSecurity, "get_device_info")
 @patch.object(LivenessService, "validate")
 async def test_update_user_data(
     mocked_liveness,
     device_info,
-    mocked_build_response,
-    mocked_response_instance,
     mocked_rules_application,
     mocked_validation_step,
     mocked_validation_server_instance,
@@ -257,19 +244,16 @@ async def test_update_user_data(
     mocked_instance,
     mocked_jwt_decode,
     mocked_logger,
-    monkeypatch,
+    mocked_user_prefetch,
 ):
-    monkeypatch.setattr(flask, "request", MagicMock())
-    response = await update_user_data()
+    response = await update_user_data(headers=stub_legacy_headers, body=stub_body)
     mocked_jwt_decode.assert_called()
     mocked_logger.assert_not_called()
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=True,
         code=InternalCode.SUCCESS,
         message="User data successfully updated",
-    )
-    mocked_build_response.assert_called_once_with(status=HTTPStatus.OK)
-    assert dummy_response == response
+    ).build_raw_response(status=HTTPStatus.OK)
 
 
 @pytest.mark.asyncio
@@ -280,15 +264,11 @@ async def test_update_user_data(
 @patch.object(UserEnumerateService, "validate_enumerate_params")
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "__init__", return_value=None)
-@patch.object(Config, "__call__")
-@patch.object(ResponseModel, "build_http_response", return_value=dummy_response)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
 @patch.object(DeviceSecurity, "get_device_info")
 async def test_update_user_risk(
     device_info,
-    mocked_build_response,
-    mocked_config,
-    mocked_response_instance,
+    mocked_settings,
     mocked_model,
     mocked_rules_application,
     mocked_validation_server_instance,
@@ -296,24 +276,19 @@ async def test_update_user_risk(
     mocked_jwt_decode,
     mocked_logger,
     mocked_service,
-    monkeypatch,
 ):
-    request_mock = MagicMock()
-    mocked_config.return_value = "api_key"
-    request_mock.headers.get.side_effect = None, "api_key", "unique_id"
-    monkeypatch.setattr(flask, "request", request_mock)
-    response = await update_user_data()
+    response = await update_user_data(
+        headers={"x-api-key": "api_key", "unique_id": "unique_id"}, body=b""
+    )
     mocked_jwt_decode.assert_not_called()
     mocked_service.assert_not_called()
     mocked_rules_application.assert_called()
     mocked_logger.assert_not_called()
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=True,
         code=InternalCode.SUCCESS,
         message="User data successfully updated",
-    )
-    mocked_build_response.assert_called_once_with(status=HTTPStatus.OK)
-    assert dummy_response == response
+    ).build_raw_response(status=HTTPStatus.OK)
 
 
 @pytest.mark.asyncio
@@ -325,15 +300,11 @@ async def test_update_user_risk(
 @patch.object(UserEnumerateService, "validate_enumerate_params")
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "__init__", return_value=None)
-@patch.object(Config, "__call__")
-@patch.object(ResponseModel, "build_http_response", return_value=dummy_response)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
 @patch.object(DeviceSecurity, "get_device_info")
 async def test_update_user_risk_invalid_api_key(
     device_info,
-    mocked_build_response,
-    mocked_config,
-    mocked_response_instance,
+    mocked_settings,
     mocked_model,
     mocked_rules_application,
     mocked_validation_server_instance,
@@ -342,22 +313,18 @@ async def test_update_user_risk_invalid_api_key(
     mocked_jwt_decode,
     mocked_logger,
     mocked_service,
-    monkeypatch,
 ):
-    request_mock = MagicMock()
-    mocked_config.return_value = "api_key"
-    request_mock.headers.get.side_effect = None, "invalid_api_key", "unique_id"
-    monkeypatch.setattr(flask, "request", request_mock)
-    await update_user_data()
+    response = await update_user_data(
+        headers={"x-api-key": "invalid_api_key", "unique_id": "unique_id"}, body=b""
+    )
     mocked_jwt_decode.assert_not_called()
     mocked_service.assert_not_called()
     mocked_rules_application.assert_not_called()
     mocked_service.assert_not_called()
     mocked_logger.assert_called_once()
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=False, code=InternalCode.JWT_INVALID, message="Invalid Api Key"
-    )
-    mocked_build_response.assert_called_once_with(status=HTTPStatus.UNAUTHORIZED)
+    ).build_raw_response(status=HTTPStatus.UNAUTHORIZED)
 
 
 @pytest.mark.asyncio
@@ -369,15 +336,11 @@ async def test_update_user_risk_invalid_api_key(
 @patch.object(UserEnumerateService, "validate_enumerate_params")
 @patch.object(UserReviewDataService, "update_user_data")
 @patch.object(UserUpdateData, "__init__", return_value=None)
-@patch.object(ResponseModel, "__init__", return_value=None)
-@patch.object(Config, "__call__")
-@patch.object(ResponseModel, "build_http_response", return_value=dummy_response)
+@patch.object(SettingsInfrastructure, "get_settings", return_value=stub_settings)
 @patch.object(DeviceSecurity, "get_device_info")
 async def test_update_user_risk_invalid_unique_id(
     device_info,
-    mocked_build_response,
-    mocked_config,
-    mocked_response_instance,
+    mocked_settings,
     mocked_model,
     mocked_rules_application,
     mocked_validation_server_instance,
@@ -386,19 +349,80 @@ async def test_update_user_risk_invalid_unique_id(
     mocked_jwt_decode,
     mocked_logger,
     mocked_service,
-    monkeypatch,
 ):
-    request_mock = MagicMock()
-    mocked_config.return_value = "api_key"
-    request_mock.headers.get.side_effect = None, "api_key", None
-    monkeypatch.setattr(flask, "request", request_mock)
-    await update_user_data()
+    response = await update_user_data(headers={"x-api-key": "api_key"}, body=b"")
     mocked_jwt_decode.assert_not_called()
     mocked_service.assert_not_called()
     mocked_rules_application.assert_not_called()
     mocked_service.assert_not_called()
     mocked_logger.assert_called_once()
-    mocked_response_instance.assert_called_once_with(
+    assert response == ResponseModel(
         success=False, code=InternalCode.INVALID_PARAMS, message="Invalid params"
-    )
-    mocked_build_response.assert_called_once_with(status=HTTPStatus.BAD_REQUEST)
+    ).build_raw_response(status=HTTPStatus.BAD_REQUEST)
+
+
+@pytest.mark.asyncio
+@patch.object(UserDocumentLoader, "load")
+@patch.object(Gladsheim, "error")
+@patch.object(JwtService, "decode_jwt", return_value={"user": {"unique_id": "id"}})
+@patch.object(UserEnumerateService, "__init__", return_value=None)
+@patch.object(UserEnumerateService, "validate_enumerate_params")
+@patch.object(UserReviewDataService, "update_user_data")
+@patch.object(UserReviewDataService, "check_if_able_to_update")
+@patch.object(UserUpdateData, "__init__", return_value=None)
+@patch.object(DeviceSecurity, "get_device_info", side_effect=DeviceInfoRequestFailed())
+@patch.object(LivenessService, "validate")
+async def test_update_user_data_when_device_info_fails_after_jwt_decode(
+    mocked_liveness,
+    device_info,
+    mocked_rules_application,
+    mocked_validation_step,
+    mocked_service,
+    mocked_validation,
+    mocked_instance,
+    mocked_jwt_decode,
+    mocked_logger,
+    mocked_user_prefetch,
+):
+    response = await update_user_data(headers=stub_legacy_headers, body=stub_body)
+    mocked_jwt_decode.assert_called_once()
+    mocked_service.assert_not_called()
+    assert response == ResponseModel(
+        success=False,
+        code=InternalCode.INTERNAL_SERVER_ERROR,
+        message="Error trying to get device info",
+    ).build_raw_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(JwtService, "decode_jwt", return_value={"user": {"unique_id": "id"}})
+@patch.object(UserEnumerateService, "__init__", return_value=None)
+@patch.object(UserEnumerateService, "validate_enumerate_params")
+@patch.object(UserReviewDataService, "update_user_data")
+@patch.object(UserReviewDataService, "check_if_able_to_update")
+@patch.object(UserUpdateData, "__init__", return_value=None)
+@patch.object(LivenessService, "validate", side_effect=ErrorOnGetUniqueId())
+async def test_update_user_data_cancels_pending_work_on_failure(
+    mocked_liveness,
+    mocked_validation,
+    mocked_rules_application,
+    mocked_service,
+    mocked_validation_step,
+    mocked_instance,
+    mocked_jwt_decode,
+    mocked_logger,
+):
+    pending_work = []
+
+    async def _slow_call(*args, **kwargs):
+        pending_work.append(asyncio.current_task())
+        await asyncio.sleep(10)
+
+    with patch.object(DeviceSecurity, "get_device_info", side_effect=_slow_call):
+        with patch.object(UserRepository, "get_user", side_effect=_slow_call):
+            await update_user_data(headers=stub_legacy_headers, body=stub_body)
+
+    mocked_service.assert_not_called()
+    assert len(pending_work) == 2
+    assert all(task.cancelled() for task in pending_work)
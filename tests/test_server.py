@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock, patch
+
+from func import server
+from func.server import WorkerSupervisor
+from func.src.domain.enums.server import ServerWorkerMode
+
+
+def test_build_config():
+    conf = server._build_config("0.0.0.0:8888", 4)
+    assert conf.bind == ["0.0.0.0:8888"]
+    assert conf.workers == 4
+
+
+def test_get_worker_bind_prefork():
+    supervisor = WorkerSupervisor(app=None, bind="0.0.0.0:8888", workers=2)
+    supervisor.listener = MagicMock(**{"fileno.return_value": 7})
+    assert supervisor._get_worker_bind() == "fd://7"
+
+
+def test_get_worker_bind_reuse_port():
+    supervisor = WorkerSupervisor(
+        app=None, bind="0.0.0.0:8888", workers=2, mode=ServerWorkerMode.REUSE_PORT
+    )
+    assert supervisor._get_worker_bind() == "0.0.0.0:8888"
+
+
+@patch.object(server.time, "sleep")
+@patch.object(server.Gladsheim, "warning")
+@patch.object(WorkerSupervisor, "_start_worker")
+def test_restart_dead_workers(mocked_start, mocked_logger, mocked_sleep):
+    supervisor = WorkerSupervisor(
+        app=None, bind="0.0.0.0:8888", workers=2, restart_delay=0.5
+    )
+    alive_process = MagicMock(**{"is_alive.return_value": True})
+    dead_process = MagicMock(**{"is_alive.return_value": False})
+    supervisor.processes = [alive_process, dead_process]
+
+    supervisor._restart_dead_workers()
+
+    mocked_sleep.assert_called_once_with(0.5)
+    dead_process.close.assert_called_once_with()
+    mocked_start.assert_called_once_with(1)
+    alive_process.close.assert_not_called()
+
+
+@patch.object(server.time, "sleep")
+@patch.object(WorkerSupervisor, "_start_worker")
+def test_restart_dead_workers_without_dead_workers(mocked_start, mocked_sleep):
+    supervisor = WorkerSupervisor(app=None, bind="0.0.0.0:8888", workers=1)
+    supervisor.processes = [MagicMock(**{"is_alive.return_value": True})]
+    supervisor._restart_dead_workers()
+    mocked_sleep.assert_not_called()
+    mocked_start.assert_not_called()
+
+
+@patch.object(server.time, "sleep")
+@patch.object(WorkerSupervisor, "_start_worker")
+def test_restart_dead_workers_while_stopping(mocked_start, mocked_sleep):
+    supervisor = WorkerSupervisor(app=None, bind="0.0.0.0:8888", workers=1)
+    supervisor.processes = [MagicMock(**{"is_alive.return_value": False})]
+    supervisor.stopping = True
+    supervisor._restart_dead_workers()
+    mocked_start.assert_not_called()
+
+
+def test_stop_workers():
+    supervisor = WorkerSupervisor(app=None, bind="0.0.0.0:8888", workers=2)
+    stubborn_process = MagicMock(**{"is_alive.side_effect": [True, True]})
+    dead_process = MagicMock(**{"is_alive.return_value": False})
+    supervisor.processes = [stubborn_process, dead_process]
+
+    supervisor._stop_workers(timeout=0)
+
+    stubborn_process.terminate.assert_called_once_with()
+    stubborn_process.kill.assert_called_once_with()
+    dead_process.terminate.assert_not_called()
+
+
+@patch.object(server, "WorkerSupervisor")
+@patch.object(server, "run_worker")
+@patch.object(server, "_load_app")
+@patch.object(server, "config", side_effect=lambda name, default, cast=None: default)
+def test_main_single_worker(
+    mocked_config, mocked_load_app, mocked_run_worker, mocked_supervisor
+):
+    server.main()
+    mocked_run_worker.assert_called_once_with(
+        mocked_load_app.return_value, "0.0.0.0:8888"
+    )
+    mocked_supervisor.assert_not_called()
+
+
+@patch.object(server.Gladsheim, "warning")
+@patch.object(server.Gladsheim, "info")
+@patch.object(server, "config")
+def test_load_app_over_budget(mocked_config, mocked_info, mocked_warning):
+    settings = {"STARTUP_PROFILE_ENABLED": False, "IMPORT_TIME_BUDGET_MS": -1}
+    mocked_config.side_effect = lambda name, default, cast=None: settings[name]
+    from func.asgi import app
+
+    assert server._load_app() is app
+    mocked_warning.assert_called_once()
+    mocked_info.assert_not_called()